@@ -5,4 +5,13 @@
 # .users ve .auth, bu paketin içindeki users.py ve auth.py dosyalarını ifade eder.
 
 # from .auth import auth_bp
-# Yeni Blueprint'ler (örneğin products_bp) buraya eklenecektir.
\ No newline at end of file
+# Yeni Blueprint'ler (örneğin products_bp) buraya eklenecektir.
+
+# BLUEPRINT_REGISTRY=static iken kaydedilen Blueprint'ler ("modül:nesne").
+# scan modunda buraya eklenmemiş bir Blueprint bulunursa uyarı verilir.
+BLUEPRINTS = (
+    "backend.api.admin:admin_bp",
+    "backend.api.auth:auth_bp",
+    "backend.api.events:events_bp",
+    "backend.api.organizations:organization_bp",
+)
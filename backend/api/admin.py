@@ -13,7 +13,22 @@ from flask import Blueprint, jsonify, request, current_app
 from sqlalchemy import text
 from backend.utils.auth_utils import require_admin, AuthError
 from backend.utils.pagination import paginate_query, get_pagination_params
-from backend.utils.scheduler import manual_trigger_update, get_scheduler_status
+from backend.utils.scheduler import manual_trigger_update, get_scheduler_status, get_scheduler_leadership
+from backend.utils.session_service import revoke_user_sessions
+from backend.utils.admin_counters import get_admin_counters
+from backend.utils.cache import TAG_ADMIN, TAG_EVENTS, TAG_ORGANIZATIONS, cache, invalidate_tags
+from backend.utils.rollups import (
+    get_daily_series,
+    get_monthly_series,
+    get_last_month_series,
+    record_event_removed,
+    rebuild_rollups
+)
+from backend.utils.user_activity import fetch_leaderboard, rebuild_user_activity, record_event_attendance_removed
+from backend.utils.export import get_export_format, streaming_export
+from backend.utils.event_status import effective_status, status_filter as event_status_filter
+from backend.utils.query_stats import ORDER_KEYS, get_flusher, merge_exports, summarize
+from backend.utils.compression import get_compression_cache
 from datetime import datetime, timedelta
 
 admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
@@ -28,28 +43,20 @@ admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
 def get_overview_summary():
     """
     Returns only the scalar counts for the dashboard cards.
-    Loads very fast.
+    Served from the shared admin counters cache (single aggregation pass, short TTL).
     """
     try:
-        with current_app.engine.connect() as conn:
-            # Sadece tekil sayılar (COUNT)
-            total_events = conn.execute(text("SELECT COUNT(*) FROM events")).scalar()
-            total_users = conn.execute(text("SELECT COUNT(*) FROM users")).scalar()
-            active_clubs = conn.execute(text("SELECT COUNT(*) FROM organizations WHERE status='ACTIVE'")).scalar()
-            active_events = conn.execute(text("SELECT COUNT(*) FROM events WHERE status='FUTURE'")).scalar()
-            total_attendance = conn.execute(text("SELECT COUNT(*) FROM participants WHERE status='ATTENDED'")).scalar()
-            pending_reports = conn.execute(text("SELECT COUNT(*) FROM reports WHERE status='PENDING'")).scalar()
-            unreviewed_reports = conn.execute(text("SELECT COUNT(*) FROM reports WHERE is_reviewed = FALSE")).scalar()
+        counters = get_admin_counters(current_app)
 
-            return jsonify({
-                "total_events": total_events,
-                "total_users": total_users,
-                "active_clubs": active_clubs,
-                "active_events": active_events,
-                "total_attendance": total_attendance,
-                "pending_reports": pending_reports,
-                "unreviewed_reports": unreviewed_reports,
-            })
+        return jsonify({
+            "total_events": counters["total_events"],
+            "total_users": counters["total_users"],
+            "active_clubs": counters["active_clubs"],
+            "active_events": counters["active_events"],
+            "total_attendance": counters["total_attendance"],
+            "pending_reports": counters["pending_reports"],
+            "unreviewed_reports": counters["unreviewed_reports"],
+        })
     except Exception as e:
         return {"error": str(e)}, 503
 
@@ -59,61 +66,25 @@ def get_overview_summary():
 def get_overview_charts():
     """
     Returns data for charts (Weekly, Monthly, 6-Months).
-    May take longer to load.
+    Reads pre-aggregated rows from daily_event_stats; missing days/months are zero-filled.
+    Optional filters: ?university_id=1&type_id=2
     """
     try:
+        university_id = request.args.get("university_id", type=int)
+        type_id = request.args.get("type_id", type=int)
+        dims = {"university_id": university_id, "type_id": type_id}
+
         with current_app.engine.connect() as conn:
-            # --- CHARTS: EVENTS ---
-            events_1w = conn.execute(text("""
-                SELECT DATE_FORMAT(created_at, '%Y-%m-%d') as date, COUNT(*) as count
-                FROM events WHERE created_at >= DATE_SUB(NOW(), INTERVAL 7 DAY)
-                GROUP BY date ORDER BY date ASC
-            """)).fetchall()
-
-            events_1m = conn.execute(text("""
-                SELECT DATE_FORMAT(created_at, '%Y-%m-%d') as date, COUNT(*) as count
-                FROM events WHERE created_at >= DATE_SUB(NOW(), INTERVAL 1 MONTH)
-                GROUP BY date ORDER BY date ASC
-            """)).fetchall()
-
-            events_6m = conn.execute(text("""
-                SELECT DATE_FORMAT(created_at, '%Y-%m') as date, COUNT(*) as count
-                FROM events WHERE created_at >= DATE_SUB(NOW(), INTERVAL 6 MONTH)
-                GROUP BY date ORDER BY date ASC
-            """)).fetchall()
-            
-            # --- CHARTS: ATTENDANCE ---
-            attendance_1w = conn.execute(text("""
-                SELECT DATE_FORMAT(e.starts_at, '%Y-%m-%d') as date, COUNT(p.id) as count
-                FROM participants p JOIN events e ON p.event_id = e.id
-                WHERE e.starts_at >= DATE_SUB(NOW(), INTERVAL 7 DAY) AND p.status = 'ATTENDED'
-                GROUP BY date ORDER BY date ASC
-            """)).fetchall()
-
-            attendance_1m = conn.execute(text("""
-                SELECT DATE_FORMAT(e.starts_at, '%Y-%m-%d') as date, COUNT(p.id) as count
-                FROM participants p JOIN events e ON p.event_id = e.id
-                WHERE e.starts_at >= DATE_SUB(NOW(), INTERVAL 1 MONTH) AND p.status = 'ATTENDED'
-                GROUP BY date ORDER BY date ASC
-            """)).fetchall()
-
-            attendance_6m = conn.execute(text("""
-                SELECT DATE_FORMAT(e.starts_at, '%Y-%m') as date, COUNT(p.id) as count
-                FROM participants p JOIN events e ON p.event_id = e.id
-                WHERE e.starts_at >= DATE_SUB(NOW(), INTERVAL 6 MONTH) AND p.status = 'ATTENDED'
-                GROUP BY date ORDER BY date ASC
-            """)).fetchall()
-            
             return jsonify({
                 "events": {
-                    "last_week": [{"date": r.date, "count": r.count} for r in events_1w],
-                    "last_month": [{"date": r.date, "count": r.count} for r in events_1m],
-                    "last_6_months": [{"date": r.date, "count": r.count} for r in events_6m]
+                    "last_week": get_daily_series(conn, "events_created", 7, **dims),
+                    "last_month": get_last_month_series(conn, "events_created", **dims),
+                    "last_6_months": get_monthly_series(conn, "events_created", 6, **dims)
                 },
                 "attendance": {
-                    "last_week": [{"date": r.date, "count": r.count} for r in attendance_1w],
-                    "last_month": [{"date": r.date, "count": r.count} for r in attendance_1m],
-                    "last_6_months": [{"date": r.date, "count": r.count} for r in attendance_6m]
+                    "last_week": get_daily_series(conn, "attendance", 7, **dims),
+                    "last_month": get_last_month_series(conn, "attendance", **dims),
+                    "last_6_months": get_monthly_series(conn, "attendance", 6, **dims)
                 }
             })
     
@@ -145,8 +116,9 @@ def get_all_events():
         params = {}
 
         if status_filter:
-            where_parts.append("e.status = :status")
-            params["status"] = status_filter.upper()
+            status_sql, status_params = event_status_filter(status_filter)
+            where_parts.append(status_sql)
+            params.update(status_params)
 
         if search:
             where_parts.append("""
@@ -171,7 +143,7 @@ def get_all_events():
                     e.explanation,
                     e.owner_type,
                     e.starts_at AS date,
-                    e.status,
+                    {effective_status('e')} AS status,
                     e.user_limit AS capacity,
                     e.created_at,
                     COALESCE(o.name, u.username) AS owner_name,
@@ -327,12 +299,15 @@ def delete_event(event_id):
             if not event:
                 return {"error": "Event not found"}, 404
             
-            # Delete event (cascade will handle related records)
+            # Rollup ve leaderboard sayaçlarını geri al, sonra sil (cascade will handle related records)
+            record_event_removed(conn, event_id)
+            record_event_attendance_removed(conn, event_id)
             conn.execute(
                 text("DELETE FROM events WHERE id = :id"),
                 {"id": event_id}
             )
             conn.commit()
+            invalidate_tags(TAG_ADMIN, TAG_EVENTS)
         
         return {"message": "Event deleted successfully"}, 200
     
@@ -526,10 +501,13 @@ def block_user(user_id):
                 text("UPDATE users SET is_blocked = :is_blocked WHERE id = :id"),
                 {"is_blocked": is_blocked, "id": user_id}
             )
+
+            # Bloklanan kullanıcının tüm refresh token'ları tek sorguda iptal edilir
+            revoked_sessions = revoke_user_sessions(conn, user_id) if is_blocked else 0
             conn.commit()
         
         action = "blocked" if is_blocked else "unblocked"
-        return {"message": f"User {action} successfully"}, 200
+        return {"message": f"User {action} successfully", "revoked_sessions": revoked_sessions}, 200
     
     except Exception as e:
         return {"error": str(e)}, 503
@@ -562,6 +540,7 @@ def delete_user(user_id):
                 {"id": user_id}
             )
             conn.commit()
+            invalidate_tags(TAG_ADMIN, TAG_EVENTS, TAG_ORGANIZATIONS)
         
         return {"message": "User deleted successfully"}, 200
     
@@ -574,35 +553,14 @@ def delete_user(user_id):
 def get_most_active_users():
     """
     Get most active users (by event attendance).
-    Query params: ?limit=10
+    Query params: ?limit=10&university_id=1
     """
     try:
         limit = request.args.get("limit", 10, type=int)
+        university_id = request.args.get("university_id", type=int)
         
         with current_app.engine.connect() as conn:
-            users = conn.execute(text("""
-                SELECT 
-                    u.id,
-                    u.name,
-                    u.username,
-                    COUNT(p.id) as events_attended,
-                    MAX(e.starts_at) as last_event_date,
-                    (
-                        SELECT e2.title 
-                        FROM participants p2
-                        JOIN events e2 ON p2.event_id = e2.id
-                        WHERE p2.user_id = u.id
-                        ORDER BY e2.starts_at DESC
-                        LIMIT 1
-                    ) as last_event_title
-                FROM users u
-                LEFT JOIN participants p ON u.id = p.user_id AND p.status = 'ATTENDED'
-                LEFT JOIN events e ON p.event_id = e.id
-                GROUP BY u.id, u.name, u.username
-                HAVING events_attended > 0
-                ORDER BY events_attended DESC
-                LIMIT :limit
-            """), {"limit": limit}).fetchall()
+            users = fetch_leaderboard(conn, limit, university_id)
             
             return jsonify({
                 "data": [
@@ -613,7 +571,7 @@ def get_most_active_users():
                         "events_attended": user.events_attended,
                         "last_event": {
                             "title": user.last_event_title,
-                            "date": user.last_event_date.strftime('%Y-%m-%d') if user.last_event_date else None
+                            "date": user.last_event_at.strftime('%Y-%m-%d') if user.last_event_at else None
                         } if user.last_event_title else None
                     }
                     for user in users
@@ -809,27 +767,14 @@ def get_clubs_stats():
     Get overall clubs statistics.
     """
     try:
-        with current_app.engine.connect() as conn:
-            # Total clubs
-            total_clubs = conn.execute(
-                text("SELECT COUNT(*) FROM organizations")
-            ).scalar()
-            
-            # Total members (may have duplicates across clubs)
-            total_members = conn.execute(
-                text("SELECT COUNT(*) FROM organization_members")
-            ).scalar()
-            
-            # Total events by clubs
-            total_events = conn.execute(
-                text("SELECT COUNT(*) FROM events WHERE owner_type = 'ORGANIZATION'")
-            ).scalar()
-            
-            return jsonify({
-                "total_clubs": total_clubs,
-                "total_members": total_members,
-                "total_events": total_events
-            })
+        counters = get_admin_counters(current_app)
+
+        return jsonify({
+            "total_clubs": counters["total_clubs"],
+            # may have duplicates across clubs
+            "total_members": counters["total_members"],
+            "total_events": counters["organization_events"]
+        })
     
     except Exception as e:
         return {"error": str(e)}, 503
@@ -865,6 +810,7 @@ def update_club_status(club_id):
                 {"status": new_status, "id": club_id}
             )
             conn.commit()
+            invalidate_tags(TAG_ADMIN, TAG_ORGANIZATIONS)
         
         return {"message": f"Club status updated to {new_status}"}, 200
     
@@ -899,6 +845,7 @@ def delete_club(club_id):
                 {"id": club_id}
             )
             conn.commit()
+            invalidate_tags(TAG_ADMIN, TAG_ORGANIZATIONS, TAG_EVENTS)
         
         return {"message": "Club deleted successfully"}, 200
     
@@ -915,49 +862,18 @@ def get_attendance_stats():
     Get attendance statistics including weekly scans chart.
     """
     try:
+        # Total scans, unique attendees, average per event: admin counters cache
+        counters = get_admin_counters(current_app)
+
         with current_app.engine.connect() as conn:
-            # Total QR scans (all ATTENDED)
-            total_scans = conn.execute(
-                text("SELECT COUNT(*) FROM participants WHERE status='ATTENDED'")
-            ).scalar()
-            
-            # Unique attendees
-            unique_attendees = conn.execute(
-                text("SELECT COUNT(DISTINCT user_id) FROM participants WHERE status='ATTENDED'")
-            ).scalar()
-            
-            # Average attendance per event
-            avg_attendance = conn.execute(text("""
-                SELECT AVG(attendance_count) as avg_attendance
-                FROM (
-                    SELECT event_id, COUNT(*) as attendance_count
-                    FROM participants
-                    WHERE status = 'ATTENDED'
-                    GROUP BY event_id
-                ) as event_attendance
-            """)).fetchone()
-            
-            # Weekly scans (last 7 days)
-            weekly_scans = conn.execute(text("""
-                SELECT 
-                    DATE(e.starts_at) as date,
-                    COUNT(p.id) as count
-                FROM participants p
-                JOIN events e ON p.event_id = e.id
-                WHERE e.starts_at >= DATE_SUB(NOW(), INTERVAL 7 DAY)
-                    AND p.status = 'ATTENDED'
-                GROUP BY DATE(e.starts_at)
-                ORDER BY date ASC
-            """)).fetchall()
+            # Weekly scans (last 7 days, rollup tablosundan)
+            weekly_scans = get_daily_series(conn, "attendance", 7)
             
             return jsonify({
-                "total_scans": total_scans,
-                "unique_attendees": unique_attendees,
-                "average_attendance": float(avg_attendance.avg_attendance) if avg_attendance.avg_attendance else 0,
-                "weekly_scans": [
-                    {"date": row.date.strftime('%Y-%m-%d'), "count": row.count}
-                    for row in weekly_scans
-                ]
+                "total_scans": counters["total_attendance"],
+                "unique_attendees": counters["unique_attendees"],
+                "average_attendance": float(counters["average_attendance"]),
+                "weekly_scans": weekly_scans
             })
     
     except Exception as e:
@@ -970,43 +886,35 @@ def get_top_attendance_events():
     """
     Get events with highest attendance rates.
     Query params: ?limit=10
+    Ranked from the cached attendance snapshot (see utils/attendance_analytics.py).
     """
     try:
+        # numpy'li analitik modülleri ilk kullanımda yüklenir (cold start)
+        from backend.utils import attendance_analytics
+
         limit = request.args.get("limit", 10, type=int)
         
-        with current_app.engine.connect() as conn:
-            events = conn.execute(text("""
-                SELECT 
-                    e.id as event_id,
-                    e.title as event_name,
-                    e.user_limit as capacity,
-                    COUNT(p.id) as attendance,
-                    CASE 
-                        WHEN e.user_limit IS NOT NULL AND e.user_limit > 0 
-                        THEN (COUNT(p.id) * 100.0 / e.user_limit)
-                        ELSE 100.0
-                    END as percentage
-                FROM events e
-                LEFT JOIN participants p ON e.id = p.event_id AND p.status = 'ATTENDED'
-                WHERE e.status = 'COMPLETED'
-                GROUP BY e.id, e.title, e.user_limit
-                HAVING attendance > 0
-                ORDER BY percentage DESC, attendance DESC
-                LIMIT :limit
-            """), {"limit": limit}).fetchall()
-            
-            return jsonify({
-                "data": [
-                    {
-                        "event_id": event.event_id,
-                        "event_name": event.event_name,
-                        "attendance": event.attendance,
-                        "capacity": event.capacity,
-                        "percentage": round(float(event.percentage), 2)
-                    }
-                    for event in events
-                ]
-            })
+        return jsonify({
+            "data": attendance_analytics.get_top_attendance_events(current_app, limit)
+        })
+    
+    except Exception as e:
+        return {"error": str(e)}, 503
+
+
+@admin_bp.get("/attendance/analytics")
+@require_admin
+def get_attendance_analytics_endpoint():
+    """
+    Fill-rate distribution and percentiles, no-show rates per
+    type/university/organization and weekday/hour attendance heatmap.
+    Query params: ?refresh=true (reload the snapshot)
+    """
+    try:
+        from backend.utils.attendance_analytics import get_attendance_analytics
+
+        refresh = request.args.get("refresh", "false").lower() == "true"
+        return jsonify(get_attendance_analytics(current_app, force=refresh))
     
     except Exception as e:
         return {"error": str(e)}, 503
@@ -1022,71 +930,107 @@ def get_attendance_charts():
     - monthly: Last 1 month (Daily breakdown)
     - six_months: Last 6 months (Monthly breakdown)
     - yearly: Last 12 months (Monthly breakdown)
+    Reads from daily_event_stats rollups. Optional filters: ?university_id=1&type_id=2
     """
     try:
-        with current_app.engine.connect() as conn:
-            # 1. Haftalık (Son 7 Gün - Gün Bazlı)
-            weekly = conn.execute(text("""
-                SELECT 
-                    DATE_FORMAT(e.starts_at, '%Y-%m-%d') as date, 
-                    COUNT(p.id) as count
-                FROM participants p
-                JOIN events e ON p.event_id = e.id
-                WHERE e.starts_at >= DATE_SUB(NOW(), INTERVAL 7 DAY)
-                  AND p.status = 'ATTENDED'
-                GROUP BY date 
-                ORDER BY date ASC
-            """)).fetchall()
-
-            # 2. Aylık (Son 1 Ay - Gün Bazlı)
-            monthly = conn.execute(text("""
-                SELECT 
-                    DATE_FORMAT(e.starts_at, '%Y-%m-%d') as date, 
-                    COUNT(p.id) as count
-                FROM participants p
-                JOIN events e ON p.event_id = e.id
-                WHERE e.starts_at >= DATE_SUB(NOW(), INTERVAL 1 MONTH)
-                  AND p.status = 'ATTENDED'
-                GROUP BY date 
-                ORDER BY date ASC
-            """)).fetchall()
-
-            # 3. 6 Aylık (Son 6 Ay - Ay Bazlı)
-            six_months = conn.execute(text("""
-                SELECT 
-                    DATE_FORMAT(e.starts_at, '%Y-%m') as date, 
-                    COUNT(p.id) as count
-                FROM participants p
-                JOIN events e ON p.event_id = e.id
-                WHERE e.starts_at >= DATE_SUB(NOW(), INTERVAL 6 MONTH)
-                  AND p.status = 'ATTENDED'
-                GROUP BY date 
-                ORDER BY date ASC
-            """)).fetchall()
-
-            # 4. Yıllık (Son 12 Ay - Ay Bazlı)
-            yearly = conn.execute(text("""
-                SELECT 
-                    DATE_FORMAT(e.starts_at, '%Y-%m') as date, 
-                    COUNT(p.id) as count
-                FROM participants p
-                JOIN events e ON p.event_id = e.id
-                WHERE e.starts_at >= DATE_SUB(NOW(), INTERVAL 12 MONTH)
-                  AND p.status = 'ATTENDED'
-                GROUP BY date 
-                ORDER BY date ASC
-            """)).fetchall()
+        university_id = request.args.get("university_id", type=int)
+        type_id = request.args.get("type_id", type=int)
+        dims = {"university_id": university_id, "type_id": type_id}
 
+        with current_app.engine.connect() as conn:
             return jsonify({
-                "weekly": [{"date": row.date, "count": row.count} for row in weekly],
-                "monthly": [{"date": row.date, "count": row.count} for row in monthly],
-                "six_months": [{"date": row.date, "count": row.count} for row in six_months],
-                "yearly": [{"date": row.date, "count": row.count} for row in yearly]
+                "weekly": get_daily_series(conn, "attendance", 7, **dims),
+                "monthly": get_last_month_series(conn, "attendance", **dims),
+                "six_months": get_monthly_series(conn, "attendance", 6, **dims),
+                "yearly": get_monthly_series(conn, "attendance", 12, **dims)
             })
 
     except Exception as e:
         return {"error": str(e)}, 503
 
+
+@admin_bp.post("/rollups/rebuild")
+@require_admin
+def rebuild_daily_rollups():
+    """
+    Recomputes daily_event_stats for the last N days from the source tables.
+    Body: {"days": 365}  (default: 2)
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        days = data.get("days", 2)
+
+        if not isinstance(days, int) or days < 0:
+            return {"error": "days must be a non-negative integer"}, 400
+
+        result = rebuild_rollups(current_app.engine, days)
+
+        if result["success"]:
+            return jsonify(result), 200
+        return jsonify(result), 500
+
+    except Exception as e:
+        return {"error": str(e)}, 503
+
+
+@admin_bp.get("/analytics/store")
+@require_admin
+def get_analytics_store_status():
+    """
+    Columnar analytics store manifests (rows, watermark, last export) per table.
+    """
+    try:
+        from backend.utils.columnar_store import get_store_status
+
+        return jsonify({
+            "directory": current_app.config.get("ANALYTICS_EXPORT_DIR"),
+            "source": current_app.config.get("ANALYTICS_SOURCE", "auto"),
+            "tables": get_store_status(current_app.config["ANALYTICS_EXPORT_DIR"])
+        })
+
+    except Exception as e:
+        return {"error": str(e)}, 503
+
+
+@admin_bp.post("/analytics/export")
+@require_admin
+def trigger_analytics_export():
+    """
+    Runs the columnar export now.
+    Body: {"full": false}  (full=true ignores watermarks and rewrites all files)
+    """
+    try:
+        from backend.utils.columnar_store import export_all
+
+        data = request.get_json(silent=True) or {}
+        full = bool(data.get("full", False))
+
+        result = export_all(current_app.engine, current_app.config["ANALYTICS_EXPORT_DIR"], full=full)
+
+        if result["success"]:
+            return jsonify(result), 200
+        return jsonify(result), 500
+
+    except Exception as e:
+        return {"error": str(e)}, 503
+
+
+@admin_bp.post("/users/activity/rebuild")
+@require_admin
+def rebuild_users_activity():
+    """
+    Recomputes the user_activity leaderboard table from participants.
+    """
+    try:
+        result = rebuild_user_activity(current_app.engine)
+
+        if result["success"]:
+            return jsonify(result), 200
+        return jsonify(result), 500
+
+    except Exception as e:
+        return {"error": str(e)}, 503
+
 # =============================================
 # REPORTS MANAGEMENT
 # =============================================
@@ -1190,39 +1134,15 @@ def get_reports_stats():
     Returns: total, reviewed, unreviewed, and breakdown by type.
     """
     try:
-        with current_app.engine.connect() as conn:
-            # 1. Toplam Rapor Sayısı
-            total_reports = conn.execute(
-                text("SELECT COUNT(*) FROM reports")
-            ).scalar()
-            
-            # 2. İncelenmiş (Reviewed) Sayısı
-            reviewed_reports = conn.execute(
-                text("SELECT COUNT(*) FROM reports WHERE is_reviewed = TRUE")
-            ).scalar()
-            
-            # 3. İncelenmemiş (Unreviewed) Sayısı
-            unreviewed_reports = conn.execute(
-                text("SELECT COUNT(*) FROM reports WHERE is_reviewed = FALSE")
-            ).scalar()
-            
-            # 4. Event Reports
-            event_reports = conn.execute(
-                text("SELECT COUNT(*) FROM reports WHERE event_id IS NOT NULL")
-            ).scalar()
-            
-            # 5. Organization Reports
-            organization_reports = conn.execute(
-                text("SELECT COUNT(*) FROM reports WHERE organization_id IS NOT NULL")
-            ).scalar()
-            
-            return jsonify({
-                "total_reports": total_reports,
-                "reviewed_reports": reviewed_reports,
-                "unreviewed_reports": unreviewed_reports,
-                "event_reports": event_reports,
-                "organization_reports": organization_reports
-            })
+        counters = get_admin_counters(current_app)
+
+        return jsonify({
+            "total_reports": counters["total_reports"],
+            "reviewed_reports": counters["reviewed_reports"],
+            "unreviewed_reports": counters["unreviewed_reports"],
+            "event_reports": counters["event_reports"],
+            "organization_reports": counters["organization_reports"]
+        })
     
     except Exception as e:
         return {"error": str(e)}, 503
@@ -1265,6 +1185,7 @@ def update_report_status(report_id):
                 {"status": new_status, "notes": admin_notes, "id": report_id}
             )
             conn.commit()
+            invalidate_tags(TAG_ADMIN)
         
         return {"message": f"Report status updated to {new_status}"}, 200
     
@@ -1308,6 +1229,7 @@ def mark_report_reviewed(report_id):
                 {"is_reviewed": is_reviewed, "id": report_id}
             )
             conn.commit()
+            invalidate_tags(TAG_ADMIN)
         
         status_text = "reviewed" if is_reviewed else "unreviewed"
         return {"message": f"Report marked as {status_text}"}, 200
@@ -1376,6 +1298,7 @@ def review_event(event_id):
             )
 
             conn.commit()
+            invalidate_tags(TAG_ADMIN, TAG_EVENTS)
 
         return {
             "message": f"Event {decision.lower()} successfully",
@@ -1418,15 +1341,89 @@ def trigger_event_status_update():
         return {"error": str(e)}, 503
 
 
+@admin_bp.get("/db/pools")
+@require_admin
+def get_db_pool_metrics():
+    """
+    Per-workload connection pool metrics: checked-out connections,
+    checkout wait histogram and timeouts.
+    """
+    try:
+        return jsonify({
+            "pools": current_app.engine.pool_metrics(),
+            "database": current_app.engine.status(),
+            "timestamp": datetime.now().isoformat()
+        }), 200
+
+    except Exception as e:
+        return {"error": str(e)}, 503
+
+
+@admin_bp.get("/db/statements")
+@require_admin
+def get_statement_stats():
+    """
+    Tüm worker'larda toplanan sorgu fingerprint istatistikleri.
+
+    Query params:
+        limit: Döndürülecek fingerprint sayısı (varsayılan 20, en fazla 200)
+        order: total | mean | p95 | calls | rows (varsayılan total)
+    """
+    try:
+        flusher = get_flusher()
+        if flusher is None:
+            return {"error": "Query statistics are disabled (QUERY_STATS_ENABLED=false)"}, 404
+
+        limit = min(max(request.args.get("limit", 20, type=int), 1), 200)
+        order = request.args.get("order", "total")
+        if order not in ORDER_KEYS:
+            return {"error": f"order must be one of: {', '.join(ORDER_KEYS)}"}, 400
+
+        exports = flusher.load_all()
+        merged = merge_exports(exports)
+        return jsonify({
+            "statements": summarize(merged, limit=limit, order=order),
+            "fingerprints": len(merged),
+            "workers": len(exports),
+            "since": datetime.fromtimestamp(min(e["started_at"] for e in exports)).isoformat(),
+            "timestamp": datetime.now().isoformat()
+        }), 200
+
+    except Exception as e:
+        return {"error": str(e)}, 503
+
+
+@admin_bp.post("/db/statements/reset")
+@require_admin
+def reset_statement_stats():
+    """
+    Sorgu istatistiklerini sıfırlar (bu worker + diğer worker'ların dosyaları).
+    Diğer worker'lar RESET işaretini bir sonraki flush'ta görüp sıfırlanır.
+    """
+    try:
+        flusher = get_flusher()
+        if flusher is None:
+            return {"error": "Query statistics are disabled (QUERY_STATS_ENABLED=false)"}, 404
+
+        flusher.reset_all()
+        return {"message": "Query statistics reset"}, 200
+
+    except Exception as e:
+        return {"error": str(e)}, 503
+
+
 @admin_bp.get("/scheduler/status")
 @require_admin
 def get_scheduler_status_endpoint():
     """
-    Scheduler durumunu ve job bilgilerini döndürür.
+    Scheduler durumunu, job bilgilerini ve cluster genelindeki lideri döndürür.
     """
     try:
         scheduler = getattr(current_app, '_scheduler', None)
         status = get_scheduler_status(scheduler)
+        status["leader"] = get_scheduler_leadership(
+            current_app.engine, getattr(current_app, '_scheduler_leader', None)
+        )
         
         return jsonify({
             "scheduler": status,
@@ -1435,3 +1432,198 @@ def get_scheduler_status_endpoint():
         
     except Exception as e:
         return {"error": str(e)}, 503
+
+
+@admin_bp.get("/startup")
+@require_admin
+def get_startup_report():
+    """
+    Bu process'in başlangıç süreleri: faz ve blueprint modülü bazında,
+    başlangıçta yüklenen ağır bağımlılıklar ve warmup sonucu.
+    """
+    report = getattr(current_app, "startup_report", None)
+    if report is None:
+        return {"error": "Startup report not available"}, 404
+    return jsonify(report.as_dict()), 200
+
+
+@admin_bp.get("/compression")
+@require_admin
+def get_compression_status():
+    """
+    Sıkıştırılmış yanıt gövdesi cache'inin doluluk ve isabet sayıları (bu process).
+    """
+    compression_cache = get_compression_cache()
+    return jsonify({
+        "enabled": current_app.config.get("COMPRESSION_ENABLED", True),
+        "min_size": current_app.config.get("COMPRESSION_MIN_SIZE"),
+        "cache": compression_cache.status() if compression_cache else None
+    }), 200
+
+
+@admin_bp.get("/cache")
+@require_admin
+def get_cache_status():
+    """
+    Ortak cache'in backend'i, doluluğu ve isabet / yükleme sayıları (bu process).
+    """
+    return jsonify(cache.status()), 200
+
+
+# =============================================
+# EXPORTS
+# =============================================
+
+@admin_bp.get("/export/users")
+@require_admin
+def export_users():
+    """
+    Streams all users as CSV or NDJSON.
+    Query params: ?format=csv|ndjson&is_blocked=false&compress=true
+    """
+    try:
+        fmt = get_export_format()
+        if not fmt:
+            return {"error": "format must be csv or ndjson"}, 400
+
+        where_clause = ""
+        params = {}
+
+        is_blocked = request.args.get("is_blocked")
+        if is_blocked is not None:
+            where_clause = "WHERE u.is_blocked = :is_blocked"
+            params["is_blocked"] = is_blocked.lower() == 'true'
+
+        query = f"""
+            SELECT
+                u.id,
+                u.name,
+                u.username,
+                u.email,
+                u.role,
+                u.gender,
+                u.is_blocked,
+                un.name AS university,
+                COALESCE(a.attended_count, 0) AS events_attended,
+                u.created_at
+            FROM users u
+            LEFT JOIN universities un ON un.id = u.university_id
+            LEFT JOIN user_activity a ON a.user_id = u.id
+            {where_clause}
+            ORDER BY u.id
+        """
+
+        return streaming_export(current_app.engine, query, params, fmt, "users")
+
+    except Exception as e:
+        return {"error": str(e)}, 503
+
+
+@admin_bp.get("/export/events")
+@require_admin
+def export_events():
+    """
+    Streams all events as CSV or NDJSON.
+    Query params: ?format=csv|ndjson&status=FUTURE&compress=true
+    """
+    try:
+        fmt = get_export_format()
+        if not fmt:
+            return {"error": "format must be csv or ndjson"}, 400
+
+        where_clause = ""
+        params = {}
+
+        status_filter = request.args.get("status")
+        if status_filter:
+            status_sql, status_params = event_status_filter(status_filter)
+            where_clause = f"WHERE {status_sql}"
+            params.update(status_params)
+
+        query = f"""
+            SELECT
+                e.id,
+                e.title,
+                {effective_status('e')} AS status,
+                e.owner_type,
+                u.username AS owner_username,
+                o.name AS organization_name,
+                et.code AS type,
+                e.price,
+                e.starts_at,
+                e.ends_at,
+                e.location_name,
+                e.user_limit,
+                e.created_at
+            FROM events e
+            JOIN users u ON u.id = e.owner_user_id
+            LEFT JOIN organizations o ON o.id = e.owner_organization_id
+            LEFT JOIN event_types et ON et.id = e.type_id
+            {where_clause}
+            ORDER BY e.id
+        """
+
+        return streaming_export(current_app.engine, query, params, fmt, "events")
+
+    except Exception as e:
+        return {"error": str(e)}, 503
+
+
+@admin_bp.get("/export/reports")
+@require_admin
+def export_reports():
+    """
+    Streams reports as CSV or NDJSON.
+    Query params: ?format=csv|ndjson&status=REVIEWED|UNREVIEWED&type=EVENT|ORGANIZATION
+    """
+    try:
+        fmt = get_export_format()
+        if not fmt:
+            return {"error": "format must be csv or ndjson"}, 400
+
+        status_filter = request.args.get("status", "").upper()
+        type_filter = request.args.get("type", "").upper()
+
+        where_clauses = []
+        if status_filter == "REVIEWED":
+            where_clauses.append("r.is_reviewed = TRUE")
+        elif status_filter == "UNREVIEWED":
+            where_clauses.append("r.is_reviewed = FALSE")
+
+        if type_filter == "EVENT":
+            where_clauses.append("r.event_id IS NOT NULL")
+        elif type_filter == "ORGANIZATION":
+            where_clauses.append("r.organization_id IS NOT NULL")
+
+        where_clause = ""
+        if where_clauses:
+            where_clause = "WHERE " + " AND ".join(where_clauses)
+
+        query = f"""
+            SELECT
+                r.id,
+                CASE
+                    WHEN r.event_id IS NOT NULL THEN 'EVENT'
+                    WHEN r.organization_id IS NOT NULL THEN 'ORGANIZATION'
+                END AS report_type,
+                r.event_id,
+                r.organization_id,
+                COALESCE(e.title, org.name) AS target_name,
+                reporter.username AS reporter_username,
+                r.reason,
+                r.status,
+                r.is_reviewed,
+                r.admin_notes,
+                r.created_at
+            FROM reports r
+            JOIN users reporter ON reporter.id = r.reporter_user_id
+            LEFT JOIN events e ON e.id = r.event_id
+            LEFT JOIN organizations org ON org.id = r.organization_id
+            {where_clause}
+            ORDER BY r.id
+        """
+
+        return streaming_export(current_app.engine, query, {}, fmt, "reports")
+
+    except Exception as e:
+        return {"error": str(e)}, 503
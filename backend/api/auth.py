@@ -1,10 +1,12 @@
 from flask import Blueprint, jsonify, request, current_app, redirect
-import jwt
 import secrets
 from werkzeug.security import generate_password_hash, check_password_hash
 from sqlalchemy import text
 from datetime import datetime, timedelta
 from backend.utils.mail_service import generate_verification_token, verify_token, send_verification_email, send_password_reset_email
+from backend.utils.session_service import create_session, rotate_session, revoke_session, revoke_user_sessions
+from backend.utils.auth_utils import AuthError
+from backend.utils.db import use_primary
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
 
@@ -123,6 +125,7 @@ def register():
 
 
 @auth_bp.get("/register/verify/<token>")
+@use_primary
 def verify_email(token):
     engine = current_app.engine
     
@@ -266,6 +269,8 @@ def reset_password_action():
                     "uid": user.id
                 }
             )
+            # Şifre değişince tüm açık oturumlar kapatılır
+            revoke_user_sessions(conn, user.id)
             conn.commit()
 
             return {"message": "Password has been reset successfully."}, 200
@@ -277,7 +282,6 @@ def reset_password_action():
 @auth_bp.post("/login")
 def login():
     engine = current_app.engine
-    SECRET_KEY = current_app.config['SECRET_KEY']
     
     data = request.get_json()
     email = data.get("email", "").strip()
@@ -305,18 +309,57 @@ def login():
             stored_password_hash = user["password_hash"]
             if not check_password_hash(stored_password_hash, password):
                 return {"error": "Incorrect password."}, 401
-            payload = {
-                "userId": user["id"],
-                "exp": datetime.utcnow() + timedelta(hours=2)
-            }
-            token = jwt.encode(payload, SECRET_KEY, algorithm="HS256")
-            response = {"access_token": token}
+
+            # Access token + rotating refresh token
+            response = create_session(conn, user["id"], request.headers.get("User-Agent"))
+            conn.commit()
 
             return response
     except Exception as e:
         return {"error": f"Login failed: {str(e)}"}, 503
 
 
+@auth_bp.post("/refresh")
+def refresh_token():
+    """
+    Exchanges a refresh token for a new access/refresh token pair.
+    Body: {"refresh_token": "..."}
+    The old refresh token becomes invalid; reusing it revokes the whole session family.
+    """
+    data = request.get_json(silent=True) or {}
+
+    try:
+        return rotate_session(
+            current_app.engine,
+            data.get("refresh_token"),
+            request.headers.get("User-Agent")
+        )
+    except AuthError as e:
+        return {"error": e.args[0]}, e.code
+    except Exception as e:
+        return {"error": f"Token refresh failed: {str(e)}"}, 503
+
+
+@auth_bp.post("/logout")
+def logout():
+    """
+    Revokes the session family of the given refresh token.
+    Body: {"refresh_token": "..."}
+    """
+    data = request.get_json(silent=True) or {}
+    token = data.get("refresh_token")
+
+    if not token:
+        return {"error": "Refresh token is required"}, 400
+
+    try:
+        with current_app.engine.begin() as conn:
+            revoke_session(conn, token)
+        return {"message": "Logged out successfully"}, 200
+    except Exception as e:
+        return {"error": str(e)}, 503
+
+
 @auth_bp.get("/me")
 def get_current_user():
     """
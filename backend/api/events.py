@@ -4,8 +4,28 @@
 from flask import Blueprint, request, jsonify, current_app
 from sqlalchemy import text
 from backend.utils.auth_utils import verify_jwt, check_event_ownership, check_organization_permission, AuthError
-from backend.utils.pagination import paginate_query
+from backend.utils.pagination import get_pagination_params, paginate_query
 from backend.utils.event_moderation import review_event_content
+from backend.utils.rollups import (
+    event_dimensions,
+    record_event_created,
+    record_registration,
+    record_attendance,
+    record_participant_removed,
+    record_event_removed,
+    record_event_moved
+)
+from backend.utils.user_activity import (
+    record_event_attendance_removed, record_user_attendance, record_user_attendance_removed
+)
+from backend.utils.export import get_export_format, streaming_export
+from backend.utils.event_status import effective_status, has_ended, is_upcoming, status_filter
+from backend.utils.fieldsets import Field, FieldError, FieldSet
+from backend.utils.cache import TAG_EVENTS, cache, invalidate_tags
+from backend.utils.db import recently_wrote
+from backend.utils.response_formats import FormatError, negotiate_format, page_response
+from collections import OrderedDict
+from urllib.parse import urlencode
 from datetime import datetime
 import uuid
 import json
@@ -14,6 +34,85 @@ import json
 events_bp = Blueprint('events', __name__, url_prefix='/events')
 
 
+# Liste endpoint'lerinin ?fields= ile seçilebilen alanları (bkz. utils/fieldsets.py)
+EVENT_JOINS = OrderedDict([
+    ("et", ("LEFT JOIN event_types et ON e.type_id = et.id", ())),
+    ("u", ("LEFT JOIN users u ON e.owner_user_id = u.id", ())),
+    ("o", ("LEFT JOIN organizations o ON e.owner_organization_id = o.id", ())),
+    ("un", ("LEFT JOIN universities un ON u.university_id = un.id", ("u",))),
+])
+
+_EVENT_LIST_COLUMNS = [
+    ("id", Field("e.id")),
+    ("title", Field("e.title")),
+    ("summary", Field("e.summary")),
+    ("explanation", Field("e.explanation")),
+    ("price", Field("e.price")),
+    ("starts_at", Field("e.starts_at")),
+    ("ends_at", Field("e.ends_at")),
+    ("location_name", Field("e.location_name")),
+    ("user_limit", Field("e.user_limit")),
+    ("latitude", Field("e.latitude")),
+    ("longitude", Field("e.longitude")),
+    ("created_at", Field("e.created_at")),
+    ("updated_at", Field("e.updated_at")),
+    ("only_girls", Field("e.only_girls")),
+    ("owner_type", Field("e.owner_type")),
+    ("owner_username", Field("u.username", ("u",))),
+    ("owner_organization_name", Field("o.name", ("o",))),
+    ("event_type", Field("et.code", ("et",))),
+    ("university_name", Field("un.name", ("un",))),
+    ("participant_count", Field("(SELECT COUNT(*) FROM participants p WHERE p.event_id = e.id)")),
+]
+
+# Listelerde tam explanation yerine kısa summary döner (?fields=explanation ile istenebilir)
+EVENT_LIST_FIELDS = FieldSet(
+    _EVENT_LIST_COLUMNS + [("status", Field("e.status"))],
+    EVENT_JOINS,
+    default=(
+        "id", "title", "summary", "price", "starts_at", "ends_at", "location_name", "status",
+        "user_limit", "latitude", "longitude", "created_at", "updated_at", "only_girls",
+        "owner_type", "owner_username", "owner_organization_name", "event_type", "participant_count"
+    )
+)
+
+EVENT_FILTER_FIELDS = FieldSet(
+    _EVENT_LIST_COLUMNS + [("status", Field(effective_status('e')))],
+    EVENT_JOINS,
+    default=(
+        "id", "title", "summary", "starts_at", "ends_at", "location_name", "price", "status",
+        "latitude", "longitude", "created_at", "owner_type", "owner_username",
+        "owner_organization_name", "event_type", "university_name", "participant_count"
+    )
+)
+
+# /events/filter sonuç cache'i: sorguyu etkileyen parametreler ve (değeri
+# önemsiz, varlığı filtre olan) bayraklar
+FILTER_CACHE_PARAMS = ("type", "from", "to", "q", "university", "organization", "status")
+FILTER_CACHE_PRICES = ("min_price", "max_price")
+FILTER_CACHE_FLAGS = ("past_events", "only_girls")
+FILTER_CACHE_TAGS = (TAG_EVENTS,)
+
+
+def filter_cache_key(args, pagination_params, fields):
+    """
+    Cache key for a search_events() call. Parameter order, unrelated
+    parameters (e.g. cache busters), empty values, flag spellings
+    (only_girls=1 / true) and price spellings (10 / 10.0) share one entry.
+
+    Raises:
+        ValueError: If a price filter is not a number
+    """
+    parts = [(name, args.get(name)) for name in FILTER_CACHE_PARAMS if args.get(name)]
+    parts += [(name, repr(float(args.get(name)))) for name in FILTER_CACHE_PRICES if args.get(name)]
+    parts += [(name, "1") for name in FILTER_CACHE_FLAGS if args.get(name)]
+    parts += [("page", pagination_params["page"]), ("per_page", pagination_params["per_page"])]
+    # Alan sırası sadece columnar çıktıyı etkiler, o da render sırasında uygulanır
+    parts.append(("fields", ",".join(sorted(fields))))
+    # urlencode değerlerdeki &/= karakterlerini kaçışlar: farklı filtreler aynı anahtara düşmez
+    return "events:filter:" + urlencode(sorted(parts))
+
+
 def get_user_gender(conn, user_id):
     g = conn.execute(
         text("SELECT gender FROM users WHERE id = :uid"),
@@ -29,10 +128,10 @@ def register_for_event(event_id):
 
         with current_app.engine.begin() as conn:
             event = conn.execute(
-                text("""
-                    SELECT id, status, user_limit, has_register, only_girls
-                    FROM events
-                    WHERE id = :eid
+                text(f"""
+                    SELECT e.id, {effective_status('e')} AS status, e.user_limit, e.has_register, e.only_girls
+                    FROM events e
+                    WHERE e.id = :eid
                 """),
                 {"eid": event_id}
             ).fetchone()
@@ -81,7 +180,10 @@ def register_for_event(event_id):
                 """),
                 {"eid": event_id, "uid": user_id, "ticket": ticket_code}
             )
+            record_registration(conn, event_id)
 
+        # Cache'teki listeler participant_count taşır
+        invalidate_tags(TAG_EVENTS)
         return {"message": "Registration successful", "ticket_code": ticket_code}, 201
 
     except AuthError as e:
@@ -106,7 +208,7 @@ def apply_to_event(event_id):
             
             # Güncellenen kısım: Etkinliğin durumunu (status) kontrol et
             event = conn.execute(
-                text("SELECT id, status, only_girls FROM events WHERE id = :eid"),
+                text(f"SELECT e.id, {effective_status('e')} AS status, e.only_girls FROM events e WHERE e.id = :eid"),
                 {"eid": event_id}
             ).fetchone()
             
@@ -174,7 +276,7 @@ def manage_event_participation(event_id, target_user_id):
         with current_app.engine.connect() as conn:
             
             participant = conn.execute(text("""
-                SELECT id, status FROM participants
+                SELECT id, status, created_at FROM participants
                 WHERE event_id = :eid AND user_id = :uid
             """), {"eid": event_id, "uid": target_user_id}).fetchone()
 
@@ -190,11 +292,17 @@ def manage_event_participation(event_id, target_user_id):
             
             if user_id == target_user_id:
                 if participant:
+                    record_participant_removed(
+                        conn, event_id, participant.created_at, participant.status == "ATTENDED"
+                    )
+                    if participant.status == "ATTENDED":
+                        record_user_attendance_removed(conn, target_user_id, event_id)
                     conn.execute(text("""
                         DELETE FROM participants
                         WHERE event_id = :eid AND user_id = :uid
                     """), {"eid": event_id, "uid": target_user_id})
                     conn.commit()
+                    invalidate_tags(TAG_EVENTS)
                     return {"message": "You have successfully left the event."}, 200
 
                 if application and application.status == "PENDING":
@@ -215,11 +323,17 @@ def manage_event_participation(event_id, target_user_id):
                     return {"error": auth_err.args[0]}, auth_err.code
 
                 if participant:
+                    record_participant_removed(
+                        conn, event_id, participant.created_at, participant.status == "ATTENDED"
+                    )
+                    if participant.status == "ATTENDED":
+                        record_user_attendance_removed(conn, target_user_id, event_id)
                     conn.execute(text("""
                         DELETE FROM participants
                         WHERE event_id = :eid AND user_id = :uid
                     """), {"eid": event_id, "uid": target_user_id})
                     conn.commit()
+                    invalidate_tags(TAG_EVENTS)
                     return {"message": "Participant removed successfully."}, 200
 
                 if application:
@@ -291,6 +405,48 @@ def get_event_applications(event_id):
         return {"error": f"An error occurred: {str(e)}"}, 503
 
 
+@events_bp.get("/<int:event_id>/participants/export")
+def export_event_participants(event_id):
+    """
+    Streams the participant list of an event as CSV or NDJSON.
+    Only the event owner (user or org admin/rep) can access this.
+    Query params: ?format=csv|ndjson&compress=true
+    """
+    try:
+        user_id = verify_jwt()
+
+        fmt = get_export_format()
+        if not fmt:
+            return {"error": "format must be csv or ndjson"}, 400
+
+        with current_app.engine.connect() as conn:
+            check_event_ownership(conn, event_id, user_id)
+
+        query = """
+            SELECT
+                p.id AS participant_id,
+                p.user_id,
+                u.username,
+                u.name,
+                p.status,
+                p.ticket_code,
+                p.created_at AS registered_at
+            FROM participants p
+            JOIN users u ON u.id = p.user_id
+            WHERE p.event_id = :eid
+            ORDER BY p.id
+        """
+
+        return streaming_export(
+            current_app.engine, query, {"eid": event_id}, fmt, f"event-{event_id}-participants"
+        )
+
+    except AuthError as e:
+        return {"error": e.args[0]}, e.code
+    except Exception as e:
+        return {"error": f"An error occurred: {str(e)}"}, 503
+
+
 @events_bp.post("/<int:event_id>/ratings")
 def rate_event(event_id):
     """
@@ -540,7 +696,7 @@ def create_event():
 
         # Insert event with transaction
         with current_app.engine.begin() as conn:
-            conn.execute(
+            result = conn.execute(
                 text("""
                     INSERT INTO events (
                         owner_user_id,
@@ -617,6 +773,9 @@ def create_event():
                     "only_girls": only_girls
                 }
             )
+            record_event_created(conn, result.lastrowid)
+
+        invalidate_tags(TAG_EVENTS)
 
         return {
             "message": "Event created successfully",
@@ -651,6 +810,7 @@ def check_in_participant(event_id):
                 query = text("""
                     SELECT
                         p.status,
+                        p.user_id,
                         u.username,
                         u.name
                     FROM participants p
@@ -680,12 +840,16 @@ def check_in_participant(event_id):
                 """)
 
                 conn.execute(update_query, {"ticket_code": ticket_code})
+                record_attendance(conn, event_id)
+                record_user_attendance(conn, participant.user_id, event_id)
 
-                return {
-                    "message": "Check-in successful",
-                    "username": participant.username,
-                    "name": participant.name
-                }, 200
+        # Commit'ten sonra: arada yeniden doldurulan cache kaydı eski kalmasın
+        invalidate_tags(TAG_EVENTS)
+        return {
+            "message": "Check-in successful",
+            "username": participant.username,
+            "name": participant.name
+        }, 200
 
     except AuthError as e:
         return {"error": e.args[0]}, e.code
@@ -720,6 +884,7 @@ def manual_check_in_participant(event_id):
                 text("""
                     SELECT 
                         p.status,
+                        p.user_id,
                         u.username,
                         u.name
                     FROM participants p
@@ -746,7 +911,10 @@ def manual_check_in_participant(event_id):
                 """),
                 {"pid": participant_id}
             )
+            record_attendance(conn, event_id)
+            record_user_attendance(conn, participant.user_id, event_id)
 
+        invalidate_tags(TAG_EVENTS)
         return {
             "message": "Manual check-in successful",
             "username": participant.username,
@@ -759,60 +927,230 @@ def manual_check_in_participant(event_id):
         return {"error": f"An error occurred: {str(e)}"}, 503
 
 
+def list_upcoming_events(conn, pagination_params=None, fields=None):
+    """
+    Upcoming public events page. Shared by the Flask view and the ASGI path
+    (backend/asgi.py, via AsyncConnection.run_sync).
+
+    Args:
+        conn: Database connection
+        pagination_params: get_pagination_params() output (None: from the Flask request)
+        fields: EVENT_LIST_FIELDS.resolve() output (None: default fields)
+
+    Returns:
+        dict: {'data': [...], 'pagination': {...}}
+    """
+    if fields is None:
+        fields = EVENT_LIST_FIELDS.resolve()
+
+    base_query = f"""
+    SELECT
+        {EVENT_LIST_FIELDS.select_clause(fields)}
+    FROM events e
+    {EVENT_LIST_FIELDS.join_clause(fields)}
+    WHERE {is_upcoming('e')}
+    ORDER BY e.starts_at ASC
+    """
+
+    count_query = f"""
+    SELECT COUNT(*)
+    FROM events e
+    WHERE {is_upcoming('e')}
+    """
+
+    return paginate_query(conn, base_query, count_query, pagination_params=pagination_params)
+
+
 @events_bp.get("/")
 def get_events():
     """
     Returns all public events.
-    Only events with status = FUTURE are visible to users.
+    Only upcoming events (status = FUTURE and not yet ended) are visible to users.
     Supports pagination with ?page=1&per_page=20
+    Sparse fieldsets with ?fields=id,title,starts_at; compact formats via
+    Accept (or ?format=columnar|msgpack), see utils/response_formats.py
     """
     try:
-        with current_app.engine.connect() as conn:
-            base_query = """
-            SELECT
-                e.id,
-                e.title,
-                e.explanation,
-                e.price,
-                e.starts_at,
-                e.ends_at,
-                e.location_name,
-                e.status,
-                e.user_limit,
-                e.latitude,
-                e.longitude,
-                e.created_at,
-                e.updated_at,
-                e.only_girls,
-                e.owner_type,
-                u.username AS owner_username,
-                o.name AS owner_organization_name,
-                et.code AS event_type,
-                (
-                    SELECT COUNT(*)
-                    FROM participants p
-                    WHERE p.event_id = e.id
-                ) AS participant_count
-            FROM events e
-            LEFT JOIN users u ON e.owner_user_id = u.id
-            LEFT JOIN organizations o ON e.owner_organization_id = o.id
-            LEFT JOIN event_types et ON e.type_id = et.id
-            WHERE e.status = 'FUTURE'
-            ORDER BY e.starts_at ASC
-            """
+        fmt = negotiate_format(request.headers.get("Accept"), request.args.get("format"))
+        fields = EVENT_LIST_FIELDS.resolve(request.args.get("fields"))
 
-            count_query = """
-            SELECT COUNT(*)
-            FROM events e
-            WHERE e.status = 'FUTURE'
-            """
-
-            result = paginate_query(conn, base_query, count_query)
-            return jsonify(result)
+        with current_app.engine.connect() as conn:
+            return page_response(list_upcoming_events(conn, fields=fields), fields, fmt)
 
+    except FieldError as e:
+        return {"error": str(e)}, 400
+    except FormatError as e:
+        return {"error": str(e)}, 406
     except Exception as e:
         return {"error": str(e)}, 503
 
+def load_event_detail(conn, event_id, user_id):
+    """
+    Event details as seen by `user_id`. Shared by the Flask view and the
+    ASGI path (backend/asgi.py).
+
+    Args:
+        conn: Database connection
+        event_id: Event ID
+        user_id: Requesting user's ID
+
+    Returns:
+        dict: Event with participants, applications and ratings
+
+    Raises:
+        AuthError: 404 if the event does not exist or is not visible to the user
+    """
+    event = conn.execute(text(f"""
+        SELECT
+            e.id,
+            e.title,
+            e.explanation,
+            e.price,
+            e.starts_at,
+            e.ends_at,
+            e.location_name,
+            {effective_status('e')} AS status,
+            e.user_limit,
+            e.latitude,
+            e.longitude,
+            e.created_at,
+            e.updated_at,
+            e.owner_type,
+            e.has_register,
+            e.owner_organization_id,
+            e.only_girls,
+            e.owner_user_id,
+            e.is_participants_private,
+            u.username AS owner_username,
+            o.name AS owner_organization_name,
+            et.code AS event_type
+        FROM events e
+        LEFT JOIN users u ON e.owner_user_id = u.id
+        LEFT JOIN organizations o ON e.owner_organization_id = o.id
+        LEFT JOIN event_types et ON e.type_id = et.id
+        WHERE e.id = :id
+    """), {"id": event_id}).fetchone()
+
+    if not event:
+        raise AuthError("Event not found", 404)
+
+    # --------------------------------------------------
+    # VISIBILITY CHECK (AI REVIEW)
+    # --------------------------------------------------
+    is_owner = False
+
+    if event.owner_type == "USER" and user_id == event.owner_user_id:
+        is_owner = True
+
+    elif event.owner_type == "ORGANIZATION" and event.owner_organization_id:
+        org_member = conn.execute(text("""
+            SELECT role
+            FROM organization_members
+            WHERE organization_id = :oid AND user_id = :uid
+        """), {
+            "oid": event.owner_organization_id,
+            "uid": user_id
+        }).fetchone()
+
+        if org_member and org_member.role in ["ADMIN", "REPRESENTATIVE"]:
+            is_owner = True
+
+    if event.status in ["PENDING_REVIEW", "REJECTED"] and not is_owner:
+        raise AuthError("Event not available", 404)
+
+    is_finished = (event.status == "COMPLETED")
+
+    # --------------------------------------------------
+    # PARTICIPANT VISIBILITY
+    # --------------------------------------------------
+    show_participants = True
+
+    if event.is_participants_private and not is_owner:
+        show_participants = False
+
+    participants = []
+    if show_participants:
+        participants = conn.execute(text("""
+            SELECT
+                p.id AS id,
+                p.user_id,
+                u.username,
+                p.status
+            FROM participants p
+            JOIN users u ON u.id = p.user_id
+            WHERE p.event_id = :id
+        """), {"id": event_id}).fetchall()
+
+    applications = []
+    if show_participants and event.owner_type == "ORGANIZATION":
+        applications = conn.execute(text("""
+            SELECT
+                a.id,
+                a.user_id,
+                u.username,
+                a.motivation,
+                a.status,
+                a.created_at
+            FROM organization_applications a
+            JOIN users u ON a.user_id = u.id
+            WHERE a.organization_id = :org_id
+            ORDER BY a.created_at DESC
+        """), {"org_id": event.owner_organization_id}).fetchall()
+
+    # --------------------------------------------------
+    # RATINGS (ONLY IF COMPLETED)
+    # --------------------------------------------------
+    ratings_summary = None
+    if is_finished:
+        agg = conn.execute(text("""
+            SELECT
+                AVG(rating) AS avg_rating,
+                COUNT(*) AS rating_count
+            FROM ratings
+            WHERE event_id = :eid
+        """), {"eid": event_id}).fetchone()
+
+        rating_rows = conn.execute(text("""
+            SELECT
+                u.username,
+                r.rating,
+                r.comment
+            FROM ratings r
+            JOIN users u ON u.id = r.user_id
+            WHERE r.event_id = :eid
+            ORDER BY r.id ASC
+        """), {"eid": event_id}).fetchall()
+
+        ratings_summary = {
+            "average_rating": float(agg.avg_rating) if agg.avg_rating else None,
+            "rating_count": int(agg.rating_count),
+            "ratings": [
+                {
+                    "username": r.username,
+                    "rating": int(r.rating),
+                    "comment": r.comment
+                }
+                for r in rating_rows
+            ]
+        }
+
+    # --------------------------------------------------
+    # RESPONSE
+    # --------------------------------------------------
+    event_data = dict(event._mapping)
+    event_data["is_participants_private"] = bool(event.is_participants_private)
+    event_data["only_girls"] = bool(event.only_girls)
+    event_data["participants"] = (
+        [dict(p._mapping) for p in participants] if show_participants else None
+    )
+    event_data["applications"] = (
+        [dict(a._mapping) for a in applications] if show_participants else []
+    )
+    event_data["ratings"] = ratings_summary if is_finished else None
+
+    return event_data
+
+
 @events_bp.get("/<int:event_id>")
 def get_event_by_id(event_id):
     """
@@ -827,158 +1165,139 @@ def get_event_by_id(event_id):
         user_id = verify_jwt()
 
         with current_app.engine.connect() as conn:
-            event = conn.execute(text("""
-                SELECT
-                    e.id,
-                    e.title,
-                    e.explanation,
-                    e.price,
-                    e.starts_at,
-                    e.ends_at,
-                    e.location_name,
-                    e.status,
-                    e.user_limit,
-                    e.latitude,
-                    e.longitude,
-                    e.created_at,
-                    e.updated_at,
-                    e.owner_type,
-                    e.has_register,
-                    e.owner_organization_id,
-                    e.only_girls,
-                    e.owner_user_id,
-                    e.is_participants_private,
-                    u.username AS owner_username,
-                    o.name AS owner_organization_name,
-                    et.code AS event_type
-                FROM events e
-                LEFT JOIN users u ON e.owner_user_id = u.id
-                LEFT JOIN organizations o ON e.owner_organization_id = o.id
-                LEFT JOIN event_types et ON e.type_id = et.id
-                WHERE e.id = :id
-            """), {"id": event_id}).fetchone()
+            return jsonify(load_event_detail(conn, event_id, user_id))
 
-            if not event:
-                return {"error": "Event not found"}, 404
-
-            # --------------------------------------------------
-            # VISIBILITY CHECK (AI REVIEW)
-            # --------------------------------------------------
-            is_owner = False
-
-            if event.owner_type == "USER" and user_id == event.owner_user_id:
-                is_owner = True
-
-            elif event.owner_type == "ORGANIZATION" and event.owner_organization_id:
-                org_member = conn.execute(text("""
-                    SELECT role
-                    FROM organization_members
-                    WHERE organization_id = :oid AND user_id = :uid
-                """), {
-                    "oid": event.owner_organization_id,
-                    "uid": user_id
-                }).fetchone()
-
-                if org_member and org_member.role in ["ADMIN", "REPRESENTATIVE"]:
-                    is_owner = True
+    except AuthError as e:
+        return {"error": e.args[0]}, e.code
+    except Exception as e:
+        return {"error": str(e)}, 503
 
-            if event.status in ["PENDING_REVIEW", "REJECTED"] and not is_owner:
-                return {"error": "Event not available"}, 404
 
-            is_finished = (event.status == "COMPLETED")
+def search_events(conn, args, pagination_params=None, fields=None):
+    """
+    Filtered events page. Shared by the Flask view and the ASGI path
+    (backend/asgi.py).
 
-            # --------------------------------------------------
-            # PARTICIPANT VISIBILITY
-            # --------------------------------------------------
-            show_participants = True
+    Args:
+        conn: Database connection
+        args: Query parameter mapping (type, from, to, q, university, organization,
+            status, past_events, only_girls, min_price, max_price)
+        pagination_params: get_pagination_params() output (None: from the Flask request)
+        fields: EVENT_FILTER_FIELDS.resolve() output (None: default fields)
 
-            if event.is_participants_private and not is_owner:
-                show_participants = False
+    Returns:
+        dict: {'data': [...], 'pagination': {...}}
 
-            participants = []
-            if show_participants:
-                participants = conn.execute(text("""
-                    SELECT
-                        p.id AS id,
-                        p.user_id,
-                        u.username,
-                        p.status
-                    FROM participants p
-                    JOIN users u ON u.id = p.user_id
-                    WHERE p.event_id = :id
-                """), {"id": event_id}).fetchall()
+    Raises:
+        ValueError: If a price filter is not a number
+    """
+    type_code = args.get("type")
+    from_date = args.get("from")
+    to_date = args.get("to")
+    search = args.get("q")
+    university = args.get("university")  # can be name or id
+    organization = args.get("organization")
+    status = args.get("status")
+    past_events = args.get("past_events")
+    only_girls = args.get("only_girls")
+    
+    min_price = args.get("min_price")
+    max_price = args.get("max_price")
+
+    filters = []
+    params = {}
+    # Filtrelerin ihtiyaç duyduğu join'ler (alanlarınkine ek olarak)
+    filter_joins = set()
+
+    # --- Existing filters ---
+    if type_code:
+        filters.append("et.code = :type_code")
+        filter_joins.add("et")
+        params["type_code"] = type_code
+
+    if from_date:
+        filters.append("e.starts_at >= :from_date")
+        params["from_date"] = from_date
+
+    if to_date:
+        filters.append("e.starts_at <= :to_date")
+        params["to_date"] = to_date
+
+    if search:
+        # Case-insensitive search across multiple fields including explanation
+        filters.append("""(
+            LOWER(e.title) LIKE LOWER(:search) OR 
+            LOWER(e.explanation) LIKE LOWER(:search) OR 
+            LOWER(o.name) LIKE LOWER(:search) OR 
+            LOWER(u.username) LIKE LOWER(:search) OR
+            LOWER(e.location_name) LIKE LOWER(:search)
+        )""")
+        filter_joins.update(("o", "u"))
+        params["search"] = f"%{search}%"
+
+    # --- University filter ---
+    if university:
+        filter_joins.add("un")
+        if university.isdigit():
+            filters.append("un.id = :university_id")
+            params["university_id"] = int(university)
+        else:
+            filters.append("LOWER(un.name) LIKE LOWER(:university_name)")
+            params["university_name"] = f"%{university}%"
+
+    # --- Organization filter ---
+    if organization:
+        filter_joins.add("o")
+        if organization.isdigit():
+            filters.append("o.id = :organization_id")
+            params["organization_id"] = int(organization)
+        else:
+            filters.append("LOWER(o.name) LIKE LOWER(:organization_name)")
+            params["organization_name"] = f"%{organization}%"
+
+    # --- Status filter (bitmiş FUTURE event'ler COMPLETED sayılır) ---
+    if status:
+        status_sql, status_params = status_filter(status)
+        filters.append(status_sql)
+        params.update(status_params)
+
+    # --- Price filter ---
+    if min_price:
+        filters.append("e.price >= :min_price")
+        params["min_price"] = float(min_price)
+    
+    if max_price:
+        filters.append("e.price <= :max_price")
+        params["max_price"] = float(max_price)
 
-            applications = []
-            if show_participants and event.owner_type == "ORGANIZATION":
-                applications = conn.execute(text("""
-                    SELECT
-                        a.id,
-                        a.user_id,
-                        u.username,
-                        a.motivation,
-                        a.status,
-                        a.created_at
-                    FROM organization_applications a
-                    JOIN users u ON a.user_id = u.id
-                    WHERE a.organization_id = :org_id
-                    ORDER BY a.created_at DESC
-                """), {"org_id": event.owner_organization_id}).fetchall()
-
-            # --------------------------------------------------
-            # RATINGS (ONLY IF COMPLETED)
-            # --------------------------------------------------
-            ratings_summary = None
-            if is_finished:
-                agg = conn.execute(text("""
-                    SELECT
-                        AVG(rating) AS avg_rating,
-                        COUNT(*) AS rating_count
-                    FROM ratings
-                    WHERE event_id = :eid
-                """), {"eid": event_id}).fetchone()
+    if past_events:
+        filters.append(has_ended("e"))
 
-                rating_rows = conn.execute(text("""
-                    SELECT
-                        u.username,
-                        r.rating,
-                        r.comment
-                    FROM ratings r
-                    JOIN users u ON u.id = r.user_id
-                    WHERE r.event_id = :eid
-                    ORDER BY r.id ASC
-                """), {"eid": event_id}).fetchall()
-
-                ratings_summary = {
-                    "average_rating": float(agg.avg_rating) if agg.avg_rating else None,
-                    "rating_count": int(agg.rating_count),
-                    "ratings": [
-                        {
-                            "username": r.username,
-                            "rating": int(r.rating),
-                            "comment": r.comment
-                        }
-                        for r in rating_rows
-                    ]
-                }
+    if only_girls:
+        filters.append("e.only_girls = 1")
 
-            # --------------------------------------------------
-            # RESPONSE
-            # --------------------------------------------------
-            event_data = dict(event._mapping)
-            event_data["is_participants_private"] = bool(event.is_participants_private)
-            event_data["only_girls"] = bool(event.only_girls)
-            event_data["participants"] = (
-                [dict(p._mapping) for p in participants] if show_participants else None
-            )
-            event_data["applications"] = (
-                [dict(a._mapping) for a in applications] if show_participants else []
-            )
-            event_data["ratings"] = ratings_summary if is_finished else None
+    where_clause = "WHERE " + " AND ".join(filters) if filters else ""
 
-            return jsonify(event_data)
+    if fields is None:
+        fields = EVENT_FILTER_FIELDS.resolve()
 
-    except Exception as e:
-        return {"error": str(e)}, 503
+    base_query = f"""
+        SELECT
+            {EVENT_FILTER_FIELDS.select_clause(fields)}
+        FROM events e
+        {EVENT_FILTER_FIELDS.join_clause(fields, filter_joins)}
+        {where_clause}
+        ORDER BY e.starts_at ASC
+    """
+    
+    count_query = f"""
+        SELECT COUNT(*) 
+        FROM events e
+        {EVENT_FILTER_FIELDS.join_clause((), filter_joins)}
+        {where_clause}
+    """
+    
+    return paginate_query(conn, base_query, count_query, params, pagination_params)
 
 
 @events_bp.get("/filter")
@@ -988,146 +1307,39 @@ def filter_events():
     and price.
     Works for both user and organization events.
     Supports pagination with ?page=1&per_page=20 parameters.
+    Sparse fieldsets with ?fields=...; compact formats via Accept or ?format=
+    Results are cached for EVENT_FILTER_CACHE_TTL seconds per normalized
+    parameter set; event writes invalidate them.
     """
     try:
-        type_code = request.args.get("type")
-        from_date = request.args.get("from")
-        to_date = request.args.get("to")
-        search = request.args.get("q")
-        university = request.args.get("university")  # can be name or id
-        organization = request.args.get("organization")
-        status = request.args.get("status")
-        past_events = request.args.get("past_events")
-        only_girls = request.args.get("only_girls")
-        
-        min_price = request.args.get("min_price")
-        max_price = request.args.get("max_price")
-
-        filters = []
-        params = {}
-
-        # --- Existing filters ---
-        if type_code:
-            filters.append("et.code = :type_code")
-            params["type_code"] = type_code
-
-        if from_date:
-            filters.append("e.starts_at >= :from_date")
-            params["from_date"] = from_date
-
-        if to_date:
-            filters.append("e.starts_at <= :to_date")
-            params["to_date"] = to_date
-
-        if search:
-            # Case-insensitive search across multiple fields including explanation
-            filters.append("""(
-                LOWER(e.title) LIKE LOWER(:search) OR 
-                LOWER(e.explanation) LIKE LOWER(:search) OR 
-                LOWER(o.name) LIKE LOWER(:search) OR 
-                LOWER(u.username) LIKE LOWER(:search) OR
-                LOWER(e.location_name) LIKE LOWER(:search)
-            )""")
-            params["search"] = f"%{search}%"
-
-        # --- University filter ---
-        if university:
-            if university.isdigit():
-                filters.append("un.id = :university_id")
-                params["university_id"] = int(university)
-            else:
-                filters.append("LOWER(un.name) LIKE LOWER(:university_name)")
-                params["university_name"] = f"%{university}%"
-
-        # --- Organization filter ---
-        if organization:
-            if organization.isdigit():
-                filters.append("o.id = :organization_id")
-                params["organization_id"] = int(organization)
-            else:
-                filters.append("LOWER(o.name) LIKE LOWER(:organization_name)")
-                params["organization_name"] = f"%{organization}%"
-
-        # --- Status filter ---
-        if status:
-            filters.append("e.status = :status")
-            params["status"] = status
-
-        # --- Price filter ---
-        if min_price:
-            filters.append("e.price >= :min_price")
-            params["min_price"] = float(min_price)
-        
-        if max_price:
-            filters.append("e.price <= :max_price")
-            params["max_price"] = float(max_price)
-
-        if past_events:
-            filters.append("""
-                (
-                    (e.ends_at IS NOT NULL AND e.ends_at < NOW())
-                    OR
-                    (e.ends_at IS NULL AND e.starts_at < NOW())
-                )
-            """)
+        fmt = negotiate_format(request.headers.get("Accept"), request.args.get("format"))
+        fields = EVENT_FILTER_FIELDS.resolve(request.args.get("fields"))
+        pagination = get_pagination_params()
 
-        if only_girls:
-            filters.append("e.only_girls = 1")
+        def load():
+            with current_app.engine.connect() as conn:
+                return search_events(conn, request.args, pagination, fields)
 
-        where_clause = "WHERE " + " AND ".join(filters) if filters else ""
+        # Son yazmasını hemen görmesi gereken kullanıcı cache'i atlar
+        ttl = current_app.config.get("EVENT_FILTER_CACHE_TTL", 0)
+        if ttl and not recently_wrote():
+            result = cache.get_or_set(
+                filter_cache_key(request.args, pagination, fields), load, ttl, FILTER_CACHE_TAGS
+            )
+        else:
+            result = load()
 
-        with current_app.engine.connect() as conn:
-            base_query = f"""
-                SELECT 
-                    e.id,
-                    e.title,
-                    e.starts_at,
-                    e.ends_at,
-                    e.location_name,
-                    e.price,  
-                    e.status,
-                    e.latitude,
-                    e.longitude,
-                    e.created_at,
-                    e.owner_type,
-                    u.username AS owner_username,
-                    o.name AS owner_organization_name,
-                    et.code AS event_type,
-                    un.name AS university_name,
-                    (
-                    SELECT COUNT(*)
-                    FROM participants p
-                    WHERE p.event_id = e.id
-                    ) AS participant_count
-                FROM events e
-                LEFT JOIN event_types et ON e.type_id = et.id
-                LEFT JOIN users u ON e.owner_user_id = u.id
-                LEFT JOIN organizations o ON e.owner_organization_id = o.id
-                LEFT JOIN universities un ON u.university_id = un.id
-                {where_clause}
-                ORDER BY e.starts_at ASC
-            """
-            
-            count_query = f"""
-                SELECT COUNT(*) 
-                FROM events e
-                LEFT JOIN event_types et ON e.type_id = et.id
-                LEFT JOIN users u ON e.owner_user_id = u.id
-                LEFT JOIN organizations o ON e.owner_organization_id = o.id
-                LEFT JOIN universities un ON u.university_id = un.id
-                {where_clause}
-            """
-            
-            result = paginate_query(conn, base_query, count_query, params)
-            return jsonify(result)
+        return page_response(result, fields, fmt)
 
+    except FieldError as e:
+        return {"error": str(e)}, 400
+    except FormatError as e:
+        return {"error": str(e)}, 406
     except ValueError:
         return {"error": "Invalid format for price or ID fields"}, 400
     except Exception as e:
         return {"error": str(e)}, 503
 
-
-
 @events_bp.put("/<int:event_id>")
 def update_event(event_id):
     """
@@ -1156,6 +1368,9 @@ def update_event(event_id):
                 return {"error": "No valid fields to update"}, 400
 
             set_clause = ", ".join([f"{k} = :{k}" for k in updates])
+            # Tip / başlangıç günü değişirse rollup katkıları yeni kovaya taşınır
+            moves_rollups = "type_id" in updates or "starts_at" in updates
+            before = event_dimensions(conn, event_id) if moves_rollups else None
             updates["id"] = event_id
 
             conn.execute(text(f"""
@@ -1163,8 +1378,12 @@ def update_event(event_id):
                 SET {set_clause}, updated_at = NOW()
                 WHERE id = :id
             """), updates)
+            if moves_rollups:
+                record_event_moved(conn, event_id, before)
             conn.commit()
 
+        invalidate_tags(TAG_EVENTS)
+
         return {"message": "Event updated successfully"}
 
     except AuthError as e:
@@ -1185,9 +1404,13 @@ def delete_event(event_id):
             # Check ownership and permissions
             check_event_ownership(conn, event_id, user_id)
 
+            record_event_removed(conn, event_id)
+            record_event_attendance_removed(conn, event_id)
             conn.execute(text("DELETE FROM events WHERE id = :id"), {"id": event_id})
             conn.commit()
 
+        invalidate_tags(TAG_EVENTS)
+
         return {"message": "Event deleted successfully"}
 
     except AuthError as e:
@@ -2,6 +2,7 @@ from flask import Blueprint, request, jsonify, current_app
 from sqlalchemy import text
 from backend.utils.auth_utils import verify_jwt, check_organization_permission, check_organization_ownership, AuthError
 from backend.utils.pagination import paginate_query
+from backend.utils.cache import TAG_EVENTS, TAG_ORGANIZATIONS, invalidate_tags
 from datetime import datetime
 import jwt
 
@@ -98,6 +99,8 @@ def create_organization():
                 VALUES (:oid, :uid, 'ADMIN', NOW())
             """), {"oid": new_org_id, "uid": user_id})
 
+        invalidate_tags(TAG_ORGANIZATIONS)
+
         return {"message": "Organization created successfully"}, 201
 
     except AuthError as e:
@@ -171,6 +174,9 @@ def approve_organization_application(org_id, app_id):
             """), {"oid": org_id, "uid": applicant_id})
             conn.commit()
 
+        # member_count değişti
+        invalidate_tags(TAG_ORGANIZATIONS)
+
         return {"message": "Application approved and member added"}
 
     except AuthError as e:
@@ -241,6 +247,9 @@ def update_organization(org_id):
             """), updates)
             conn.commit()
 
+        # Cache'teki event satırları owner_organization_name taşır
+        invalidate_tags(TAG_ORGANIZATIONS, TAG_EVENTS)
+
         return {"message": "Organization updated successfully"}
     
     except AuthError as e:
@@ -262,6 +271,9 @@ def delete_organization(org_id):
             conn.execute(text("DELETE FROM organizations WHERE id = :id"), {"id": org_id})
             conn.commit()
 
+        # Event'lerin owner_organization_id'si NULL olur (ON DELETE SET NULL)
+        invalidate_tags(TAG_ORGANIZATIONS, TAG_EVENTS)
+
         return {"message": "Organization deleted successfully"}
 
     except AuthError as e:
@@ -313,6 +325,46 @@ def get_organization_applications(org_id):
         return {"error": str(e)}, 503
 
 
+def list_active_organizations(conn, pagination_params=None):
+    """
+    Active organizations page. Shared by the Flask view and the ASGI path
+    (backend/asgi.py).
+
+    Args:
+        conn: Database connection
+        pagination_params: get_pagination_params() output (None: from the Flask request)
+
+    Returns:
+        dict: {'data': [...], 'pagination': {...}}
+    """
+    base_query = """
+        SELECT 
+            o.id,
+            o.name,
+            o.description,
+            o.status,
+            o.created_at,
+            o.updated_at,
+            u.username AS owner_username,
+            (
+                SELECT COUNT(*) FROM organization_members m
+                WHERE m.organization_id = o.id
+            ) AS member_count
+        FROM organizations o
+        LEFT JOIN users u ON o.owner_user_id = u.id
+        WHERE o.status = 'ACTIVE'
+        ORDER BY o.name ASC
+    """
+    
+    count_query = """
+        SELECT COUNT(*) 
+        FROM organizations o
+        WHERE o.status = 'ACTIVE'
+    """
+    
+    return paginate_query(conn, base_query, count_query, pagination_params=pagination_params)
+
+
 @organization_bp.get("/")
 def get_organizations():
     """
@@ -321,33 +373,7 @@ def get_organizations():
     """
     try:
         with current_app.engine.connect() as conn:
-            base_query = """
-                SELECT 
-                    o.id,
-                    o.name,
-                    o.description,
-                    o.status,
-                    o.created_at,
-                    o.updated_at,
-                    u.username AS owner_username,
-                    (
-                        SELECT COUNT(*) FROM organization_members m
-                        WHERE m.organization_id = o.id
-                    ) AS member_count
-                FROM organizations o
-                LEFT JOIN users u ON o.owner_user_id = u.id
-                WHERE o.status = 'ACTIVE'
-                ORDER BY o.name ASC
-            """
-            
-            count_query = """
-                SELECT COUNT(*) 
-                FROM organizations o
-                WHERE o.status = 'ACTIVE'
-            """
-            
-            result = paginate_query(conn, base_query, count_query)
-            return jsonify(result)
+            return jsonify(list_active_organizations(conn))
             
     except Exception as e:
         return {"error": str(e)}, 503
@@ -479,6 +505,8 @@ def remove_member(org_id, target_user_id):
             """), {"oid": org_id, "uid": target_user_id})
             conn.commit()
 
+        invalidate_tags(TAG_ORGANIZATIONS)
+
         msg = (
             "You have successfully left the organization."
             if user_id == target_user_id
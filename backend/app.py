@@ -1,3 +1,6 @@
+import time
+_import_started = time.perf_counter()
+
 from datetime import datetime, timedelta
 from functools import wraps
 import os
@@ -5,7 +8,8 @@ import re
 import uuid
 import secrets
 from backend.utils.auth_utils import verify_jwt, AuthError, check_organization_permission, check_event_ownership, check_organization_ownership, require_auth
-from backend.utils.pagination import paginate_query, get_pagination_params
+from backend.utils.pagination import paginate_query, get_pagination_params, paginate_keyset
+from backend.utils.export import streaming_json
 from backend.utils.mail_service import (
     generate_verification_token,
     verify_token,
@@ -13,19 +17,33 @@ from backend.utils.mail_service import (
     send_password_reset_email
 )
 from backend.utils.scheduler import init_scheduler
+from backend.utils.rollups import record_registration
 from backend.config import get_config
+from backend.utils.db import init_engines, prewarm_pools
+from backend.utils.sql_accounting import init_sql_accounting
+from backend.utils.query_stats import init_query_stats
+from backend.utils.metrics import init_metrics
+from backend.utils.startup import StartupReport, is_app_engine, warm_up
+from backend.utils.json_provider import init_json_provider
+from backend.utils.compression import init_compression
+from backend.utils.cache import TAG_EVENTS, init_cache, invalidate_tags
+from backend.utils.row_encoder import encode_rows
 
 from flask import Flask, jsonify, request, Blueprint
 from flask_cors import CORS
 import jwt
 import pkgutil
-import importlib
 import backend.api as api
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
+
+# Başlangıç fazlarının süreleri (bkz. utils/startup.py, GET /admin/startup)
+startup = StartupReport(started=_import_started)
+startup.mark("imports")
 
 # Initialize Flask app
 app = Flask(__name__)
 CORS(app)
+app.startup_report = startup
 
 # Load configuration
 config = get_config()
@@ -42,26 +60,60 @@ app.config["BACKEND_BASE_URL"] = os.getenv("BACKEND_BASE_URL")
 #Frontend base url
 app.config["FRONTEND_BASE_URL"] = os.getenv("FRONTEND_BASE_URL")
 
+# orjson tabanlı JSON provider (bkz. utils/json_provider.py)
+init_json_provider(app)
+
+# gzip / brotli yanıt sıkıştırma; after_request hook'ları ters sırada çalıştığı
+# için ilk kaydedilir, böylece yanıt üzerindeki son işlem olur
+init_compression(app)
+
+# Ortak cache (bkz. utils/cache.py); redis backend'i app.json ile serileştirir
+init_cache(app)
+startup.mark("config")
+
 # Database engine
 DATABASE_URL = app.config['DATABASE_URL']
 SECRET_KEY = app.config['SECRET_KEY']
-engine = create_engine(DATABASE_URL, pool_pre_ping=True, future=True)
 
 # Engine'i app'e ekle ki Blueprint'ler current_app.engine ile erişebilsin
-app.engine = engine
+# (DATABASE_READ_URL varsa okuma istekleri replica'ya yönlenir)
+engine = init_engines(app)
+
+# Pre-fork sunucuda (gunicorn) app master'da yüklenir: bağlantılar ve scheduler
+# fork'tan sonra worker'da açılır (bkz. backend/gunicorn.conf.py)
+SERVER_PREFORK = os.getenv("SERVER_PREFORK", "false").lower() == "true"
+if not SERVER_PREFORK:
+    prewarm_pools(app)
+startup.mark("engines")
 
+# İstek başına SQL sayısı / süresi, N+1 uyarıları ve debug Server-Timing
+init_sql_accounting(app)
 
-app.config['SKIP_SCHEDULER'] = os.getenv('SKIP_SCHEDULER', 'false')
+# Worker'lar arası toplanan sorgu fingerprint istatistikleri (/admin/db/statements)
+init_query_stats(app)
+
+# Prometheus /metrics: route gecikmeleri, hata sayıları, pool, scheduler ve dış servisler
+init_metrics(app)
+startup.mark("instrumentation")
+
+
+# App Engine'de instance'lar isteklere göre açılıp kapanır (boştayken CPU kısılır);
+# request instance'larında scheduler varsayılan olarak kapalıdır, SKIP_SCHEDULER=false ile açılır
+app.config['SKIP_SCHEDULER'] = os.getenv('SKIP_SCHEDULER', 'true' if is_app_engine() else 'false')
 
 # =============================================
 # Moduler yapinin calismasi icin gerekli kodlar
 # =============================================
 def register_blueprints(app):
     """api/ klasöründeki tüm Blueprint'leri otomatik olarak bulur ve kaydeder."""
+    if app.config.get("BLUEPRINT_REGISTRY", "scan") == "static":
+        return register_static_blueprints(app)
+
+    static = set(api.BLUEPRINTS)
     # api paketinin içindeki tüm modülleri (users.py, auth.py, vb.) tarar
     for finder, name, ispkg in pkgutil.iter_modules(api.__path__, api.__name__ + '.'):
         # Örnek: 'api.users', 'api.auth'
-        module = importlib.import_module(name)
+        module = startup.import_module(name)
         
         # Modülün içinde Blueprint nesnesi olup olmadığını kontrol et
         for item_name in dir(module):
@@ -71,9 +123,21 @@ def register_blueprints(app):
             if isinstance(item, Blueprint):
                 app.register_blueprint(item)
                 print(f"✓ Blueprint Kaydedildi: {item.name} → {item.url_prefix or '/'}")
+                if f"{name}:{item_name}" not in static:
+                    print(f"⚠ {name}:{item_name} api.BLUEPRINTS listesinde yok (static modda kaydedilmez)")
+
+
+def register_static_blueprints(app):
+    """api.BLUEPRINTS listesindeki Blueprint'leri paket taraması yapmadan kaydeder."""
+    for entry in api.BLUEPRINTS:
+        module_name, attr = entry.split(":")
+        item = getattr(startup.import_module(module_name), attr)
+        app.register_blueprint(item)
+        print(f"✓ Blueprint Kaydedildi: {item.name} → {item.url_prefix or '/'}")
 
 # Blueprint keşfini çalıştır
 register_blueprints(app)
+startup.mark("blueprints")
 
 # =============================================
 # SCHEDULER INITIALIZATION
@@ -81,7 +145,7 @@ register_blueprints(app)
 def init_app_scheduler():
     """
     APScheduler'ı başlatır.
-    SKIP_SCHEDULER=true ile devre dışı bırakılabilir.
+    SKIP_SCHEDULER=true ile devre dışı bırakılabilir (App Engine'de varsayılan).
     """
     try:
         scheduler = init_scheduler(app)
@@ -95,8 +159,22 @@ def init_app_scheduler():
         print(f"Scheduler başlatılamadı: {str(e)}")
         app._scheduler = None
 
-# Scheduler'ı başlat
-init_app_scheduler()
+# Scheduler'ı başlat (pre-fork sunucuda her worker'da post_fork içinde; job'ları lider çalıştırır)
+if not SERVER_PREFORK:
+    init_app_scheduler()
+startup.mark("scheduler")
+startup.finish()
+
+
+# Yalnızca App Engine'de kaydedilir (diğer ortamlarda herkese açık bir endpoint olurdu)
+if is_app_engine():
+    @app.get("/_ah/warmup")
+    def warmup():
+        """
+        App Engine warmup isteği: lazy modüller, OpenAI client'ı ve DB pool'ları
+        trafik gelmeden önce yüklenir.
+        """
+        return jsonify({"warmed": warm_up(app)})
 
 
 @app.post("/test-login")
@@ -121,9 +199,9 @@ def test_login():
 @app.get("/health")
 def health():
     try:
-        with engine.connect() as conn:
+        with engine.primary.connect() as conn:
             conn.execute(text("SELECT 1"))
-        return {"ok": True}
+        return {"ok": True, "database": engine.status()}
     except Exception as e:
 
         return {"ok": False, "error": str(e)}, 503
@@ -302,7 +380,7 @@ def universities():
     try:
         with engine.connect() as conn:
             result = conn.execute(text("SELECT * FROM universities"))
-            rows = [dict(r._mapping) for r in result]
+            rows = encode_rows(result)
         return jsonify(rows)
     except Exception as e:
         return {"error": str(e)}, 503
@@ -313,7 +391,7 @@ def event_types():
     try:
         with engine.connect() as conn:
             result = conn.execute(text("SELECT * FROM event_types"))
-            rows = [dict(r._mapping) for r in result]
+            rows = encode_rows(result)
         return jsonify(rows)
     except Exception as e:
         return {"error": str(e)}, 503
@@ -541,12 +619,16 @@ def manage_event_application(application_id):
                         "ticket": ticket_code
                     }
                 )
+                record_registration(conn, application_details.event_id)
 
             conn.execute(
                 text("UPDATE applications SET status = :status WHERE id = :app_id"),
                 {"status": new_status, "app_id": application_id}
             )
 
+        if new_status == "APPROVED":
+            # Cache'teki event listeleri participant_count taşır
+            invalidate_tags(TAG_EVENTS)
         return {"message": f"Application {new_status.lower()}"}, 200
 
     except AuthError as e:
@@ -556,35 +638,119 @@ def manage_event_application(application_id):
 
 
 
+def _scoped_listing(event_query, user_query, cursor_column, require_owner=True):
+    """
+    ?event_id=X verilirse etkinlik kapsamında (sahip kontrolü ile),
+    verilmezse giriş yapan kullanıcının kendi kayıtlarını listeler.
+    Varsayılan: cursor pagination (?cursor=&limit=).
+    ?stream=true: tüm kapsamı server-side cursor ile JSON array olarak stream eder.
+    """
+    user_id = verify_jwt()
+    event_id = request.args.get("event_id", type=int)
+
+    if event_id is not None:
+        with engine.connect() as conn:
+            if require_owner:
+                check_event_ownership(conn, event_id, user_id)
+            elif not conn.execute(
+                text("SELECT id FROM events WHERE id = :eid"), {"eid": event_id}
+            ).fetchone():
+                raise AuthError("Event not found", 404)
+        query, params = event_query, {"eid": event_id}
+    else:
+        query, params = user_query, {"uid": user_id}
+
+    if request.args.get("stream", "false").lower() == "true":
+        return streaming_json(engine, f"{query} ORDER BY {cursor_column}", params)
+
+    with engine.connect() as conn:
+        return jsonify(paginate_keyset(conn, query, params, cursor_column=cursor_column))
+
+
 @app.get("/applications")
 def applications():
+    """
+    Etkinlik başvuruları.
+    ?event_id=X -> etkinliğin başvuruları (sadece etkinlik sahibi)
+    (yok)       -> kullanıcının kendi başvuruları
+    """
     try:
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT * FROM applications"))
-            rows = [dict(r._mapping) for r in result]
-        return jsonify(rows)
+        return _scoped_listing(
+            event_query="""
+                SELECT a.id, a.event_id, a.user_id, u.username, u.name AS user_name, a.why_me, a.status
+                FROM applications a
+                JOIN users u ON u.id = a.user_id
+                WHERE a.event_id = :eid
+            """,
+            user_query="""
+                SELECT a.id, a.event_id, e.title AS event_title, a.why_me, a.status
+                FROM applications a
+                JOIN events e ON e.id = a.event_id
+                WHERE a.user_id = :uid
+            """,
+            cursor_column="a.id"
+        )
+    except AuthError as e:
+        return {"error": e.args[0]}, e.code
     except Exception as e:
         return {"error": str(e)}, 503
 
 
 @app.get("/participants")
 def participants():
+    """
+    Etkinlik katılımcıları.
+    ?event_id=X -> etkinliğin katılımcıları (sadece etkinlik sahibi)
+    (yok)       -> kullanıcının kendi katılımları (biletler)
+    """
     try:
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT * FROM participants"))
-            rows = [dict(r._mapping) for r in result]
-        return jsonify(rows)
+        return _scoped_listing(
+            event_query="""
+                SELECT p.id, p.event_id, p.user_id, u.username, u.name AS user_name, p.status, p.created_at
+                FROM participants p
+                JOIN users u ON u.id = p.user_id
+                WHERE p.event_id = :eid
+            """,
+            user_query="""
+                SELECT p.id, p.event_id, e.title AS event_title, e.starts_at, p.status, p.ticket_code, p.created_at
+                FROM participants p
+                JOIN events e ON e.id = p.event_id
+                WHERE p.user_id = :uid
+            """,
+            cursor_column="p.id"
+        )
+    except AuthError as e:
+        return {"error": e.args[0]}, e.code
     except Exception as e:
         return {"error": str(e)}, 503
 
 
 @app.get("/ratings")
 def ratings():
+    """
+    Etkinlik puanları.
+    ?event_id=X -> etkinliğin puanları (giriş yapmış herkes)
+    (yok)       -> kullanıcının kendi puanları
+    """
     try:
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT * FROM ratings"))
-            rows = [dict(r._mapping) for r in result]
-        return jsonify(rows)
+        return _scoped_listing(
+            event_query="""
+                SELECT r.id, r.event_id, r.user_id, u.username, r.rating, r.comment
+                FROM ratings r
+                JOIN users u ON u.id = r.user_id
+                WHERE r.event_id = :eid
+            """,
+            user_query="""
+                SELECT r.id, r.event_id, e.title AS event_title, r.rating, r.comment
+                FROM ratings r
+                JOIN events e ON e.id = r.event_id
+                WHERE r.user_id = :uid
+            """,
+            cursor_column="r.id",
+            require_owner=False
+        )
+    except AuthError as e:
+        return {"error": e.args[0]}, e.code
     except Exception as e:
         return {"error": str(e)}, 503
 
@@ -0,0 +1,262 @@
+# asgi.py
+"""
+ASGI Entry Point
+GUNICORN_WORKER_CLASS=uvicorn gunicorn -c backend/gunicorn.conf.py backend.asgi:app
+
+Yüksek trafikli okuma endpoint'leri async engine üzerinde çalışır; DB'yi
+beklerken worker thread'i tutmazlar:
+    GET /events, /events/filter, /events/<id>, /organizations
+
+Sorgular, auth (verify_jwt) ve sayfalama (get_pagination_params) Flask view'larıyla
+aynı fonksiyonlardır (bkz. utils/async_db.py). Diğer tüm route'lar ve
+metodlar Flask uygulamasına (a2wsgi thread pool'u) düşer.
+
+Async route'lar Flask hook'larından geçmez; route metrikleri, SQL sayacı ve
+Server-Timing aynı endpoint adlarıyla instrumented() içinde kaydedilir.
+"""
+
+import os
+import time
+from contextlib import asynccontextmanager
+from functools import wraps
+
+from a2wsgi import WSGIMiddleware
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import Response
+from starlette.routing import Mount, Route
+
+# Bağlantı bütçesine async pool da dahil edilir (bkz. utils/db_pools.py)
+os.environ.setdefault("SERVER_ASGI", "true")
+
+from backend.app import app as flask_app
+from backend.api.events import (
+    EVENT_FILTER_FIELDS, EVENT_LIST_FIELDS, FILTER_CACHE_TAGS, filter_cache_key,
+    list_upcoming_events, load_event_detail, search_events
+)
+from backend.api.organizations import list_active_organizations
+from backend.utils.async_db import create_async_engines
+from backend.utils.auth_utils import AuthError, verify_jwt
+from backend.utils.cache import cache
+from backend.utils.compression import add_vary, compress_body, is_cacheable, negotiate, should_compress
+from backend.utils.db import STICKY_COOKIE, caller_key
+from backend.utils.fieldsets import FieldError
+from backend.utils.metrics import record_exception, record_request
+from backend.utils.pagination import get_pagination_params
+from backend.utils.response_formats import FormatError, negotiate_format, render_page
+from backend.utils.sql_accounting import (
+    DEFAULT_N_PLUS_ONE_THRESHOLD, log_repeated, server_timing_values, start_request_stats, stop_request_stats
+)
+
+
+def _send(request, body, media_type, status_code=200):
+    response = Response(body, status_code=status_code, media_type=media_type)
+
+    # Flask yolundaki after_request sıkıştırmasıyla aynı kurallar
+    if flask_app.config.get("COMPRESSION_ENABLED", True):
+        add_vary(response.headers)
+        encoding = negotiate(request.headers.get("accept-encoding"))
+        if encoding and should_compress(len(body), status_code, media_type, None):
+            response.body = compress_body(body, encoding, is_cacheable(request.method, status_code, None))
+            response.headers["Content-Encoding"] = encoding
+            response.headers["Content-Length"] = str(len(response.body))
+    return response
+
+
+def _json(request, data, status_code=200):
+    # Flask ile aynı JSON provider: datetime / Decimal çıktıları iki yolda da aynı
+    return _send(request, flask_app.json.dumps(data).encode(), "application/json", status_code)
+
+
+def _page(request, page, fields, fmt):
+    # ?fields= / Accept ile seçilen biçim (bkz. utils/response_formats.py)
+    body, media_type = render_page(page, fields, fmt, flask_app.json)
+    response = _send(request, body, media_type)
+    vary = response.headers.get("Vary")
+    response.headers["Vary"] = f"Accept, {vary}" if vary else "Accept"
+    return response
+
+
+def _use_primary(request):
+    # Son yazmadan sonra okumalar primary'den (bkz. utils/db.py, read-your-writes)
+    try:
+        return float(request.cookies.get(STICKY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+def _caller(request):
+    # Bu process'te yazan çağıran (cookie taşımayan istemciler için); replica yoksa gerekmez
+    if request.app.state.db.stickiness is None:
+        return None
+    return caller_key(request.headers, request.client.host if request.client else None)
+
+
+def instrumented(endpoint):
+    """
+    Records what the Flask request hooks record for their views: route
+    latency / status (/metrics), per-request SQL statistics and Server-Timing.
+
+    Args:
+        endpoint: Flask endpoint name of the equivalent view (same metric labels)
+    """
+    config = flask_app.config
+    metrics_enabled = config.get("METRICS_ENABLED", True)
+    sql_accounting = config.get("SQL_ACCOUNTING", True)
+    server_timing = config.get("SQL_SERVER_TIMING", False)
+    threshold = int(config.get("N_PLUS_ONE_THRESHOLD", DEFAULT_N_PLUS_ONE_THRESHOLD))
+
+    def decorator(handler):
+        @wraps(handler)
+        async def wrapper(request):
+            started = time.perf_counter()
+            stats, token = start_request_stats(endpoint) if sql_accounting else (None, None)
+            try:
+                response = await handler(request)
+            except Exception as e:
+                if metrics_enabled:
+                    record_exception(endpoint, e)
+                raise
+            finally:
+                if token is not None:
+                    stop_request_stats(token)
+
+            if stats is not None:
+                log_repeated(stats, request.method, request.url.path, threshold)
+                if server_timing:
+                    for value in server_timing_values(stats):
+                        response.headers.append("Server-Timing", value)
+
+            if metrics_enabled:
+                record_request(endpoint, request.method, response.status_code, time.perf_counter() - started)
+                exporter = getattr(flask_app, "metrics_exporter", None)
+                if exporter is not None:
+                    exporter.refresh()
+            return response
+        return wrapper
+    return decorator
+
+
+@instrumented("events.get_events")
+async def get_events(request):
+    """Async variant of GET /events/."""
+    try:
+        fmt = negotiate_format(request.headers.get("accept"), request.query_params.get("format"))
+        fields = EVENT_LIST_FIELDS.resolve(request.query_params.get("fields"))
+        result = await request.app.state.db.run_sync(
+            list_upcoming_events,
+            get_pagination_params(request.query_params),
+            fields,
+            use_primary=_use_primary(request),
+            caller=_caller(request)
+        )
+        return _page(request, result, fields, fmt)
+
+    except FieldError as e:
+        return _json(request, {"error": str(e)}, 400)
+    except FormatError as e:
+        return _json(request, {"error": str(e)}, 406)
+    except Exception as e:
+        return _json(request, {"error": str(e)}, 503)
+
+
+@instrumented("events.filter_events")
+async def filter_events(request):
+    """Async variant of GET /events/filter (same result cache as the Flask view)."""
+    try:
+        fmt = negotiate_format(request.headers.get("accept"), request.query_params.get("format"))
+        fields = EVENT_FILTER_FIELDS.resolve(request.query_params.get("fields"))
+        pagination = get_pagination_params(request.query_params)
+        use_primary = _use_primary(request)
+
+        def load():
+            return request.app.state.db.run_sync(
+                search_events, request.query_params, pagination, fields,
+                use_primary=use_primary, caller=_caller(request)
+            )
+
+        # Cache araması run_sync dışında: single-flight event loop'u bloklamaz
+        ttl = flask_app.config.get("EVENT_FILTER_CACHE_TTL", 0)
+        if ttl and not use_primary:
+            result = await cache.aget_or_set(
+                filter_cache_key(request.query_params, pagination, fields), load, ttl, FILTER_CACHE_TAGS
+            )
+        else:
+            result = await load()
+
+        return _page(request, result, fields, fmt)
+
+    except FieldError as e:
+        return _json(request, {"error": str(e)}, 400)
+    except FormatError as e:
+        return _json(request, {"error": str(e)}, 406)
+    except ValueError:
+        return _json(request, {"error": "Invalid format for price or ID fields"}, 400)
+    except Exception as e:
+        return _json(request, {"error": str(e)}, 503)
+
+
+@instrumented("events.get_event_by_id")
+async def get_event_by_id(request):
+    """Async variant of GET /events/<id>."""
+    try:
+        user_id = verify_jwt(request.headers)
+        event = await request.app.state.db.run_sync(
+            load_event_detail,
+            request.path_params["event_id"],
+            user_id,
+            use_primary=_use_primary(request),
+            caller=_caller(request)
+        )
+        return _json(request, event)
+
+    except AuthError as e:
+        return _json(request, {"error": e.args[0]}, e.code)
+    except Exception as e:
+        return _json(request, {"error": str(e)}, 503)
+
+
+@instrumented("organizations.get_organizations")
+async def get_organizations(request):
+    """Async variant of GET /organizations/."""
+    try:
+        result = await request.app.state.db.run_sync(
+            list_active_organizations,
+            get_pagination_params(request.query_params),
+            use_primary=_use_primary(request),
+            caller=_caller(request)
+        )
+        return _json(request, result)
+
+    except Exception as e:
+        return _json(request, {"error": str(e)}, 503)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # Async engine'ler worker'ın kendi event loop'unda oluşturulur (fork sonrası)
+    app.state.db = create_async_engines(flask_app.config, flask_app.engine)
+    yield
+    await app.state.db.dispose()
+
+
+READ_METHODS = ["GET", "HEAD"]
+
+routes = [
+    Route("/events", get_events, methods=READ_METHODS),
+    Route("/events/", get_events, methods=READ_METHODS),
+    Route("/events/filter", filter_events, methods=READ_METHODS),
+    Route("/events/{event_id:int}", get_event_by_id, methods=READ_METHODS),
+    Route("/organizations", get_organizations, methods=READ_METHODS),
+    Route("/organizations/", get_organizations, methods=READ_METHODS),
+    # Geri kalan her şey (ve yukarıdaki path'lerin yazma metodları) Flask'a
+    Mount("/", app=WSGIMiddleware(flask_app))
+]
+
+app = Starlette(
+    routes=routes,
+    # flask_cors ile aynı politika; header'lar set edilir (tekrarlanmaz)
+    middleware=[Middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])],
+    lifespan=lifespan
+)
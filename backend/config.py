@@ -4,6 +4,17 @@ Configuration settings for the application.
 import os
 
 
+def _pool_config(workload, size, max_overflow, recycle, timeout):
+    """DB_POOL_<WORKLOAD>_SIZE / _MAX_OVERFLOW / _RECYCLE / _TIMEOUT env değişkenlerini okur."""
+    prefix = f"DB_POOL_{workload.upper()}_"
+    return {
+        "size": int(os.getenv(prefix + "SIZE", size)),
+        "max_overflow": int(os.getenv(prefix + "MAX_OVERFLOW", max_overflow)),
+        "recycle": int(os.getenv(prefix + "RECYCLE", recycle)),
+        "timeout": float(os.getenv(prefix + "TIMEOUT", timeout))
+    }
+
+
 class Config:
     """Base configuration class."""
     
@@ -12,11 +23,111 @@ class Config:
     
     # Database
     DATABASE_URL = os.getenv("DATABASE_URL")
+    
+    # Opsiyonel okuma replica'sı (bkz. utils/db.py)
+    DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+    READ_YOUR_WRITES_SECONDS = int(os.getenv("READ_YOUR_WRITES_SECONDS", 5))
+    REPLICA_MAX_LAG_SECONDS = int(os.getenv("REPLICA_MAX_LAG_SECONDS", 5))
+    REPLICA_LAG_CHECK_INTERVAL = int(os.getenv("REPLICA_LAG_CHECK_INTERVAL", 5))
+    # Replica kullanıcısında REPLICATION CLIENT yetkisi yoksa lag ölçülemez; varsayılan
+    # olarak okumalar primary'ye gider. true: gecikme yok kabul edilip replica kullanılır
+    REPLICA_ASSUME_NO_LAG = os.getenv("REPLICA_ASSUME_NO_LAG", "false").lower() == "true"
+    
+    # İş yüküne göre ayrılmış connection pool'ları (bkz. utils/db_pools.py)
+    DB_POOLS = {
+        "interactive": _pool_config("interactive", size=10, max_overflow=10, recycle=1800, timeout=5),
+        "admin": _pool_config("admin", size=3, max_overflow=2, recycle=1800, timeout=15),
+        "background": _pool_config("background", size=2, max_overflow=1, recycle=1800, timeout=30)
+    }
+    # Instance'ın DB sunucusu başına açabileceği toplam bağlantı (0: sınırsız). Worker
+    # sayısına bölünür, pool'lar gerekirse oranla küçültülür (bkz. utils/db_pools.py).
+    # Birden fazla instance varsa MySQL max_connections / instance sayısı verilmeli.
+    DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", 120))
+    # Başlangıçta her pool için açılacak bağlantı sayısı (pool size ile sınırlı)
+    DB_POOL_PREWARM = int(os.getenv("DB_POOL_PREWARM", 2))
+    
+    # İstek başına SQL sayacı (bkz. utils/sql_accounting.py)
+    SQL_ACCOUNTING = os.getenv("SQL_ACCOUNTING", "true").lower() == "true"
+    SQL_SERVER_TIMING = os.getenv("SQL_SERVER_TIMING", "false").lower() == "true"
+    N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", 5))
+
+    # Process genelinde sorgu fingerprint istatistikleri (bkz. utils/query_stats.py)
+    QUERY_STATS_ENABLED = os.getenv("QUERY_STATS_ENABLED", "true").lower() == "true"
+    QUERY_STATS_MAX_ENTRIES = int(os.getenv("QUERY_STATS_MAX_ENTRIES", 500))
+    QUERY_STATS_DIR = os.getenv("QUERY_STATS_DIR", "/tmp/etkinlink-query-stats")
+    QUERY_STATS_FLUSH_SECONDS = int(os.getenv("QUERY_STATS_FLUSH_SECONDS", 10))
+
+    # Prometheus /metrics (bkz. utils/metrics.py). Çoklu worker için
+    # PROMETHEUS_MULTIPROC_DIR ortam değişkeni process başlamadan ayarlanmalı.
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+    # Scheduler job'larını cluster'da tek process çalıştırır (bkz. utils/leader.py)
+    SCHEDULER_LEADER_ELECTION = os.getenv("SCHEDULER_LEADER_ELECTION", "true").lower() == "true"
+    SCHEDULER_LEASE_TTL = int(os.getenv("SCHEDULER_LEASE_TTL", 60))
+    # Lider seçimi kapalıyken gunicorn worker'ları arasında tek scheduler için kilit dosyası
+    SCHEDULER_LOCK_FILE = os.getenv("SCHEDULER_LOCK_FILE", "/tmp/etkinlink-scheduler.lock")
+
+    # Bitmiş event'lerin status sıkıştırması: batch başına id aralığı
+    EVENT_STATUS_CHUNK_SIZE = int(os.getenv("EVENT_STATUS_CHUNK_SIZE", 1000))
+
+    # ASGI yolunun async engine pool'u (bkz. utils/async_db.py, backend/asgi.py)
+    ASYNC_DB_POOL_SIZE = int(os.getenv("ASYNC_DB_POOL_SIZE", 20))
+    ASYNC_DB_MAX_OVERFLOW = int(os.getenv("ASYNC_DB_MAX_OVERFLOW", 10))
+    ASYNC_DB_POOL_TIMEOUT = int(os.getenv("ASYNC_DB_POOL_TIMEOUT", 10))
+
+    # JSON serileştirme (bkz. utils/json_provider.py). http: mevcut RFC 822
+    # tarih formatı, iso: ISO 8601 (daha hızlı, istemci uyumu kontrol edilmeli)
+    JSON_PROVIDER = os.getenv("JSON_PROVIDER", "orjson")
+    JSON_DATETIME_FORMAT = os.getenv("JSON_DATETIME_FORMAT", "http")
+
+    # Yanıt sıkıştırma (bkz. utils/compression.py)
+    COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+    COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))
+    COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 4))
+    # Sıkıştırılmış gövde cache'i (0: kapalı)
+    COMPRESSION_CACHE_BYTES = int(os.getenv("COMPRESSION_CACHE_BYTES", 32 * 1024 * 1024))
+
+    # Ortak cache (bkz. utils/cache.py). local: process içi LRU | redis: paylaşımlı
+    # CACHE_REDIS_URL=memory:// sunucusuz Redis taklidini kullanır
+    CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "local")
+    CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+    CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", 10000))
+    # local backend: değerlerin serileştirilmiş boyutuna göre yaklaşık bellek sınırı (0: sınırsız)
+    CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", 64 * 1024 * 1024))
+    CACHE_KEY_PREFIX = os.getenv("CACHE_KEY_PREFIX", "etkinlink:cache:")
+    CACHE_LOCK_TIMEOUT = float(os.getenv("CACHE_LOCK_TIMEOUT", 5))
+    # /events/filter sonuç cache'inin süresi (saniye, 0: kapalı)
+    EVENT_FILTER_CACHE_TTL = int(os.getenv("EVENT_FILTER_CACHE_TTL", 5))
+
+    # Blueprint kaydı: scan (api/ paketini tara) | static (api.BLUEPRINTS listesi)
+    BLUEPRINT_REGISTRY = os.getenv("BLUEPRINT_REGISTRY", "scan")
 
     
     # Application
     PORT = int(os.getenv("PORT", 8000))
     
+    # Refresh token lifetime (days)
+    REFRESH_TOKEN_EXPIRES_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRES_DAYS", 30))
+    
+    # Scheduler'ın her çalışmada yeniden hesapladığı rollup gün sayısı
+    ROLLUP_REBUILD_DAYS = int(os.getenv("ROLLUP_REBUILD_DAYS", 2))
+    
+    # Admin dashboard sayaçlarının cache süresi (saniye)
+    ADMIN_COUNTERS_TTL = int(os.getenv("ADMIN_COUNTERS_TTL", 30))
+    
+    # Attendance analytics snapshot'ının yenilenme süresi (saniye)
+    ANALYTICS_SNAPSHOT_TTL = int(os.getenv("ANALYTICS_SNAPSHOT_TTL", 300))
+    
+    # Columnar analytics store (bkz. utils/columnar_store.py)
+    ANALYTICS_EXPORT_DIR = os.getenv("ANALYTICS_EXPORT_DIR", "/tmp/etkinlink-analytics")
+    ANALYTICS_EXPORT_INTERVAL_MINUTES = int(os.getenv("ANALYTICS_EXPORT_INTERVAL_MINUTES", 15))
+    # auto: store güncelse (son 2 export aralığı) store, değilse DB | store | db
+    # Store instance'a lokaldir; her host kendi export'unu dosya kilidiyle tek worker'da çalıştırır
+    ANALYTICS_SOURCE = os.getenv("ANALYTICS_SOURCE", "auto")
+    
     # Frontend URL for password reset emails
     FRONTEND_URL = os.getenv('FRONTEND_URL', 'http://localhost:3000')
 
@@ -24,11 +135,14 @@ class Config:
 class DevelopmentConfig(Config):
     """Development environment configuration."""
     DEBUG = True
+    SQL_SERVER_TIMING = os.getenv("SQL_SERVER_TIMING", "true").lower() == "true"
 
 
 class ProductionConfig(Config):
     """Production environment configuration."""
     DEBUG = False
+    # Cold start: paket taraması yerine sabit liste
+    BLUEPRINT_REGISTRY = os.getenv("BLUEPRINT_REGISTRY", "static")
 
 
 # Configuration dictionary
@@ -0,0 +1,119 @@
+# gunicorn.conf.py
+"""
+Production Server Settings
+gunicorn -c backend/gunicorn.conf.py backend.wsgi:app
+
+Ortam değişkenleri:
+    PORT                      Dinlenecek port (varsayılan 8000)
+    GUNICORN_WORKER_CLASS     sync | gthread | gevent | uvicorn (varsayılan gthread; gevent paketi ayrıca kurulmalı,
+                              uvicorn ASGI uygulamasıyla kullanılır: backend.asgi:app)
+    WEB_CONCURRENCY           Worker sayısı (varsayılan: 2 * CPU + 1, GUNICORN_MAX_WORKERS ile sınırlı)
+    GUNICORN_THREADS          gthread worker başına thread (varsayılan 4)
+    GUNICORN_PRELOAD          Uygulamayı master'da bir kez yükle (varsayılan true)
+    GUNICORN_TIMEOUT, GUNICORN_MAX_REQUESTS
+    DB_MAX_CONNECTIONS        Instance'ın DB sunucusu başına bağlantı bütçesi; worker'lar arasında
+                              bölünür (bkz. utils/db_pools.py)
+
+Fork güvenliği:
+- SERVER_PREFORK=true: app import edilirken pool prewarm ve scheduler başlatılmaz
+- post_fork: master'dan miras kalan engine'ler close=False ile bırakılır (soket
+  paylaşılmaz), ardından worker kendi pool'larını ısıtır ve scheduler'ını başlatır
+- Master thread başlatmaz; worker'lar tek thread'li bir process'ten fork edilir
+- Job'ları her worker'ın scheduler'ı değil, seçilen lider çalıştırır
+  (lease veya lider seçimi kapalıyken dosya kilidi, bkz. utils/leader.py).
+  Lider worker yenilenir/ölürse liderliği sıradaki worker'ın heartbeat'i alır
+"""
+
+import multiprocessing
+import os
+import shutil
+
+# App import edilmeden önce ayarlanmalı (bkz. backend/app.py, utils/metrics.py)
+os.environ["SERVER_PREFORK"] = "true"
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/etkinlink-prometheus")
+
+WORKER_CLASSES = ("sync", "gthread", "gevent", "uvicorn")
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+if worker_class not in WORKER_CLASSES:
+    raise ValueError(f"GUNICORN_WORKER_CLASS must be one of: {', '.join(WORKER_CLASSES)}")
+
+workers = int(os.getenv(
+    "WEB_CONCURRENCY",
+    min(multiprocessing.cpu_count() * 2 + 1, int(os.getenv("GUNICORN_MAX_WORKERS", 12)))
+))
+threads = int(os.getenv("GUNICORN_THREADS", 4)) if worker_class == "gthread" else 1
+if worker_class == "gevent":
+    worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", 100))
+worker_label = worker_class
+if worker_class == "uvicorn":
+    # Async endpoint'ler event loop'ta, diğerleri a2wsgi thread pool'unda (bkz. backend/asgi.py)
+    worker_class = "uvicorn_worker.UvicornWorker"
+
+# Pool'lar bu sayıya göre boyutlandırılır (bkz. utils/db_pools.py)
+os.environ["SERVER_WORKERS"] = str(workers)
+
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 60))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+
+# Bellek sızıntılarına karşı worker'lar periyodik olarak yenilenir
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 2000))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 200))
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+
+def _reset_dir(path):
+    if path and os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    if path:
+        os.makedirs(path, exist_ok=True)
+
+
+# Önceki çalıştırmadan kalan metrik / sorgu istatistiği dosyaları temizlenir
+# (preload'dan önce, config yüklenirken)
+_reset_dir(os.environ["PROMETHEUS_MULTIPROC_DIR"])
+_reset_dir(os.getenv("QUERY_STATS_DIR", "/tmp/etkinlink-query-stats"))
+
+
+def when_ready(server):
+    server.log.info(
+        f"Serving with {workers} {worker_label} worker(s)"
+        + (f" x {threads} threads" if worker_class == "gthread" else "")
+        + (", app preloaded" if preload_app else "")
+    )
+
+
+def post_fork(server, worker):
+    from backend.app import app, init_app_scheduler
+    from backend.utils.db import prewarm_pools
+
+    # Master'ın bağlantıları kapatılmadan bırakılır; worker kendi pool'unu açar
+    app.engine.dispose(close=False)
+    prewarm_pools(app)
+    init_app_scheduler()
+
+
+def worker_exit(server, worker):
+    from backend.app import app
+
+    # Lider worker liderliği hemen bırakır; sıradaki heartbeat devralır
+    scheduler = getattr(app, "_scheduler", None)
+    if scheduler:
+        scheduler.shutdown(wait=False)
+    elector = getattr(app, "_scheduler_leader", None)
+    if elector:
+        elector.release()
+
+
+def child_exit(server, worker):
+    from backend.utils.metrics import mark_worker_dead
+
+    mark_worker_dead(worker.pid)
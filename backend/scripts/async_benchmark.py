@@ -0,0 +1,290 @@
+# scripts/async_benchmark.py
+"""
+Sync vs Async Concurrency Benchmark
+Aynı okuma endpoint'lerini tek bir worker'ın iki hâline karşı yük altında ölçer:
+
+- sync:  Flask uygulaması, GUNICORN_THREADS kadar thread'li bir gthread worker
+         gibi (aynı anda en fazla --threads istek işlenir)
+- async: backend/asgi.py, tek event loop (uvicorn worker'ı gibi)
+
+Her sorguya --latency-ms kadar yapay DB gecikmesi eklenir (before_cursor_execute;
+sync engine'de time.sleep, async engine'de await edilen asyncio.sleep). Böylece
+lokal veritabanıyla da ağ / replica gecikmesi altındaki davranış görülür.
+Her eşzamanlılık seviyesi için throughput, p50/p95/p99 gecikme ve Little
+yasasıyla worker'ın fiilen eşzamanlı işlediği istek sayısı raporlanır.
+
+Sonuç cache'i (filter sonuçları, admin sayaçları) varsayılan olarak kapalıdır,
+yoksa filter istekleri DB yerine cache hit'lerini ölçer; --with-cache ile açılır.
+
+Kullanım:
+    python -m backend.scripts.generate_dataset --scale 0.1
+    python -m backend.scripts.async_benchmark --latency-ms 20 --concurrency 1 8 32 128
+    python -m backend.scripts.async_benchmark --path "/events/filter?type=workshop" --output async-bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+# Benchmark sırasında scheduler job'ları ölçümleri bozmasın
+os.environ.setdefault("SKIP_SCHEDULER", "true")
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.util import await_only  # noqa: E402
+
+from backend.asgi import app as asgi_app  # noqa: E402
+from backend.app import app as flask_app  # noqa: E402
+from backend.utils.cache import cache  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATHS = ("/events/", "/events/filter?only_girls=1", "/organizations/")
+DEFAULT_CONCURRENCY = (1, 8, 32, 128)
+DEFAULT_DURATION = 5.0
+DEFAULT_LATENCY_MS = 20.0
+
+
+# -------------------------------------------------------------------
+# Yapay DB gecikmesi
+# -------------------------------------------------------------------
+def inject_latency(sync_engine, seconds, is_async=False):
+    """Adds `seconds` of simulated network latency before every statement."""
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _delay(conn, cursor, statement, parameters, context, executemany):
+        if is_async:
+            # run_sync greenlet'i içindeyiz: event loop'a geri verilerek beklenir
+            await_only(asyncio.sleep(seconds))
+        else:
+            time.sleep(seconds)
+
+
+# -------------------------------------------------------------------
+# Yük üreticiler
+# -------------------------------------------------------------------
+class Recorder:
+    def __init__(self):
+        self.latencies = []
+        self.service = []
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds, status, service=None):
+        with self._lock:
+            self.latencies.append(seconds)
+            self.service.append(seconds if service is None else service)
+            if status >= 400:
+                self.errors += 1
+
+    def summary(self, elapsed):
+        if not self.latencies:
+            return {"requests": 0, "errors": self.errors}
+        ms = np.array(self.latencies) * 1000
+        rps = len(ms) / elapsed
+        return {
+            "requests": len(ms),
+            "errors": self.errors,
+            "throughput_rps": round(rps, 1),
+            "p50_ms": round(float(np.percentile(ms, 50)), 2),
+            "p95_ms": round(float(np.percentile(ms, 95)), 2),
+            "p99_ms": round(float(np.percentile(ms, 99)), 2),
+            # Little yasası: worker'ın ortalama eşzamanlı işlediği istek (kuyruk hariç)
+            "in_flight": round(rps * float(np.mean(self.service)), 1)
+        }
+
+
+def run_sync_worker(paths, concurrency, duration, threads, headers=None):
+    """`concurrency` clients against one Flask worker with `threads` request threads."""
+    recorder = Recorder()
+    slots = threading.BoundedSemaphore(threads)
+    deadline = time.perf_counter() + duration
+
+    def client(i):
+        http = flask_app.test_client()
+        n = i
+        while time.perf_counter() < deadline:
+            path = paths[n % len(paths)]
+            n += 1
+            started = time.perf_counter()
+            # Worker thread'i meşgulse istek kuyrukta bekler (gecikmeye dahil)
+            with slots:
+                served = time.perf_counter()
+                status = http.get(path, headers=headers).status_code
+            finished = time.perf_counter()
+            recorder.record(finished - started, status, finished - served)
+
+    started = time.perf_counter()
+    clients = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    for t in clients:
+        t.start()
+    for t in clients:
+        t.join()
+    return recorder.summary(time.perf_counter() - started)
+
+
+async def _asgi_get(app, path, headers=None):
+    raw_path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": raw_path,
+        "raw_path": raw_path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"benchmark")] + [
+            (k.lower().encode(), v.encode()) for k, v in (headers or {}).items()
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": ("benchmark", 80),
+        "state": {},
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def run_async_worker(paths, concurrency, duration, headers=None):
+    """`concurrency` clients against one event loop serving backend/asgi.py."""
+    recorder = Recorder()
+    deadline = time.perf_counter() + duration
+
+    async def client(i):
+        n = i
+        while time.perf_counter() < deadline:
+            path = paths[n % len(paths)]
+            n += 1
+            started = time.perf_counter()
+            status = await _asgi_get(asgi_app, path, headers)
+            recorder.record(time.perf_counter() - started, status)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(concurrency)))
+    return recorder.summary(time.perf_counter() - started)
+
+
+# -------------------------------------------------------------------
+# Çalıştırma
+# -------------------------------------------------------------------
+def run(paths=DEFAULT_PATHS, concurrency=DEFAULT_CONCURRENCY, duration=DEFAULT_DURATION,
+        latency_ms=DEFAULT_LATENCY_MS, threads=4, async_pool_size=None, token=None, with_cache=False):
+    headers = {"Authorization": f"Bearer {token}"} if token else None
+    seconds = latency_ms / 1000
+    cache.enabled = cache.enabled and with_cache
+
+    for _, _, engine in flask_app.engine.all_engines():
+        inject_latency(engine, seconds)
+
+    if async_pool_size:
+        flask_app.config["ASYNC_DB_POOL_SIZE"] = async_pool_size
+
+    async def run_async_levels():
+        results = {}
+        async with asgi_app.router.lifespan_context(asgi_app):
+            db = asgi_app.state.db
+            for engine in filter(None, (db.primary, db.replica)):
+                inject_latency(engine.sync_engine, seconds, is_async=True)
+
+            # Pool ve import ısınması
+            await run_async_worker(paths, 1, 0.2, headers)
+            for level in concurrency:
+                logger.info(f"async: concurrency={level}")
+                results[level] = await run_async_worker(paths, level, duration, headers)
+        return results
+
+    run_sync_worker(paths, 1, 0.2, threads, headers)
+    sync_results = {}
+    for level in concurrency:
+        logger.info(f"sync: concurrency={level} threads={threads}")
+        sync_results[level] = run_sync_worker(paths, level, duration, threads, headers)
+
+    async_results = asyncio.run(run_async_levels())
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "paths": list(paths),
+            "duration_seconds": duration,
+            "simulated_db_latency_ms": latency_ms,
+            "sync_threads": threads,
+            "cache": "warm" if cache.enabled else "cold",
+            "async_pool_size": int(flask_app.config.get("ASYNC_DB_POOL_SIZE", 20)),
+            "async_max_overflow": int(flask_app.config.get("ASYNC_DB_MAX_OVERFLOW", 10))
+        },
+        "levels": [
+            {"concurrency": level, "sync": sync_results[level], "async": async_results[level]}
+            for level in concurrency
+        ]
+    }
+
+
+def _print_report(result):
+    meta = result["meta"]
+    print(
+        f"\nsimulated DB latency {meta['simulated_db_latency_ms']} ms, "
+        f"sync worker {meta['sync_threads']} threads, async pool {meta['async_pool_size']}+{meta['async_max_overflow']}, "
+        f"{meta['cache']} cache"
+    )
+    print(f"{'clients':>8} | {'sync rps':>9}{'p95':>9}{'inflight':>9}{'err':>5} | {'async rps':>9}{'p95':>9}{'inflight':>9}{'err':>5}")
+    for row in result["levels"]:
+        cells = []
+        for side in ("sync", "async"):
+            r = row[side]
+            if not r.get("requests"):
+                cells.append(f"{'-':>9}{'-':>9}{'-':>9}{r.get('errors', 0):>5}")
+                continue
+            cells.append(f"{r['throughput_rps']:>9.1f}{r['p95_ms']:>9.1f}{r['in_flight']:>9.1f}{r['errors']:>5}")
+        print(f"{row['concurrency']:>8} | {cells[0]} | {cells[1]}")
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    parser = argparse.ArgumentParser(description="Compare per-worker concurrency of the sync and async read paths.")
+    parser.add_argument("--path", dest="paths", nargs="*", default=list(DEFAULT_PATHS),
+                        help="GET paths requested round-robin by each client")
+    parser.add_argument("--concurrency", nargs="*", type=int, default=list(DEFAULT_CONCURRENCY))
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="Seconds per level")
+    parser.add_argument("--latency-ms", type=float, default=DEFAULT_LATENCY_MS, help="Simulated latency per statement")
+    parser.add_argument("--threads", type=int, default=int(os.getenv("GUNICORN_THREADS", 4)),
+                        help="Request threads of the simulated sync worker")
+    parser.add_argument("--async-pool-size", type=int, help="Override ASYNC_DB_POOL_SIZE")
+    parser.add_argument("--token", help="Bearer token (for /events/<id>)")
+    parser.add_argument("--output", help="Write the result as JSON")
+    parser.add_argument("--with-cache", action="store_true",
+                        help="Keep the result cache on (filter requests become cache hits)")
+    args = parser.parse_args(argv)
+
+    result = run(
+        args.paths, args.concurrency, args.duration, args.latency_ms,
+        args.threads, args.async_pool_size, args.token, args.with_cache
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+        logger.info(f"Results written to {args.output}")
+
+    _print_report(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,491 @@
+# scripts/benchmark.py
+"""
+Endpoint Benchmark Suite
+Sık kullanılan endpoint'leri Flask test client'ı üzerinden, seed'lenmiş
+lokal veritabanına karşı çalıştırır ve senaryo başına p50/p95/p99 gecikme,
+throughput ve istek başına sorgu sayısını raporlar.
+
+Sonuçlar JSON olarak kaydedilir; --baseline ile verilen önceki bir sonuçla
+karşılaştırılır ve eşiği aşan gerilemelerde çıkış kodu 1 olur (CI için).
+
+Kullanım:
+    python -m backend.scripts.generate_dataset --scale 0.1
+    python -m backend.scripts.benchmark --output bench.json --save-baseline baseline.json
+    python -m backend.scripts.benchmark --baseline baseline.json --threshold 0.15
+
+Yazma senaryoları (register, check-in) her iterasyonda farklı bir etkinlik /
+bilet kullanır ve sonunda yaptıkları değişiklikleri geri alır.
+
+Sonuç cache'i (filter sonuçları, admin sayaçları) varsayılan olarak kapalıdır;
+aksi halde filter / admin senaryoları cache hit'lerini ölçer (soğuk yol).
+Sıcak yolu ölçmek için --with-cache verilir; iki mod birbiriyle karşılaştırılmaz.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+# Benchmark sırasında scheduler job'ları ölçümleri bozmasın
+os.environ.setdefault("SKIP_SCHEDULER", "true")
+
+from sqlalchemy import text  # noqa: E402
+
+from backend.app import app  # noqa: E402
+from backend.utils.cache import cache  # noqa: E402
+from backend.utils.rollups import record_attendance  # noqa: E402
+from backend.utils.session_service import create_access_token  # noqa: E402
+from backend.utils.sql_accounting import query_budget  # noqa: E402
+from backend.utils.user_activity import record_user_attendance_removed  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ITERATIONS = 200
+DEFAULT_WARMUP = 20
+DEFAULT_THRESHOLD = 0.10
+
+
+class Scenario:
+    """
+    One benchmarked request shape.
+
+    Args:
+        name: Result key (e.g. "events.filter.type")
+        build: callable(i) -> dict(method, path, json=None, headers=None)
+        expect: Acceptable status codes
+        teardown: Optional callable run once after the scenario
+        max_iterations: Cap for scenarios backed by a finite fixture pool
+    """
+
+    def __init__(self, name, build, expect=(200,), teardown=None, max_iterations=None):
+        self.name = name
+        self.build = build
+        self.expect = expect
+        self.teardown = teardown
+        self.max_iterations = max_iterations
+
+
+# -------------------------------------------------------------------
+# Fixture'lar
+# -------------------------------------------------------------------
+def _discover_fixtures(engine, iterations, password):
+    """Picks users, events and tickets from the seeded database."""
+    with engine.connect() as conn:
+        admin_id = conn.execute(text("SELECT id FROM users WHERE role = 'ADMIN' ORDER BY id LIMIT 1")).scalar()
+
+        user = conn.execute(text("""
+            SELECT id, email, gender FROM users
+            WHERE role = 'USER' AND is_blocked = FALSE AND username LIKE 'user%'
+            ORDER BY id LIMIT 1
+        """)).fetchone()
+
+        popular_events = [row.event_id for row in conn.execute(text("""
+            SELECT event_id FROM participants
+            GROUP BY event_id
+            ORDER BY COUNT(*) DESC
+            LIMIT 50
+        """))]
+
+        register_events = []
+        if user is not None:
+            register_events = [row.id for row in conn.execute(text("""
+                SELECT e.id FROM events e
+                WHERE e.status = 'FUTURE'
+                  AND e.has_register = 0
+                  AND e.user_limit IS NULL
+                  AND (e.only_girls = 0 OR :gender = 'FEMALE')
+                  AND NOT EXISTS (SELECT 1 FROM participants p WHERE p.event_id = e.id AND p.user_id = :uid)
+                  AND NOT EXISTS (SELECT 1 FROM applications a WHERE a.event_id = e.id AND a.user_id = :uid)
+                ORDER BY e.id
+                LIMIT :limit
+            """), {"uid": user.id, "gender": user.gender, "limit": iterations})]
+
+        # Check-in: NO_SHOW katılımcısı en çok olan FUTURE etkinliğin sahibi
+        checkin_event = conn.execute(text("""
+            SELECT e.id, e.owner_user_id
+            FROM events e
+            JOIN participants p ON p.event_id = e.id AND p.status = 'NO_SHOW'
+            WHERE e.status = 'FUTURE'
+            GROUP BY e.id, e.owner_user_id
+            ORDER BY COUNT(*) DESC
+            LIMIT 1
+        """)).fetchone()
+
+        tickets = []
+        if checkin_event is not None:
+            tickets = [tuple(row) for row in conn.execute(text("""
+                SELECT ticket_code, user_id FROM participants
+                WHERE event_id = :eid AND status = 'NO_SHOW'
+                ORDER BY id
+                LIMIT :limit
+            """), {"eid": checkin_event.id, "limit": iterations})]
+
+        university_id = conn.execute(text("""
+            SELECT university_id FROM users
+            WHERE university_id IS NOT NULL
+            GROUP BY university_id
+            ORDER BY COUNT(*) DESC
+            LIMIT 1
+        """)).scalar()
+
+    with app.app_context():
+        return {
+            "admin_token": create_access_token(admin_id) if admin_id else None,
+            "user": user,
+            "user_token": create_access_token(user.id) if user is not None else None,
+            "password": password,
+            "popular_events": popular_events,
+            "register_events": register_events,
+            "checkin_event": checkin_event,
+            "checkin_token": create_access_token(checkin_event.owner_user_id) if checkin_event else None,
+            "tickets": tickets,
+            "university_id": university_id
+        }
+
+
+def _bearer(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _build_scenarios(engine, fx):
+    scenarios = [
+        Scenario("events.list", lambda i: {"method": "GET", "path": "/events/?page=1&per_page=20"}),
+        Scenario("events.list.deep_page", lambda i: {"method": "GET", "path": "/events/?page=50&per_page=20"}),
+        Scenario("events.filter.type", lambda i: {"method": "GET", "path": "/events/filter?type=TECH"}),
+        Scenario("events.filter.search", lambda i: {"method": "GET", "path": "/events/filter?q=Meetup"}),
+        Scenario("events.filter.upcoming_free", lambda i: {
+            "method": "GET", "path": "/events/filter?status=FUTURE&min_price=0&max_price=0"
+        }),
+        Scenario("events.filter.date_range", lambda i: {
+            "method": "GET",
+            "path": f"/events/filter?from={datetime.now():%Y-%m-%d}&to={datetime.now().year + 1}-01-01"
+        })
+    ]
+
+    if fx["university_id"]:
+        scenarios.append(Scenario("events.filter.university_past", lambda i: {
+            "method": "GET", "path": f"/events/filter?university={fx['university_id']}&past_events=true"
+        }))
+
+    if fx["popular_events"]:
+        events = fx["popular_events"]
+        scenarios.append(Scenario("events.detail", lambda i: {
+            "method": "GET", "path": f"/events/{events[i % len(events)]}",
+            "headers": _bearer(fx["user_token"]) if fx["user_token"] else None
+        }))
+
+    if fx["user"] is not None:
+        scenarios.append(Scenario("auth.login", lambda i: {
+            "method": "POST", "path": "/auth/login",
+            "json": {"email": fx["user"].email, "password": fx["password"]}
+        }, teardown=lambda: _cleanup_sessions(engine, fx["user"].id)))
+
+    if fx["register_events"]:
+        events = fx["register_events"]
+        scenarios.append(Scenario("events.register", lambda i: {
+            "method": "POST", "path": f"/events/{events[i]}/register",
+            "headers": _bearer(fx["user_token"])
+        }, expect=(201,), teardown=lambda: _cleanup_registrations(events, fx), max_iterations=len(events)))
+
+    if fx["tickets"]:
+        tickets = fx["tickets"]
+        event_id = fx["checkin_event"].id
+        scenarios.append(Scenario("events.check_in", lambda i: {
+            "method": "POST", "path": f"/events/{event_id}/check-in",
+            "json": {"ticket_code": tickets[i][0]}, "headers": _bearer(fx["checkin_token"])
+        }, teardown=lambda: _cleanup_check_ins(engine, event_id, tickets), max_iterations=len(tickets)))
+
+    if fx["admin_token"]:
+        admin = _bearer(fx["admin_token"])
+        scenarios += [
+            Scenario("admin.overview.summary", lambda i: {
+                "method": "GET", "path": "/admin/overview/summary", "headers": admin
+            }),
+            Scenario("admin.overview.charts", lambda i: {
+                "method": "GET", "path": "/admin/overview/charts", "headers": admin
+            }),
+            Scenario("admin.attendance.stats", lambda i: {
+                "method": "GET", "path": "/admin/attendance/stats", "headers": admin
+            }),
+            Scenario("admin.users.most_active", lambda i: {
+                "method": "GET", "path": "/admin/users/most-active", "headers": admin
+            })
+        ]
+
+    return scenarios
+
+
+# -------------------------------------------------------------------
+# Yazma senaryolarını geri alma
+# -------------------------------------------------------------------
+def _cleanup_sessions(engine, user_id):
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM user_sessions WHERE user_id = :uid"), {"uid": user_id})
+
+
+def _cleanup_registrations(event_ids, fx):
+    # Uygulamanın kendi "etkinlikten ayrıl" yolu rollup'ları da geri alır
+    client = app.test_client()
+    for event_id in event_ids:
+        client.delete(f"/events/{event_id}/participants/{fx['user'].id}", headers=_bearer(fx["user_token"]))
+
+
+def _cleanup_check_ins(engine, event_id, tickets):
+    with engine.begin() as conn:
+        for ticket_code, user_id in tickets:
+            reverted = conn.execute(text("""
+                UPDATE participants SET status = 'NO_SHOW'
+                WHERE ticket_code = :ticket AND status = 'ATTENDED'
+            """), {"ticket": ticket_code}).rowcount
+            if reverted:
+                record_attendance(conn, event_id, -1)
+                record_user_attendance_removed(conn, user_id, event_id)
+
+
+# -------------------------------------------------------------------
+# Ölçüm
+# -------------------------------------------------------------------
+def _send(client, spec):
+    return client.open(
+        spec["path"], method=spec["method"], json=spec.get("json"), headers=spec.get("headers") or {}
+    )
+
+
+def run_scenario(scenario, iterations, warmup):
+    """
+    Runs one scenario sequentially.
+
+    Returns:
+        dict: latency percentiles (ms), throughput, queries per request, status counts
+    """
+    client = app.test_client()
+    limit = iterations + warmup
+    if scenario.max_iterations is not None:
+        limit = min(limit, scenario.max_iterations)
+        warmup = min(warmup, limit // 5)
+
+    latencies = []
+    queries = []
+    statuses = {}
+    errors = 0
+    started = None
+
+    try:
+        for i in range(limit):
+            spec = scenario.build(i)
+            if i == warmup:
+                started = time.perf_counter()
+
+            with query_budget() as stats:
+                t0 = time.perf_counter()
+                response = _send(client, spec)
+                elapsed = time.perf_counter() - t0
+
+            if i < warmup:
+                continue
+
+            latencies.append(elapsed * 1000)
+            queries.append(stats.count)
+            statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+            if response.status_code not in scenario.expect:
+                errors += 1
+                if errors == 1:
+                    logger.warning(
+                        f"{scenario.name}: unexpected {response.status_code} {response.get_data(as_text=True)[:200]}"
+                    )
+    finally:
+        if scenario.teardown is not None:
+            scenario.teardown()
+
+    wall = time.perf_counter() - started if started is not None else 0.0
+    if not latencies:
+        return {"iterations": 0, "errors": errors, "status_codes": statuses}
+
+    values = np.array(latencies)
+    return {
+        "iterations": len(latencies),
+        "p50_ms": round(float(np.percentile(values, 50)), 3),
+        "p95_ms": round(float(np.percentile(values, 95)), 3),
+        "p99_ms": round(float(np.percentile(values, 99)), 3),
+        "mean_ms": round(float(values.mean()), 3),
+        "max_ms": round(float(values.max()), 3),
+        "throughput_rps": round(len(latencies) / wall, 2) if wall else None,
+        "queries_per_request": round(float(np.mean(queries)), 2),
+        "errors": errors,
+        "status_codes": statuses
+    }
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compares two result documents.
+
+    Returns:
+        list: regressions as dicts (scenario, metric, baseline, current, change)
+    """
+    regressions = []
+    for name, result in current["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base or not result.get("iterations") or not base.get("iterations"):
+            continue
+
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            if base[metric] and result[metric] > base[metric] * (1 + threshold):
+                regressions.append(_regression(name, metric, base[metric], result[metric]))
+
+        if base.get("throughput_rps") and result.get("throughput_rps") is not None:
+            if result["throughput_rps"] < base["throughput_rps"] * (1 - threshold):
+                regressions.append(_regression(name, "throughput_rps", base["throughput_rps"], result["throughput_rps"]))
+
+        # Sorgu sayısı deterministiktir: herhangi bir artış gerilemedir (ör. yeni N+1)
+        if result["queries_per_request"] > base["queries_per_request"] + 0.01:
+            regressions.append(_regression(
+                name, "queries_per_request", base["queries_per_request"], result["queries_per_request"]
+            ))
+
+        if result["errors"] > base.get("errors", 0):
+            regressions.append(_regression(name, "errors", base.get("errors", 0), result["errors"]))
+
+    return regressions
+
+
+def _regression(name, metric, base, current):
+    change = (current - base) / base if base else None
+    return {
+        "scenario": name,
+        "metric": metric,
+        "baseline": base,
+        "current": current,
+        "change": round(change * 100, 1) if change is not None else None
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+def run(iterations=DEFAULT_ITERATIONS, warmup=DEFAULT_WARMUP, only=None, password="Password123!",
+        with_cache=False):
+    """
+    Runs all (or the selected) scenarios and returns the result document.
+    The result cache is disabled unless `with_cache` (warm path) is set.
+    """
+    engine = app.engine
+    fx = _discover_fixtures(engine, iterations + warmup, password)
+    scenarios = [s for s in _build_scenarios(engine, fx) if not only or any(s.name.startswith(o) for o in only)]
+
+    cache_enabled = cache.enabled
+    cache.enabled = cache_enabled and with_cache
+
+    results = {}
+    try:
+        for scenario in scenarios:
+            logger.info(f"Running {scenario.name}...")
+            results[scenario.name] = run_scenario(scenario, iterations, warmup)
+            r = results[scenario.name]
+            if r.get("iterations"):
+                logger.info(
+                    f"  p50={r['p50_ms']}ms p95={r['p95_ms']}ms p99={r['p99_ms']}ms "
+                    f"rps={r['throughput_rps']} queries={r['queries_per_request']} errors={r['errors']}"
+                )
+    finally:
+        cache.enabled = cache_enabled
+
+    with engine.connect() as conn:
+        volumes = {
+            table: conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+            for table in ("users", "events", "participants")
+        }
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "dialect": engine.dialect.name,
+            "iterations": iterations,
+            "warmup": warmup,
+            "cache": "warm" if with_cache else "cold",
+            "volumes": volumes
+        },
+        "scenarios": results
+    }
+
+
+def _print_report(result, regressions):
+    print(f"\n{'scenario':<32}{'p50':>10}{'p95':>10}{'p99':>10}{'rps':>10}{'queries':>9}{'errors':>8}")
+    for name, r in result["scenarios"].items():
+        if not r.get("iterations"):
+            print(f"{name:<32}{'(skipped)':>10}")
+            continue
+        print(
+            f"{name:<32}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}{r['p99_ms']:>10.2f}"
+            f"{r['throughput_rps'] or 0:>10.1f}{r['queries_per_request']:>9.1f}{r['errors']:>8}"
+        )
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s):")
+        for reg in regressions:
+            change = f"{reg['change']:+.1f}%" if reg["change"] is not None else "new"
+            print(f"  {reg['scenario']}: {reg['metric']} {reg['baseline']} -> {reg['current']} ({change})")
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    parser = argparse.ArgumentParser(description="Benchmark hot endpoints against the configured database.")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--only", nargs="*", help="Scenario name prefixes (e.g. events.filter admin)")
+    parser.add_argument("--password", default="Password123!", help="Password of generated users (login scenario)")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline", help="Previous result file to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed relative slowdown before flagging (0.10 = 10%%)")
+    parser.add_argument("--save-baseline", help="Also write the result to this baseline file")
+    parser.add_argument("--with-cache", action="store_true",
+                        help="Keep the result cache on (measures the warm path instead of the queries)")
+    args = parser.parse_args(argv)
+
+    result = run(args.iterations, args.warmup, args.only, args.password, args.with_cache)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        # Eski baseline'larda alan yok: cache açıkken alınmışlardı
+        baseline_cache = baseline.get("meta", {}).get("cache", "warm")
+        if baseline_cache != result["meta"]["cache"]:
+            parser.error(
+                f"Baseline was recorded with a {baseline_cache} cache, this run is {result['meta']['cache']}"
+            )
+        regressions = compare(result, baseline, args.threshold)
+        result["comparison"] = {
+            "baseline": args.baseline,
+            "baseline_commit": baseline.get("meta", {}).get("commit"),
+            "threshold": args.threshold,
+            "regressions": regressions
+        }
+
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w") as f:
+            json.dump(result, f, indent=2)
+        logger.info(f"Results written to {path}")
+
+    _print_report(result, regressions)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,586 @@
+# scripts/generate_dataset.py
+"""
+Synthetic Dataset Generator
+Performans çalışmaları için şemayı gerçekçi hacimlerde doldurur.
+
+- Aynı seed + aynı başlangıç veritabanı -> aynı veri (numpy default_rng)
+- Popülerlik çarpık dağılır: az sayıda etkinlik/kullanıcı katılımın büyük
+  kısmını toplar (lognormal / Zipf), üniversiteler de eşit dağılmaz
+- Tarihler son ~3 yıla büyüyen bir trendle yayılır, etkinliklerin bir kısmı
+  gelecektedir; konumlar şehir merkezleri etrafında dağılır
+- Satırlar çok satırlı INSERT'lerle (PyMySQL executemany) batch halinde
+  yazılır; FK/unique kontrolleri oturum boyunca kapatılır
+
+Kullanım:
+    python -m backend.scripts.generate_dataset --seed 42
+    python -m backend.scripts.generate_dataset --scale 0.05   # hızlı lokal set
+
+Üretilen tüm kullanıcıların şifresi --password değeridir (varsayılan: "Password123!").
+Var olan verinin üzerine eklenir; ID'ler tablodaki MAX(id)'den sonra başlar.
+"""
+
+import argparse
+import logging
+import time
+import uuid
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import create_engine, text
+from werkzeug.security import generate_password_hash
+
+from backend.config import get_config
+from backend.utils.rollups import rebuild_rollups
+from backend.utils.user_activity import rebuild_user_activity
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VOLUMES = {
+    "users": 100_000,
+    "organizations": 2_000,
+    "memberships": 60_000,
+    "events": 50_000,
+    "participants": 2_000_000,
+    "applications": 150_000,
+    "ratings": 400_000,
+    "reports": 5_000
+}
+
+BATCH_SIZE = 5_000
+HISTORY_DAYS = 3 * 365
+FUTURE_DAYS = 180
+
+# (şehir, enlem, boylam, ağırlık)
+CITIES = [
+    ("Istanbul", 41.0082, 28.9784, 0.38),
+    ("Ankara", 39.9334, 32.8597, 0.18),
+    ("Izmir", 38.4237, 27.1428, 0.10),
+    ("Bursa", 40.1885, 29.0610, 0.05),
+    ("Antalya", 36.8969, 30.7133, 0.05),
+    ("Eskisehir", 39.7767, 30.5206, 0.04),
+    ("Konya", 37.8746, 32.4932, 0.04),
+    ("Kayseri", 38.7312, 35.4787, 0.03),
+    ("Trabzon", 41.0027, 39.7168, 0.03),
+    ("Erzurum", 39.9055, 41.2658, 0.03),
+    ("Gaziantep", 37.0662, 37.3833, 0.03),
+    ("Samsun", 41.2867, 36.3300, 0.02),
+    ("Adana", 37.0000, 35.3213, 0.02)
+]
+
+FIRST_NAMES = [
+    "Ahmet", "Mehmet", "Mustafa", "Ali", "Emre", "Burak", "Can", "Deniz", "Efe", "Kerem",
+    "Ayse", "Fatma", "Zeynep", "Elif", "Ece", "Selin", "Merve", "Irem", "Defne", "Ceren"
+]
+LAST_NAMES = [
+    "Yilmaz", "Kaya", "Demir", "Sahin", "Celik", "Yildiz", "Yildirim", "Ozturk", "Aydin",
+    "Ozdemir", "Arslan", "Dogan", "Kilic", "Aslan", "Cetin", "Kara", "Koc", "Kurt", "Polat"
+]
+EVENT_WORDS = {
+    "TECH": ["Meetup", "Hackathon", "Tech Talk", "Code Night"],
+    "MUSIC": ["Concert", "Jam Session", "Jazz Night", "Open Mic"],
+    "PARTY": ["Party", "Spring Fest", "Welcome Night", "Graduation Party"],
+    "EDUCATION": ["Workshop", "Bootcamp", "Study Group", "Course"],
+    "SPORTS": ["Tournament", "Marathon", "Football Cup", "Yoga Session"],
+    "GAME": ["Game Night", "Chess Cup", "Esports Cup", "Board Games"],
+    "CAREER": ["Career Fair", "CV Clinic", "Mentorship Day", "Interview Prep"],
+    "SEMINAR": ["Seminar", "Panel", "Guest Lecture", "Conference"],
+    "BUSINESS": ["Startup Pitch", "Demo Day", "Networking Night", "Case Study"],
+    "SOCIAL": ["Picnic", "Volunteering Day", "Movie Night", "Trip"]
+}
+# Etkinlik tiplerinin göreli popülerliği (bilinmeyen tipler 1.0)
+TYPE_WEIGHTS = {"TECH": 3.0, "SOCIAL": 2.5, "PARTY": 2.0, "EDUCATION": 2.0, "CAREER": 1.5, "SPORTS": 1.5}
+REPORT_REASONS = [
+    "Spam or misleading content", "Inappropriate language", "Event did not take place",
+    "Wrong location information", "Suspicious payment request"
+]
+RATING_COMMENTS = ["Great event!", "Well organized.", "Could be better.", "Loved it", "Too crowded", None]
+
+
+class DatasetGenerator:
+    """Generates and bulk-inserts a deterministic synthetic dataset."""
+
+    def __init__(self, engine, seed=42, volumes=None, password="Password123!", now=None):
+        self.engine = engine
+        self.rng = np.random.default_rng(seed)
+        self.volumes = volumes or dict(DEFAULT_VOLUMES)
+        self.password_hash = generate_password_hash(password)
+        # Tarihler "şimdi"ye göre üretilir; gün başına yuvarlanır ki aynı gün tekrar üretilebilsin
+        self.now = (now or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.ids = {}
+        self.stats = {}
+
+    # -----------------------------------------------------------------
+    # Yardımcılar
+    # -----------------------------------------------------------------
+    def _next_id(self, conn, table):
+        return int(conn.execute(text(f"SELECT COALESCE(MAX(id), 0) FROM {table}")).scalar()) + 1
+
+    def _zipf_choice(self, values, size, exponent=1.1):
+        """Samples values with a Zipf-like skew (first values most popular after shuffling)."""
+        ranks = np.arange(1, len(values) + 1, dtype=np.float64)
+        weights = ranks ** -exponent
+        order = self.rng.permutation(len(values))
+        return np.asarray(values)[order][self.rng.choice(len(values), size=size, p=weights / weights.sum())]
+
+    def _timestamps(self, size, start_days_ago, end_days_ahead=0, growth=1.5):
+        """Datetimes between now-start_days_ago and now+end_days_ahead, denser towards recent days."""
+        span = start_days_ago + end_days_ahead
+        offsets = self.rng.power(growth, size) * span - start_days_ago
+        seconds = (offsets * 86400).astype(np.int64)
+        base = np.datetime64(self.now, "s")
+        return base + seconds.astype("timedelta64[s]")
+
+    def _ticket_codes(self, size):
+        raw = self.rng.integers(0, 256, size=(size, 16), dtype=np.uint8)
+        return [str(uuid.UUID(bytes=row.tobytes(), version=4)) for row in raw]
+
+    def _insert(self, conn, table, columns, rows):
+        """Inserts rows (iterable of tuples) in multi-row batches."""
+        statement = text(
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join(':' + c for c in columns)})"
+        )
+        started = time.perf_counter()
+        batch = []
+        total = 0
+        for row in rows:
+            batch.append(dict(zip(columns, row)))
+            if len(batch) >= BATCH_SIZE:
+                conn.execute(statement, batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            conn.execute(statement, batch)
+            total += len(batch)
+
+        elapsed = time.perf_counter() - started
+        self.stats[table] = {"rows": total, "seconds": round(elapsed, 2)}
+        logger.info(f"{table}: {total} rows in {elapsed:.1f}s ({total / max(elapsed, 1e-9):.0f} rows/s)")
+        return total
+
+    @staticmethod
+    def _py(value):
+        """numpy scalars -> Python types the DB driver understands."""
+        if isinstance(value, np.datetime64):
+            return value.astype("datetime64[s]").astype(datetime)
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    def _rows(self, *columns):
+        py = self._py
+        for values in zip(*columns):
+            yield tuple(py(v) for v in values)
+
+    # -----------------------------------------------------------------
+    # Tablolar
+    # -----------------------------------------------------------------
+    def _load_reference_data(self, conn):
+        domains = conn.execute(text("""
+            SELECT university_id, MIN(domain) AS domain
+            FROM university_domains
+            GROUP BY university_id
+            ORDER BY university_id
+        """)).fetchall()
+        if not domains:
+            raise RuntimeError("university_domains is empty; load db/init.sql first")
+
+        types = conn.execute(text("SELECT id, code FROM event_types ORDER BY id")).fetchall()
+        if not types:
+            raise RuntimeError("event_types is empty; load db/init.sql first")
+
+        self.university_ids = np.array([row.university_id for row in domains], dtype=np.int64)
+        self.university_domains = {row.university_id: row.domain for row in domains}
+
+        # Her üniversite bir şehre bağlanır (şehir ağırlıklarına göre)
+        city_weights = np.array([c[3] for c in CITIES])
+        self.university_city = dict(zip(
+            self.university_ids.tolist(),
+            self.rng.choice(len(CITIES), size=len(self.university_ids), p=city_weights / city_weights.sum())
+        ))
+
+        self.type_ids = np.array([row.id for row in types], dtype=np.int64)
+        self.type_codes = {row.id: row.code for row in types}
+        weights = np.array([TYPE_WEIGHTS.get(row.code, 1.0) for row in types])
+        self.type_weights = weights / weights.sum()
+
+    def _coordinates(self, city_indexes, spread=0.08):
+        lat = np.array([CITIES[i][1] for i in city_indexes]) + self.rng.normal(0, spread, len(city_indexes))
+        lon = np.array([CITIES[i][2] for i in city_indexes]) + self.rng.normal(0, spread, len(city_indexes))
+        return np.round(lat, 6), np.round(lon, 6)
+
+    def generate_users(self, conn):
+        n = self.volumes["users"]
+        first_id = self._next_id(conn, "users")
+        ids = np.arange(first_id, first_id + n)
+
+        universities = self._zipf_choice(self.university_ids, n, exponent=0.9)
+        genders = self.rng.choice(["MALE", "FEMALE"], size=n)
+        first = self.rng.choice(FIRST_NAMES, size=n)
+        last = self.rng.choice(LAST_NAMES, size=n)
+        created = self._timestamps(n, HISTORY_DAYS)
+        cities = [self.university_city[u] for u in universities.tolist()]
+        lat, lon = self._coordinates(cities)
+        # Konum izni vermeyen kullanıcılar
+        no_location = self.rng.random(n) < 0.4
+
+        self.ids["users"] = ids
+        self.user_university = universities
+        self.user_gender = genders
+
+        rows = (
+            (
+                int(uid), f"{fn} {ln}", f"user{uid}",
+                f"user{uid}@{self.university_domains[int(uni)]}", self.password_hash,
+                None if skip else float(la), None if skip else float(lo),
+                "USER", 1, int(uni), str(gender), created_at.astype(datetime)
+            )
+            for uid, fn, ln, uni, gender, la, lo, skip, created_at
+            in zip(ids, first, last, universities, genders, lat, lon, no_location, created)
+        )
+        return self._insert(conn, "users", (
+            "id", "name", "username", "email", "password_hash", "latitude", "longitude",
+            "role", "status", "university_id", "gender", "created_at"
+        ), rows)
+
+    def generate_organizations(self, conn):
+        n = self.volumes["organizations"]
+        first_id = self._next_id(conn, "organizations")
+        ids = np.arange(first_id, first_id + n)
+        owners = self.rng.choice(self.ids["users"], size=n, replace=False)
+        created = self._timestamps(n, HISTORY_DAYS)
+        topics = self.rng.choice(list(EVENT_WORDS), size=n)
+        status = np.where(self.rng.random(n) < 0.93, "ACTIVE", "INACTIVE")
+
+        self.ids["organizations"] = ids
+        self.organization_owner = owners
+
+        rows = (
+            (int(oid), f"{str(topic).title()} Club {oid}", f"Student {str(topic).lower()} community",
+             int(owner), str(st), created_at.astype(datetime))
+            for oid, owner, topic, st, created_at in zip(ids, owners, topics, status, created)
+        )
+        return self._insert(conn, "organizations", (
+            "id", "name", "description", "owner_user_id", "status", "created_at"
+        ), rows)
+
+    def generate_memberships(self, conn):
+        orgs = self.ids["organizations"]
+        users = self.ids["users"]
+        target = self.volumes["memberships"]
+
+        # Owner'lar ADMIN olarak üyedir; kalan üyelikler kulüp büyüklüğüne göre çarpık dağılır
+        org_sizes = self.rng.lognormal(mean=2.5, sigma=1.0, size=len(orgs))
+        picked_orgs = self.rng.choice(orgs, size=int(target * 1.2), p=org_sizes / org_sizes.sum())
+        picked_users = self._zipf_choice(users, len(picked_orgs), exponent=0.6)
+
+        keys = np.concatenate([
+            orgs * (users.max() + 1) + self.organization_owner,
+            picked_orgs * (users.max() + 1) + picked_users
+        ])
+        _, first_index = np.unique(keys, return_index=True)
+        first_index = np.sort(first_index)[:target + len(orgs)]
+        all_orgs = np.concatenate([orgs, picked_orgs])[first_index]
+        all_users = np.concatenate([self.organization_owner, picked_users])[first_index]
+        roles = np.where(
+            first_index < len(orgs), "ADMIN",
+            np.where(self.rng.random(len(first_index)) < 0.05, "REPRESENTATIVE", "MEMBER")
+        )
+        joined = self._timestamps(len(first_index), HISTORY_DAYS)
+
+        return self._insert(conn, "organization_members", (
+            "organization_id", "user_id", "role", "joined_at"
+        ), self._rows(all_orgs, all_users, roles, joined))
+
+    def generate_events(self, conn):
+        n = self.volumes["events"]
+        first_id = self._next_id(conn, "events")
+        ids = np.arange(first_id, first_id + n)
+
+        # Az sayıda "güçlü" kullanıcı etkinliklerin çoğunu açar
+        owners = self._zipf_choice(self.ids["users"], n, exponent=1.05)
+        by_org = self.rng.random(n) < 0.35
+        org_index = self.rng.integers(0, len(self.ids["organizations"]), size=n)
+        org_ids = np.where(by_org, self.ids["organizations"][org_index], 0)
+        owners = np.where(by_org, self.organization_owner[org_index], owners)
+
+        type_ids = self.rng.choice(self.type_ids, size=n, p=self.type_weights)
+        starts = self._timestamps(n, HISTORY_DAYS, FUTURE_DAYS, growth=1.8)
+        # Akşam saatleri daha yoğun
+        hours = self.rng.choice(np.arange(8, 23), size=n, p=_hour_weights())
+        starts = starts.astype("datetime64[D]") + hours.astype("timedelta64[h]")
+        durations = self.rng.choice([1, 2, 2, 3, 3, 4, 6, 8, 48], size=n).astype("timedelta64[h]")
+        ends = starts + durations
+        created = starts - self.rng.integers(1, 60, size=n).astype("timedelta64[D]")
+
+        now = np.datetime64(self.now, "h")
+        past = ends < now
+        roll = self.rng.random(n)
+        status = np.where(
+            past,
+            np.where(roll < 0.97, "COMPLETED", "REJECTED"),
+            np.where(roll < 0.90, "FUTURE", np.where(roll < 0.95, "PENDING_REVIEW", "DRAFT"))
+        )
+
+        price = np.where(self.rng.random(n) < 0.65, 0, np.round(self.rng.choice([25, 50, 75, 100, 150, 250], size=n), 2))
+        # Popülerlik: lognormal, katılımcılar bu ağırlıkla dağıtılır
+        popularity = self.rng.lognormal(mean=0.0, sigma=1.3, size=n)
+        popularity[status != "COMPLETED"] *= np.where(status[status != "COMPLETED"] == "FUTURE", 0.6, 0.0)
+        only_girls = self.rng.random(n) < 0.03
+        private = self.rng.random(n) < 0.1
+        has_register = self.rng.random(n) < 0.9
+
+        owner_university = dict(zip(self.ids["users"].tolist(), self.user_university.tolist()))
+        cities = [self.university_city[owner_university[int(o)]] for o in owners]
+        lat, lon = self._coordinates(cities, spread=0.05)
+
+        self.ids["events"] = ids
+        self.event_status = status
+        self.event_starts = starts
+        self.event_created = created
+        self.event_popularity = popularity
+        self.event_only_girls = only_girls
+
+        titles = [
+            f"{self.rng.choice(EVENT_WORDS.get(self.type_codes[int(t)], ['Event']))} #{eid}"
+            for t, eid in zip(type_ids, ids)
+        ]
+
+        def rows():
+            for i in range(n):
+                yield (
+                    int(ids[i]), int(owners[i]),
+                    "ORGANIZATION" if by_org[i] else "USER",
+                    int(org_ids[i]) if by_org[i] else None,
+                    titles[i], f"{titles[i]} - generated event", int(type_ids[i]),
+                    bool(has_register[i]), float(price[i]),
+                    starts[i].astype("datetime64[s]").astype(datetime),
+                    ends[i].astype("datetime64[s]").astype(datetime),
+                    f"{CITIES[cities[i]][0]} Campus", str(status[i]),
+                    float(lat[i]), float(lon[i]),
+                    created[i].astype("datetime64[s]").astype(datetime),
+                    bool(private[i]), bool(only_girls[i])
+                )
+
+        return self._insert(conn, "events", (
+            "id", "owner_user_id", "owner_type", "owner_organization_id", "title", "explanation",
+            "type_id", "has_register", "price", "starts_at", "ends_at", "location_name", "status",
+            "latitude", "longitude", "created_at", "is_participants_private", "only_girls"
+        ), rows())
+
+    def generate_participants(self, conn):
+        target = self.volumes["participants"]
+        users = self.ids["users"]
+        events = self.ids["events"]
+        weights = self.event_popularity / self.event_popularity.sum()
+
+        # Fazladan örnekle, (event, user) tekrarlarını at
+        sample = int(target * 1.3)
+        event_index = self.rng.choice(len(events), size=sample, p=weights)
+        user_index = self.rng.choice(
+            len(users), size=sample,
+            p=_skewed_weights(self.rng, len(users), sigma=1.0)
+        )
+        # Sadece kızlara açık etkinliklere erkek kullanıcı katılmaz
+        allowed = ~(self.event_only_girls[event_index] & (self.user_gender[user_index] == "MALE"))
+        event_index, user_index = event_index[allowed], user_index[allowed]
+
+        keys = event_index.astype(np.int64) * len(users) + user_index
+        _, first_index = np.unique(keys, return_index=True)
+        first_index = np.sort(first_index)[:target]
+        event_index, user_index = event_index[first_index], user_index[first_index]
+        n = len(first_index)
+
+        completed = self.event_status[event_index] == "COMPLETED"
+        attended = completed & (self.rng.random(n) < 0.72)
+
+        # Kayıt zamanı: etkinlik oluşturulması ile başlangıcı arasında
+        created = self.event_created[event_index].astype("datetime64[s]")
+        window = (self.event_starts[event_index].astype("datetime64[s]") - created).astype(np.int64)
+        registered = created + (self.rng.random(n) * np.maximum(window, 3600)).astype("timedelta64[s]")
+        registered = np.minimum(registered, np.datetime64(self.now, "s"))
+
+        first_id = self._next_id(conn, "participants")
+        self.participant_event_index = event_index
+        self.participant_user_index = user_index
+        self.participant_attended = attended
+        self.ids["participants"] = np.arange(first_id, first_id + n)
+
+        return self._insert(conn, "participants", (
+            "id", "event_id", "user_id", "status", "ticket_code", "created_at"
+        ), self._rows(
+            self.ids["participants"], events[event_index], users[user_index],
+            np.where(attended, "ATTENDED", "NO_SHOW"), self._ticket_codes(n), registered
+        ))
+
+    def generate_applications(self, conn):
+        # Onaylı başvurular katılımcılardan, bekleyen/reddedilenler rastgele seçilir
+        target = self.volumes["applications"]
+        users = self.ids["users"]
+        events = self.ids["events"]
+        n_participants = len(self.ids["participants"])
+
+        approved = self.rng.choice(n_participants, size=min(target // 2, n_participants), replace=False)
+        approved.sort()
+        app_event = self.participant_event_index[approved]
+        app_user = self.participant_user_index[approved]
+
+        extra = target - len(approved)
+        extra_event = self.rng.choice(len(events), size=int(extra * 1.2),
+                                      p=self.event_popularity / self.event_popularity.sum())
+        extra_user = self.rng.integers(0, len(users), size=len(extra_event))
+
+        all_event = np.concatenate([app_event, extra_event])
+        all_user = np.concatenate([app_user, extra_user])
+        keys = all_event.astype(np.int64) * len(users) + all_user
+        existing = set((self.participant_event_index.astype(np.int64) * len(users) + self.participant_user_index).tolist())
+
+        _, first_index = np.unique(keys, return_index=True)
+        first_index = np.sort(first_index)
+        # Katılımcı olmayan (event, user) çiftleri PENDING/REJECTED olur
+        keep = [i for i in first_index.tolist() if i < len(approved) or keys[i] not in existing][:target]
+        keep = np.array(keep, dtype=np.int64)
+        status = np.where(
+            keep < len(approved), "APPROVED",
+            np.where(self.rng.random(len(keep)) < 0.6, "PENDING", "REJECTED")
+        )
+
+        first_id = self._next_id(conn, "applications")
+        app_ids = np.arange(first_id, first_id + len(keep))
+        inserted = self._insert(conn, "applications", (
+            "id", "event_id", "user_id", "why_me", "status"
+        ), self._rows(app_ids, events[all_event[keep]], users[all_user[keep]],
+                      np.full(len(keep), "I would like to join"), status))
+
+        # Onaylı başvuruları katılımcı satırlarına bağla
+        approved_mask = keep < len(approved)
+        link_rows = self._rows(app_ids[approved_mask], self.ids["participants"][approved[keep[approved_mask]]])
+        statement = text("UPDATE participants SET application_id = :app_id WHERE id = :participant_id")
+        batch = []
+        for app_id, participant_id in link_rows:
+            batch.append({"app_id": app_id, "participant_id": participant_id})
+            if len(batch) >= BATCH_SIZE:
+                conn.execute(statement, batch)
+                batch = []
+        if batch:
+            conn.execute(statement, batch)
+        return inserted
+
+    def generate_ratings(self, conn):
+        attended = np.flatnonzero(self.participant_attended)
+        n = min(self.volumes["ratings"], len(attended))
+        picked = np.sort(self.rng.choice(attended, size=n, replace=False))
+
+        # Puanlar 4-5'e yığılır
+        ratings = self.rng.choice([1, 2, 3, 4, 5], size=n, p=[0.04, 0.06, 0.15, 0.35, 0.40])
+        comments = self.rng.choice(len(RATING_COMMENTS), size=n)
+
+        return self._insert(conn, "ratings", (
+            "event_id", "user_id", "rating", "comment"
+        ), (
+            (self._py(e), self._py(u), self._py(r), RATING_COMMENTS[c])
+            for e, u, r, c in zip(
+                self.ids["events"][self.participant_event_index[picked]],
+                self.ids["users"][self.participant_user_index[picked]],
+                ratings, comments
+            )
+        ))
+
+    def generate_reports(self, conn):
+        n = self.volumes["reports"]
+        # Raporlar da popüler etkinliklerde yoğunlaşır
+        event_index = self.rng.choice(len(self.ids["events"]), size=n,
+                                      p=self.event_popularity / self.event_popularity.sum())
+        reporters = self.rng.choice(self.ids["users"], size=n)
+        reasons = self.rng.choice(REPORT_REASONS, size=n)
+        roll = self.rng.random(n)
+        status = np.where(roll < 0.6, "PENDING", np.where(roll < 0.8, "ACCEPTED", "REJECTED"))
+        created = self._timestamps(n, 365)
+
+        return self._insert(conn, "reports", (
+            "event_id", "reporter_user_id", "reason", "status", "is_reviewed", "created_at"
+        ), self._rows(self.ids["events"][event_index], reporters, reasons, status, status != "PENDING", created))
+
+    def run(self, rebuild=True):
+        """
+        Generates every table in FK order inside one transaction.
+
+        Returns:
+            dict: per-table row counts and timings
+        """
+        started = time.perf_counter()
+        with self.engine.begin() as conn:
+            if self.engine.dialect.name == "mysql":
+                conn.execute(text("SET SESSION foreign_key_checks = 0"))
+                conn.execute(text("SET SESSION unique_checks = 0"))
+
+            self._load_reference_data(conn)
+            self.generate_users(conn)
+            self.generate_organizations(conn)
+            self.generate_memberships(conn)
+            self.generate_events(conn)
+            self.generate_participants(conn)
+            self.generate_applications(conn)
+            self.generate_ratings(conn)
+            self.generate_reports(conn)
+
+            if self.engine.dialect.name == "mysql":
+                conn.execute(text("SET SESSION foreign_key_checks = 1"))
+                conn.execute(text("SET SESSION unique_checks = 1"))
+
+        if rebuild:
+            # Türetilmiş tablolar (admin chart'ları, leaderboard) yeni veriyi görsün
+            self.stats["daily_event_stats"] = rebuild_rollups(self.engine, days=HISTORY_DAYS + FUTURE_DAYS)
+            self.stats["user_activity"] = rebuild_user_activity(self.engine)
+
+        self.stats["total_seconds"] = round(time.perf_counter() - started, 2)
+        return self.stats
+
+
+def _hour_weights():
+    hours = np.arange(8, 23)
+    weights = np.exp(-((hours - 19) ** 2) / 18.0) + 0.15
+    return weights / weights.sum()
+
+
+def _skewed_weights(rng, size, sigma):
+    weights = rng.lognormal(mean=0.0, sigma=sigma, size=size)
+    return weights / weights.sum()
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Fill the database with a synthetic dataset.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Multiplier for all default volumes (e.g. 0.05 for a quick local set)")
+    parser.add_argument("--database-url", default=None, help="Defaults to DATABASE_URL")
+    parser.add_argument("--password", default="Password123!", help="Password of every generated user")
+    parser.add_argument("--today", default=None, help="Anchor date (YYYY-MM-DD) for reproducible dates")
+    parser.add_argument("--skip-rebuild", action="store_true", help="Do not rebuild rollups / leaderboard")
+    for table, default in DEFAULT_VOLUMES.items():
+        parser.add_argument(f"--{table}", type=int, default=None, help=f"Rows for {table} (default {default})")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    args = _parse_args(argv)
+
+    volumes = {
+        table: getattr(args, table) if getattr(args, table) is not None else max(int(default * args.scale), 1)
+        for table, default in DEFAULT_VOLUMES.items()
+    }
+    url = args.database_url or get_config().DATABASE_URL
+    engine = create_engine(url, future=True)
+    now = datetime.strptime(args.today, "%Y-%m-%d") if args.today else None
+
+    logger.info(f"Generating dataset (seed={args.seed}): {volumes}")
+    stats = DatasetGenerator(engine, seed=args.seed, volumes=volumes, password=args.password, now=now).run(
+        rebuild=not args.skip_rebuild
+    )
+    logger.info(f"Done in {stats['total_seconds']}s")
+    return stats
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+# scripts/json_benchmark.py
+"""
+JSON Serialization Microbenchmark
+GET /events listesinin 100 satırlık bir sayfasını (aynı kolonlar ve tipler:
+Decimal price/latitude/longitude, datetime'lar, TEXT explanation) bellek içi
+SQLite'tan okur ve satır dönüşümü + JSON yanıt üretimini ölçer:
+
+- dict+flask:      [dict(r._mapping) ...] + Flask'ın varsayılan provider'ı (eski yol)
+- dict+orjson:     aynı dict'ler + OrjsonProvider
+- encoder+orjson:  derlenmiş row encoder + OrjsonProvider (http tarih formatı)
+- encoder+iso:     derlenmiş row encoder + OrjsonProvider (ISO 8601, dönüşüm yok)
+
+DB süresi ölçüme dahil edilmez (satırlar bir kez çekilir).
+
+Kullanım:
+    python -m backend.scripts.json_benchmark --rows 100 --iterations 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import (
+    Boolean, Column, DateTime, Integer, MetaData, Numeric, String, Table, Text, create_engine, select
+)
+
+from backend.utils.json_provider import OrjsonProvider
+from backend.utils.row_encoder import get_encoder, set_datetime_format
+
+DEFAULT_ROWS = 100
+DEFAULT_ITERATIONS = 2000
+
+
+def _build_page(row_count, seed=42):
+    """Returns (keys, rows) shaped like one GET /events page."""
+    rng = random.Random(seed)
+    metadata = MetaData()
+    events = Table(
+        "events", metadata,
+        Column("id", Integer, primary_key=True),
+        Column("title", String(200)),
+        Column("explanation", Text),
+        Column("price", Numeric(10, 2)),
+        Column("starts_at", DateTime),
+        Column("ends_at", DateTime),
+        Column("location_name", String(255)),
+        Column("status", String(20)),
+        Column("user_limit", Integer),
+        Column("latitude", Numeric(10, 8)),
+        Column("longitude", Numeric(11, 8)),
+        Column("created_at", DateTime),
+        Column("updated_at", DateTime),
+        Column("only_girls", Boolean),
+        Column("owner_type", String(20)),
+        Column("owner_username", String(50)),
+        Column("owner_organization_name", String(255)),
+        Column("event_type", String(50)),
+        Column("participant_count", Integer),
+    )
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+
+    base = datetime(2025, 1, 1, 9, 0)
+    rows = []
+    for i in range(row_count):
+        starts = base + timedelta(hours=rng.randint(0, 24 * 180))
+        rows.append({
+            "id": i + 1,
+            "title": f"Etkinlik {i + 1}",
+            "explanation": "Açıklama " * rng.randint(20, 80),
+            "price": Decimal(rng.randint(0, 50000)) / 100,
+            "starts_at": starts,
+            "ends_at": starts + timedelta(hours=3),
+            "location_name": "Kampüs Konferans Salonu",
+            "status": "FUTURE",
+            "user_limit": rng.choice((None, 50, 100, 250)),
+            "latitude": Decimal(f"{rng.uniform(36, 42):.8f}"),
+            "longitude": Decimal(f"{rng.uniform(26, 45):.8f}"),
+            "created_at": starts - timedelta(days=20),
+            "updated_at": starts - timedelta(days=2),
+            "only_girls": rng.random() < 0.1,
+            "owner_type": rng.choice(("USER", "ORGANIZATION")),
+            "owner_username": f"user{rng.randint(1, 5000)}",
+            "owner_organization_name": rng.choice((None, "Bilişim Kulübü", "Müzik Topluluğu")),
+            "event_type": rng.choice(("workshop", "concert", "seminar")),
+            "participant_count": rng.randint(0, 250),
+        })
+
+    with engine.begin() as conn:
+        conn.execute(events.insert(), rows)
+    with engine.connect() as conn:
+        result = conn.execute(select(events).order_by(events.c.starts_at))
+        return list(result.keys()), result.fetchall()
+
+
+def _time(fn, iterations):
+    for _ in range(min(50, iterations)):
+        fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def run(row_count=DEFAULT_ROWS, iterations=DEFAULT_ITERATIONS):
+    keys, rows = _build_page(row_count)
+    app = Flask(__name__)
+    pagination = {"page": 1, "per_page": row_count, "total": row_count * 10}
+
+    default_provider = DefaultJSONProvider(app)
+    default_provider.compact = True
+    orjson_provider = OrjsonProvider(app)
+    orjson_provider.compact = True
+    iso_provider = OrjsonProvider(app)
+    iso_provider.compact = True
+    iso_provider.datetime_format = "iso"
+
+    def dicts():
+        return [dict(r._mapping) for r in rows]
+
+    set_datetime_format("http")
+    http_encoder = get_encoder(keys, rows)
+    set_datetime_format("iso")
+    iso_encoder = get_encoder(keys, rows)
+    set_datetime_format("http")
+
+    cases = {
+        "dict+flask": (dicts, default_provider),
+        "dict+orjson": (dicts, orjson_provider),
+        "encoder+orjson": (lambda: http_encoder(rows), orjson_provider),
+        "encoder+iso": (lambda: iso_encoder(rows), iso_provider),
+    }
+
+    results = {}
+    with app.app_context():
+        for name, (build, provider) in cases.items():
+            data = build()
+            body = provider.response({"data": data, "pagination": pagination}).get_data()
+            results[name] = {
+                "rows_us": round(_time(build, iterations), 1),
+                "total_us": round(_time(
+                    lambda: provider.response({"data": build(), "pagination": pagination}).get_data(),
+                    iterations
+                ), 1),
+                "bytes": len(body)
+            }
+
+    baseline = results["dict+flask"]["total_us"]
+    for r in results.values():
+        r["speedup"] = round(baseline / r["total_us"], 2)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Row conversion + JSON response microbenchmark.")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    args = parser.parse_args(argv)
+
+    results = run(args.rows, args.iterations)
+    print(f"\n{args.rows}-row events page, {args.iterations} iterations")
+    print(f"{'case':<18}{'rows µs':>10}{'total µs':>11}{'bytes':>9}{'speedup':>9}")
+    for name, r in results.items():
+        print(f"{name:<18}{r['rows_us']:>10.1f}{r['total_us']:>11.1f}{r['bytes']:>9}{r['speedup']:>8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
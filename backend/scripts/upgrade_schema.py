@@ -0,0 +1,255 @@
+# scripts/upgrade_schema.py
+"""
+Schema Upgrade
+db/init.sql yalnızca boş bir veritabanında çalışır; mevcut (ör. Cloud SQL)
+veritabanlarını aynı şemaya getirmek için eksik kolon, index ve tabloları ekler.
+
+- Her adım information_schema'dan kontrol edilir; zaten uygulanmış adımlar
+  atlanır, script tekrar tekrar çalıştırılabilir
+- Yeni rollup / leaderboard tabloları oluşturulursa kaynak tablolardan
+  doldurulur (rebuild_rollups, rebuild_user_activity)
+- events.summary STORED generated kolonudur: MySQL tabloyu yeniden yazar
+  (ALGORITHM=COPY), büyük tablolarda düşük trafikli bir saatte çalıştırılmalı
+- Var olan participants satırlarının created_at değeri eklendiği anın zamanı olur
+
+Kullanım:
+    python -m backend.scripts.upgrade_schema --dry-run
+    python -m backend.scripts.upgrade_schema
+"""
+
+import argparse
+import logging
+
+from sqlalchemy import create_engine, text
+
+from backend.config import get_config
+from backend.utils.rollups import rebuild_rollups
+from backend.utils.user_activity import rebuild_user_activity
+
+logger = logging.getLogger(__name__)
+
+# Seed verisiyle aynı aralık: rollup'lar son ~3 yıl için kurulur
+ROLLUP_BACKFILL_DAYS = 3 * 365
+
+# (tablo, kolon, ALTER)
+COLUMNS = [
+    ("events", "summary", """
+        ALTER TABLE events ADD COLUMN summary VARCHAR(200) GENERATED ALWAYS AS (
+            CASE WHEN CHAR_LENGTH(explanation) <= 200 THEN explanation
+                 ELSE CONCAT(LEFT(explanation, 197), '...')
+            END
+        ) STORED AFTER explanation
+    """),
+    ("participants", "created_at",
+     "ALTER TABLE participants ADD COLUMN created_at DATETIME DEFAULT CURRENT_TIMESTAMP AFTER ticket_code"),
+    ("participants", "updated_at",
+     "ALTER TABLE participants ADD COLUMN updated_at DATETIME DEFAULT CURRENT_TIMESTAMP "
+     "ON UPDATE CURRENT_TIMESTAMP AFTER created_at"),
+    ("ratings", "updated_at",
+     "ALTER TABLE ratings ADD COLUMN updated_at DATETIME DEFAULT CURRENT_TIMESTAMP "
+     "ON UPDATE CURRENT_TIMESTAMP AFTER comment"),
+    ("organization_members", "updated_at",
+     "ALTER TABLE organization_members ADD COLUMN updated_at DATETIME DEFAULT CURRENT_TIMESTAMP "
+     "ON UPDATE CURRENT_TIMESTAMP AFTER joined_at"),
+]
+
+# (tablo, index, ALTER) — kolonlardan sonra uygulanır
+INDEXES = [
+    ("events", "idx_events_status_ends_at", "ALTER TABLE events ADD INDEX idx_events_status_ends_at (status, ends_at)"),
+    ("events", "idx_events_created_at", "ALTER TABLE events ADD INDEX idx_events_created_at (created_at)"),
+    ("events", "idx_events_updated_at", "ALTER TABLE events ADD INDEX idx_events_updated_at (updated_at)"),
+    ("participants", "idx_participants_created",
+     "ALTER TABLE participants ADD INDEX idx_participants_created (created_at)"),
+    ("participants", "idx_participants_updated",
+     "ALTER TABLE participants ADD INDEX idx_participants_updated (updated_at)"),
+    ("ratings", "idx_ratings_updated", "ALTER TABLE ratings ADD INDEX idx_ratings_updated (updated_at)"),
+    ("organization_members", "idx_org_members_updated",
+     "ALTER TABLE organization_members ADD INDEX idx_org_members_updated (updated_at)"),
+    ("reports", "idx_reports_updated", "ALTER TABLE reports ADD INDEX idx_reports_updated (updated_at)"),
+]
+
+# idx_events_status_ends_at (status) önekini karşılar
+DROPPED_INDEXES = [
+    ("events", "idx_events_status", "ALTER TABLE events DROP INDEX idx_events_status"),
+]
+
+# (tablo, CREATE) — db/init.sql ile aynı tanımlar
+TABLES = [
+    ("user_sessions", """
+        CREATE TABLE user_sessions (
+          id            BIGINT UNSIGNED PRIMARY KEY AUTO_INCREMENT,
+          user_id       BIGINT UNSIGNED NOT NULL,
+          family_id     CHAR(32) NOT NULL,
+          token_hash    CHAR(64) NOT NULL,
+          expires_at    DATETIME NOT NULL,
+          revoked_at    DATETIME NULL,
+          replaced_by   BIGINT UNSIGNED NULL,
+          user_agent    VARCHAR(255),
+          created_at    DATETIME DEFAULT CURRENT_TIMESTAMP,
+          last_used_at  DATETIME NULL,
+
+          CONSTRAINT fk_sessions_user FOREIGN KEY (user_id) REFERENCES users(id)
+            ON UPDATE CASCADE ON DELETE CASCADE,
+
+          UNIQUE KEY uq_sessions_token_hash (token_hash),
+          INDEX idx_sessions_user (user_id, revoked_at),
+          INDEX idx_sessions_family (family_id)
+        ) ENGINE=InnoDB
+    """),
+    ("scheduler_leases", """
+        CREATE TABLE scheduler_leases (
+          name           VARCHAR(64) PRIMARY KEY,
+          holder         VARCHAR(255) NULL,
+          fencing_token  BIGINT UNSIGNED NOT NULL DEFAULT 0,
+          acquired_at    DATETIME NULL,
+          renewed_at     DATETIME NULL,
+          expires_at     DATETIME NOT NULL
+        ) ENGINE=InnoDB
+    """),
+    ("daily_event_stats", """
+        CREATE TABLE daily_event_stats (
+          stat_date       DATE NOT NULL,
+          university_id   BIGINT UNSIGNED NOT NULL DEFAULT 0,
+          type_id         BIGINT UNSIGNED NOT NULL DEFAULT 0,
+          events_created  INT NOT NULL DEFAULT 0,
+          registrations   INT NOT NULL DEFAULT 0,
+          attendance      INT NOT NULL DEFAULT 0,
+          updated_at      DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+          PRIMARY KEY (stat_date, university_id, type_id),
+          INDEX idx_daily_stats_university (university_id, stat_date),
+          INDEX idx_daily_stats_type (type_id, stat_date)
+        ) ENGINE=InnoDB
+    """),
+    ("user_activity", """
+        CREATE TABLE user_activity (
+          user_id         BIGINT UNSIGNED PRIMARY KEY,
+          university_id   BIGINT UNSIGNED NOT NULL DEFAULT 0,
+          attended_count  INT UNSIGNED NOT NULL DEFAULT 0,
+          last_event_id   BIGINT UNSIGNED NULL,
+          last_event_at   DATETIME NULL,
+          updated_at      DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+          CONSTRAINT fk_user_activity_user
+            FOREIGN KEY (user_id) REFERENCES users(id)
+              ON UPDATE CASCADE ON DELETE CASCADE,
+
+          CONSTRAINT fk_user_activity_event
+            FOREIGN KEY (last_event_id) REFERENCES events(id)
+              ON UPDATE CASCADE ON DELETE SET NULL,
+
+          INDEX idx_user_activity_rank (attended_count, last_event_at),
+          INDEX idx_user_activity_university_rank (university_id, attended_count, last_event_at)
+        ) ENGINE=InnoDB
+    """),
+]
+
+
+def _table_exists(conn, table):
+    return conn.execute(text("""
+        SELECT COUNT(*) FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table
+    """), {"table": table}).scalar() > 0
+
+
+def _column_exists(conn, table, column):
+    return conn.execute(text("""
+        SELECT COUNT(*) FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND COLUMN_NAME = :column
+    """), {"table": table, "column": column}).scalar() > 0
+
+
+def _index_exists(conn, table, index):
+    return conn.execute(text("""
+        SELECT COUNT(*) FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND INDEX_NAME = :index
+    """), {"table": table, "index": index}).scalar() > 0
+
+
+def pending_steps(conn):
+    """
+    Lists the DDL statements the connected database still needs.
+
+    Returns:
+        list: (description, sql) tuples in execution order
+    """
+    steps = []
+    for table, ddl in TABLES:
+        if not _table_exists(conn, table):
+            steps.append((f"create table {table}", ddl))
+
+    for table, column, ddl in COLUMNS:
+        if not _column_exists(conn, table, column):
+            steps.append((f"add column {table}.{column}", ddl))
+
+    for table, index, ddl in INDEXES:
+        if not _index_exists(conn, table, index):
+            steps.append((f"add index {table}.{index}", ddl))
+
+    for table, index, ddl in DROPPED_INDEXES:
+        if _index_exists(conn, table, index):
+            steps.append((f"drop index {table}.{index}", ddl))
+
+    return steps
+
+
+def upgrade(engine, dry_run=False, backfill=True):
+    """
+    Applies the pending steps (DDL auto-commits in MySQL, one statement at a time).
+
+    Args:
+        engine: SQLAlchemy engine (primary)
+        dry_run: Only log what would run
+        backfill: Fill newly created rollup / leaderboard tables
+
+    Returns:
+        dict: applied (descriptions), backfill results
+    """
+    with engine.connect() as conn:
+        steps = pending_steps(conn)
+
+    if not steps:
+        logger.info("Schema is up to date")
+        return {"applied": [], "backfill": {}}
+
+    applied = []
+    for description, ddl in steps:
+        logger.info(("Would run: " if dry_run else "Applying: ") + description)
+        if dry_run:
+            continue
+        with engine.begin() as conn:
+            conn.execute(text(ddl))
+        applied.append(description)
+
+    results = {}
+    if backfill and not dry_run:
+        if "create table daily_event_stats" in applied:
+            results["daily_event_stats"] = rebuild_rollups(engine, days=ROLLUP_BACKFILL_DAYS)
+        if "create table user_activity" in applied:
+            results["user_activity"] = rebuild_user_activity(engine)
+        for table, result in results.items():
+            logger.info(f"Backfilled {table}: {result}")
+
+    return {"applied": applied, "backfill": results}
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Bring an existing database up to db/init.sql.")
+    parser.add_argument("--database-url", default=None, help="Defaults to DATABASE_URL")
+    parser.add_argument("--dry-run", action="store_true", help="Only print the pending steps")
+    parser.add_argument("--skip-backfill", action="store_true",
+                        help="Do not fill newly created rollup / leaderboard tables")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    args = _parse_args(argv)
+
+    url = args.database_url or get_config().DATABASE_URL
+    engine = create_engine(url, future=True)
+    return upgrade(engine, dry_run=args.dry_run, backfill=not args.skip_backfill)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# utils/admin_counters.py
+"""
+Admin Counters
+Admin dashboard'undaki tüm skaler sayaçları (overview, clubs, reports,
+attendance) tek bir conditional-aggregation sorgusuyla hesaplar ve kısa
+TTL ile ortak cache'te (bkz. utils/cache.py, TAG_ADMIN) tutar.
+
+Stampede koruması: TTL dolduğunda sadece bir thread sorguyu çalıştırır;
+diğerleri eski (stale) değeri döndürür. Hiç değer yoksa hepsi ilk
+hesaplamayı bekler. Admin write path'leri invalidate_tags(TAG_ADMIN) çağırır.
+"""
+
+import logging
+from sqlalchemy import Engine, text
+from backend.utils.cache import TAG_ADMIN, cache
+from backend.utils.event_status import is_upcoming
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 30
+
+# TTL dolduktan / invalidate edildikten sonra yenilenirken servis edilebilecek süre
+STALE_SECONDS = 300
+
+CACHE_KEY = "admin:counters"
+
+COUNTERS_QUERY = f"""
+    SELECT
+        ev.total_events,
+        ev.active_events,
+        ev.organization_events,
+        us.total_users,
+        org.total_clubs,
+        org.active_clubs,
+        mem.total_members,
+        par.total_attendance,
+        par.unique_attendees,
+        par.attended_events,
+        rep.total_reports,
+        rep.pending_reports,
+        rep.reviewed_reports,
+        rep.unreviewed_reports,
+        rep.event_reports,
+        rep.organization_reports
+    FROM (
+        SELECT
+            COUNT(*) AS total_events,
+            SUM({is_upcoming('events')}) AS active_events,
+            SUM(owner_type = 'ORGANIZATION') AS organization_events
+        FROM events
+    ) ev
+    CROSS JOIN (
+        SELECT COUNT(*) AS total_users FROM users
+    ) us
+    CROSS JOIN (
+        SELECT
+            COUNT(*) AS total_clubs,
+            SUM(status = 'ACTIVE') AS active_clubs
+        FROM organizations
+    ) org
+    CROSS JOIN (
+        SELECT COUNT(*) AS total_members FROM organization_members
+    ) mem
+    CROSS JOIN (
+        SELECT
+            COUNT(*) AS total_attendance,
+            COUNT(DISTINCT user_id) AS unique_attendees,
+            COUNT(DISTINCT event_id) AS attended_events
+        FROM participants
+        WHERE status = 'ATTENDED'
+    ) par
+    CROSS JOIN (
+        SELECT
+            COUNT(*) AS total_reports,
+            SUM(status = 'PENDING') AS pending_reports,
+            SUM(is_reviewed = TRUE) AS reviewed_reports,
+            SUM(is_reviewed = FALSE) AS unreviewed_reports,
+            SUM(event_id IS NOT NULL) AS event_reports,
+            SUM(organization_id IS NOT NULL) AS organization_reports
+        FROM reports
+    ) rep
+"""
+
+
+def compute_admin_counters(engine: Engine) -> dict:
+    """
+    Runs the single aggregation pass and returns all counters as ints.
+
+    Returns:
+        dict: Counter name -> value (plus derived average_attendance)
+    """
+    with engine.connect() as conn:
+        row = conn.execute(text(COUNTERS_QUERY)).fetchone()
+
+    # SUM(...) boş tabloda NULL, MySQL'de Decimal döner
+    counters = {key: int(value or 0) for key, value in row._mapping.items()}
+
+    attended_events = counters["attended_events"]
+    counters["average_attendance"] = (
+        counters["total_attendance"] / attended_events if attended_events else 0
+    )
+    return counters
+
+
+def get_admin_counters(app) -> dict:
+    """
+    Returns cached admin counters for the given Flask app.
+    TTL is read from ADMIN_COUNTERS_TTL (seconds).
+    """
+    return cache.get_or_set(
+        CACHE_KEY,
+        lambda: compute_admin_counters(app.engine),
+        ttl=int(app.config.get("ADMIN_COUNTERS_TTL", DEFAULT_TTL_SECONDS)),
+        tags=(TAG_ADMIN,),
+        stale_ttl=STALE_SECONDS
+    )
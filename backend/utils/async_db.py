@@ -0,0 +1,146 @@
+# utils/async_db.py
+"""
+Async Database Engines
+ASGI yolu (backend/asgi.py) için create_async_engine ile oluşturulan primary
+ve opsiyonel replica engine'leri.
+
+Sorgu kodu sync yol ile paylaşılır: AsyncConnection.run_sync() aynı
+fonksiyonu (ör. api/events.py:search_events) greenlet içinde sync bir
+Connection ile çalıştırır; ağ I/O'su async sürücü (aiomysql) üzerinden
+event loop'u bloklamadan yapılır. Bekleyen her sorgu bir thread değil,
+yalnızca bir coroutine tutar.
+
+Engine'ler event loop'a bağlıdır; pre-fork sunucuda her worker kendi
+engine'ini ASGI lifespan başlangıcında oluşturur.
+
+Replica seçimi sync yol ile aynı ReplicaMonitor (lag / sağlık) ve
+StickinessTracker'ı (read-your-writes) kullanır (bkz. utils/db.py).
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy.exc import DBAPIError
+
+logger = logging.getLogger(__name__)
+
+# Sync sürücü -> async karşılığı
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url):
+    """
+    Maps a sync DATABASE_URL to its async driver (mysql+pymysql -> mysql+aiomysql).
+    URLs that already use an async driver are returned unchanged.
+    """
+    scheme, sep, rest = url.partition("://")
+    return ASYNC_DRIVERS.get(scheme, scheme) + sep + rest
+
+
+def _async_engine_kwargs(url, config):
+    kwargs = {"pool_pre_ping": True}
+    if url.startswith("mysql"):
+        kwargs.update({
+            "pool_size": int(config.get("ASYNC_DB_POOL_SIZE", 20)),
+            "max_overflow": int(config.get("ASYNC_DB_MAX_OVERFLOW", 10)),
+            "pool_timeout": int(config.get("ASYNC_DB_POOL_TIMEOUT", 10)),
+            "pool_recycle": 1800,
+            "connect_args": {"connect_timeout": 3}
+        })
+    return kwargs
+
+
+class AsyncEngines:
+    """
+    Primary / replica pair for the read-only ASGI endpoints.
+
+    Args:
+        primary: AsyncEngine on DATABASE_URL
+        replica: AsyncEngine on DATABASE_READ_URL or None
+        monitor: ReplicaMonitor shared with the sync engines (None: replica always usable)
+        stickiness: StickinessTracker shared with the sync engines
+    """
+
+    def __init__(self, primary, replica=None, monitor=None, stickiness=None):
+        self.primary = primary
+        self.replica = replica
+        self.monitor = monitor
+        self.stickiness = stickiness
+
+    async def _replica_usable(self):
+        if self.monitor is None:
+            return True
+        if self.monitor.check_due:
+            # Lag ölçümü sync bir sorgu: event loop'u bloklamamak için thread'de
+            return await asyncio.to_thread(self.monitor.is_usable)
+        return self.monitor.is_usable()
+
+    async def _should_read_replica(self, use_primary, caller):
+        if self.replica is None or use_primary:
+            return False
+        if self.stickiness is not None and caller is not None and self.stickiness.is_sticky(caller):
+            return False
+        return await self._replica_usable()
+
+    async def _connect(self, use_primary, caller=None):
+        if await self._should_read_replica(use_primary, caller):
+            try:
+                return await self.replica.connect()
+            except DBAPIError as e:
+                if self.monitor is not None:
+                    self.monitor.mark_unhealthy(str(e))
+                else:
+                    logger.warning(f"Async replica connect failed, using primary: {str(e)}")
+        return await self.primary.connect()
+
+    async def run_sync(self, fn, *args, use_primary=False, caller=None):
+        """
+        Runs fn(conn, *args) with a sync-style Connection on a pooled async connection.
+
+        Args:
+            fn: Shared query function (same one the Flask view calls)
+            use_primary: Skip the replica (read-your-writes cookie)
+            caller: Stickiness key (see utils/db.py:caller_key) for writes made in this process
+        """
+        conn = await self._connect(use_primary, caller)
+        try:
+            return await conn.run_sync(fn, *args)
+        finally:
+            await conn.close()
+
+    async def dispose(self):
+        await self.primary.dispose()
+        if self.replica is not None:
+            await self.replica.dispose()
+
+
+def create_async_engines(config, routing=None):
+    """
+    Creates the async engines from the Flask config.
+
+    Args:
+        config: Flask config
+        routing: The Flask app's RoutingEngine; its replica monitor and
+            stickiness tracker are shared with the async engines
+
+    Config:
+        DATABASE_URL, DATABASE_READ_URL (optional),
+        ASYNC_DB_POOL_SIZE, ASYNC_DB_MAX_OVERFLOW, ASYNC_DB_POOL_TIMEOUT
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    primary_url = to_async_url(config["DATABASE_URL"])
+    read_url = config.get("DATABASE_READ_URL")
+    read_url = to_async_url(read_url) if read_url else None
+
+    return AsyncEngines(
+        create_async_engine(primary_url, **_async_engine_kwargs(primary_url, config)),
+        create_async_engine(read_url, **_async_engine_kwargs(read_url, config)) if read_url else None,
+        monitor=getattr(routing, "monitor", None),
+        stickiness=getattr(routing, "stickiness", None)
+    )
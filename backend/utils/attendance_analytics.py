@@ -0,0 +1,451 @@
+# utils/attendance_analytics.py
+"""
+Attendance Analytics
+Etkinlik başına kompakt bir kolon snapshot'ı (tip, üniversite, organizasyon,
+kapasite, kayıt, katılım, başlangıç zamanı) NumPy dizilerine yüklenir.
+Doluluk dağılımı, persentiller, tip/üniversite/organizasyon bazında no-show
+oranları ve gün/saat heatmap'i tek vektörel geçişte hesaplanır.
+
+Snapshot ve ondan türetilen sonuçlar birlikte cache'lenir; TTL dolduğunda
+(veya refresh istendiğinde) snapshot yenilenir ve sonuçlar yeniden hesaplanır.
+
+Kaynak: columnar store (utils/columnar_store.py) export'u varsa oradan,
+yoksa veritabanından tek aggregate sorgu ile (ANALYTICS_SOURCE=auto|store|db).
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import Engine, bindparam, text
+
+from backend.utils.event_status import effective_status
+from backend.utils.columnar_store import (
+    EVENT_STATUS_CODES,
+    PARTICIPANT_STATUS_CODES,
+    load_table,
+    read_manifest
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300
+
+FILL_RATE_BINS = np.array([0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100, np.inf])
+PERCENTILES = (25, 50, 75, 90, 99)
+
+SNAPSHOT_QUERY = f"""
+    SELECT
+        e.id,
+        e.title,
+        COALESCE(e.type_id, 0) AS type_id,
+        COALESCE(u.university_id, 0) AS university_id,
+        COALESCE(e.owner_organization_id, 0) AS organization_id,
+        COALESCE(e.user_limit, 0) AS capacity,
+        COALESCE(p.registered, 0) AS registered,
+        COALESCE(p.attended, 0) AS attended,
+        e.starts_at,
+        {effective_status('e')} = 'COMPLETED' AS completed
+    FROM events e
+    LEFT JOIN users u ON u.id = e.owner_user_id
+    LEFT JOIN (
+        SELECT
+            event_id,
+            COUNT(*) AS registered,
+            SUM(status = 'ATTENDED') AS attended
+        FROM participants
+        GROUP BY event_id
+    ) p ON p.event_id = e.id
+    WHERE e.status IN ('FUTURE', 'COMPLETED')
+"""
+
+
+@dataclass
+class AttendanceSnapshot:
+    """Column arrays, one element per event."""
+    event_id: np.ndarray
+    title: np.ndarray
+    type_id: np.ndarray
+    university_id: np.ndarray
+    organization_id: np.ndarray
+    capacity: np.ndarray
+    registered: np.ndarray
+    attended: np.ndarray
+    starts_at: np.ndarray  # datetime64[s]
+    completed: np.ndarray
+    labels: dict = field(default_factory=dict)
+    loaded_at: str = None
+    source: str = "database"
+
+    @property
+    def size(self):
+        return int(self.event_id.shape[0])
+
+
+def _int_column(rows, index):
+    return np.fromiter((int(row[index] or 0) for row in rows), dtype=np.int64, count=len(rows))
+
+
+def build_snapshot(rows, labels=None) -> AttendanceSnapshot:
+    """
+    Builds a snapshot from SNAPSHOT_QUERY rows (column order as in the query).
+    """
+    return AttendanceSnapshot(
+        event_id=_int_column(rows, 0),
+        title=np.array([row[1] for row in rows], dtype=object),
+        type_id=_int_column(rows, 2),
+        university_id=_int_column(rows, 3),
+        organization_id=_int_column(rows, 4),
+        capacity=_int_column(rows, 5),
+        registered=_int_column(rows, 6),
+        attended=_int_column(rows, 7),
+        starts_at=np.array([row[8] for row in rows], dtype="datetime64[s]"),
+        completed=np.fromiter((bool(row[9]) for row in rows), dtype=bool, count=len(rows)),
+        labels=labels or {},
+        loaded_at=datetime.now().isoformat()
+    )
+
+
+def _load_labels(conn):
+    return {
+        "type": dict(conn.execute(text("SELECT id, code FROM event_types")).fetchall()),
+        "university": dict(conn.execute(text("SELECT id, name FROM universities")).fetchall()),
+        "organization": dict(conn.execute(text("SELECT id, name FROM organizations")).fetchall())
+    }
+
+
+def load_snapshot(engine: Engine) -> AttendanceSnapshot:
+    """Reads the per-event snapshot from the database in one aggregate query."""
+    with engine.connect() as conn:
+        rows = conn.execute(text(SNAPSHOT_QUERY)).fetchall()
+        labels = _load_labels(conn)
+    return build_snapshot(rows, labels)
+
+
+def load_snapshot_from_store(engine: Engine, base_dir, max_age_seconds=None):
+    """
+    Builds the snapshot from the exported events/participants column files.
+    Only the small label tables are read from the database.
+
+    Args:
+        engine: SQLAlchemy database engine
+        base_dir: Export root directory
+        max_age_seconds: Ignore the store if its last export is older than this
+
+    Returns:
+        AttendanceSnapshot | None: None if the store has not been exported yet,
+        is stale, or was exported before ends_at was added
+    """
+    events_manifest = read_manifest(base_dir, "events")
+    participants_manifest = read_manifest(base_dir, "participants")
+    if events_manifest is None or participants_manifest is None:
+        return None
+
+    exported_at = min(events_manifest["exported_at"], participants_manifest["exported_at"])
+    if max_age_seconds is not None:
+        age = (datetime.now() - datetime.fromisoformat(exported_at)).total_seconds()
+        if age > max_age_seconds:
+            # Bu host'un export'u durmuş (ör. export job'ı çalışmıyor): DB yoluna düşülür
+            logger.warning(f"Columnar analytics store is stale ({age:.0f}s old), using the database")
+            return None
+
+    events = load_table(base_dir, "events")
+    participants = load_table(base_dir, "participants")
+    if events is None or participants is None:
+        return None
+
+    if "ends_at" not in events:
+        # ends_at'ten önceki bir export; bir sonraki export tam olarak yeniden yazar
+        return None
+
+    status = events["status"]
+    visible = (status == EVENT_STATUS_CODES["FUTURE"]) | (status == EVENT_STATUS_CODES["COMPLETED"])
+
+    # effective_status() ile aynı: bitmiş FUTURE etkinlikler COMPLETED sayılır
+    ends_at = np.where(np.isnat(events["ends_at"]), events["starts_at"], events["ends_at"])
+    completed = (status == EVENT_STATUS_CODES["COMPLETED"]) | (
+        (status == EVENT_STATUS_CODES["FUTURE"]) & (ends_at < np.datetime64(datetime.now(), "s"))
+    )
+    event_ids = np.asarray(events["id"][visible])
+    n = event_ids.shape[0]
+
+    # Katılımcıları etkinlik pozisyonuna eşle (event id'leri sıralı)
+    positions = np.searchsorted(event_ids, participants["event_id"])
+    matched = positions < n
+    matched[matched] = event_ids[positions[matched]] == participants["event_id"][matched]
+    positions = positions[matched]
+    attended_flags = participants["status"][matched] == PARTICIPANT_STATUS_CODES["ATTENDED"]
+
+    with engine.connect() as conn:
+        labels = _load_labels(conn)
+
+    return AttendanceSnapshot(
+        event_id=event_ids,
+        title=np.full(n, None, dtype=object),
+        type_id=np.asarray(events["type_id"][visible]),
+        university_id=np.asarray(events["university_id"][visible]),
+        organization_id=np.asarray(events["owner_organization_id"][visible]),
+        capacity=np.asarray(events["user_limit"][visible]),
+        registered=np.bincount(positions, minlength=n).astype(np.int64),
+        attended=np.bincount(positions, weights=attended_flags, minlength=n).astype(np.int64),
+        starts_at=np.asarray(events["starts_at"][visible]),
+        completed=np.asarray(completed[visible]),
+        labels=labels,
+        loaded_at=exported_at,
+        source="columnar_store"
+    )
+
+
+# -------------------------------------------------------------------
+# Vektörel hesaplamalar
+# -------------------------------------------------------------------
+def _percentiles(values):
+    if values.size == 0:
+        return {f"p{p}": None for p in PERCENTILES}
+    computed = np.percentile(values, PERCENTILES)
+    return {f"p{p}": round(float(v), 2) for p, v in zip(PERCENTILES, computed)}
+
+
+def _grouped_no_show(keys, registered, no_show, labels):
+    if keys.size == 0:
+        return []
+
+    groups, inverse = np.unique(keys, return_inverse=True)
+    registered_sum = np.bincount(inverse, weights=registered)
+    no_show_sum = np.bincount(inverse, weights=no_show)
+    event_count = np.bincount(inverse)
+    rates = np.divide(
+        no_show_sum * 100.0, registered_sum,
+        out=np.zeros_like(no_show_sum), where=registered_sum > 0
+    )
+
+    order = np.argsort(-rates, kind="stable")
+    return [
+        {
+            "id": int(groups[i]) or None,
+            "name": labels.get(int(groups[i])),
+            "events": int(event_count[i]),
+            "registered": int(registered_sum[i]),
+            "no_show": int(no_show_sum[i]),
+            "no_show_rate": round(float(rates[i]), 2)
+        }
+        for i in order
+    ]
+
+
+def _weekday_hour(starts_at):
+    seconds = starts_at.astype(np.int64)
+    days = seconds // 86400
+    # 1970-01-01 Perşembe -> Pazartesi = 0
+    weekday = (days + 3) % 7
+    hour = (seconds - days * 86400) // 3600
+    return weekday, hour
+
+
+def compute_analytics(snapshot: AttendanceSnapshot) -> dict:
+    """
+    Computes all attendance analytics from a snapshot in one vectorized pass.
+
+    Returns:
+        dict: fill_rate, attendance_rate, no_show (by_type / by_university /
+              by_organization), heatmap (7x24 attended counts, Monday first)
+    """
+    capacity = snapshot.capacity
+    registered = snapshot.registered
+    attended = snapshot.attended
+    completed = snapshot.completed
+
+    # Doluluk: kapasitesi tanımlı etkinliklerde kayıt / kapasite
+    has_capacity = capacity > 0
+    fill_rate = registered[has_capacity] * 100.0 / capacity[has_capacity]
+    fill_histogram, _ = np.histogram(fill_rate, bins=FILL_RATE_BINS)
+    bin_labels = [
+        f"{int(lo)}-{int(hi)}" if np.isfinite(hi) else f"{int(lo)}+"
+        for lo, hi in zip(FILL_RATE_BINS[:-1], FILL_RATE_BINS[1:])
+    ]
+
+    # Katılım / no-show: sadece tamamlanmış ve kaydı olan etkinlikler
+    finished = completed & (registered > 0)
+    attendance_rate = attended[finished] * 100.0 / registered[finished]
+    no_show = registered - attended
+
+    def by(keys):
+        return keys[finished]
+
+    weekday, hour = _weekday_hour(snapshot.starts_at[finished])
+    heatmap = np.bincount(
+        weekday * 24 + hour, weights=attended[finished], minlength=7 * 24
+    ).reshape(7, 24)
+
+    return {
+        "events": snapshot.size,
+        "completed_events": int(finished.sum()),
+        "fill_rate": {
+            "events_with_capacity": int(has_capacity.sum()),
+            "mean": round(float(fill_rate.mean()), 2) if fill_rate.size else None,
+            "percentiles": _percentiles(fill_rate),
+            "distribution": [
+                {"range": label, "count": int(count)}
+                for label, count in zip(bin_labels, fill_histogram)
+            ]
+        },
+        "attendance_rate": {
+            "mean": round(float(attendance_rate.mean()), 2) if attendance_rate.size else None,
+            "percentiles": _percentiles(attendance_rate)
+        },
+        "no_show": {
+            "total_registered": int(registered[finished].sum()),
+            "total_no_show": int(no_show[finished].sum()),
+            "by_type": _grouped_no_show(
+                by(snapshot.type_id), registered[finished], no_show[finished],
+                snapshot.labels.get("type", {})
+            ),
+            "by_university": _grouped_no_show(
+                by(snapshot.university_id), registered[finished], no_show[finished],
+                snapshot.labels.get("university", {})
+            ),
+            "by_organization": _grouped_no_show(
+                by(snapshot.organization_id), registered[finished], no_show[finished],
+                snapshot.labels.get("organization", {})
+            )
+        },
+        "heatmap": {
+            "weekdays": ["MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN"],
+            "hours": list(range(24)),
+            "attended": heatmap.astype(np.int64).tolist()
+        },
+        "snapshot_at": snapshot.loaded_at,
+        "source": snapshot.source
+    }
+
+
+def top_attendance_events(snapshot: AttendanceSnapshot, limit=10):
+    """
+    Completed events ranked by attendance percentage, then attendance
+    (same ordering as the previous SQL version).
+    """
+    candidates = np.flatnonzero(snapshot.completed & (snapshot.attended > 0))
+    if candidates.size == 0:
+        return []
+
+    capacity = snapshot.capacity[candidates]
+    attended = snapshot.attended[candidates]
+    percentage = np.where(capacity > 0, attended * 100.0 / np.maximum(capacity, 1), 100.0)
+
+    # lexsort: son anahtar birincil
+    order = np.lexsort((-attended, -percentage))[:limit]
+    return [
+        {
+            "event_id": int(snapshot.event_id[candidates[i]]),
+            "event_name": snapshot.title[candidates[i]],
+            "attendance": int(attended[i]),
+            "capacity": int(capacity[i]) or None,
+            "percentage": round(float(percentage[i]), 2)
+        }
+        for i in order
+    ]
+
+
+# -------------------------------------------------------------------
+# Cache
+# -------------------------------------------------------------------
+class AnalyticsCache:
+    """Holds the current snapshot and its computed analytics until the next refresh."""
+
+    def __init__(self, ttl_seconds=DEFAULT_TTL_SECONDS, loader=load_snapshot):
+        self.ttl_seconds = ttl_seconds
+        self.loader = loader
+        self._snapshot = None
+        self._analytics = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def snapshot(self, engine: Engine, force=False) -> AttendanceSnapshot:
+        snapshot = self._snapshot
+        if not force and snapshot is not None and time.monotonic() < self._expires_at:
+            return snapshot
+
+        # Değer varsa beklemeden dene; başka thread yeniliyorsa eski snapshot'ı dön
+        if not self._lock.acquire(blocking=snapshot is None or force):
+            return snapshot
+
+        try:
+            if not force and self._snapshot is not None and time.monotonic() < self._expires_at:
+                return self._snapshot
+
+            started = time.monotonic()
+            snapshot = self.loader(engine)
+            self._analytics = None
+            self._snapshot = snapshot
+            self._expires_at = time.monotonic() + self.ttl_seconds
+            logger.debug(
+                f"Attendance snapshot loaded ({snapshot.size} events) in {time.monotonic() - started:.3f}s"
+            )
+            return snapshot
+        finally:
+            self._lock.release()
+
+    def analytics(self, engine: Engine, force=False) -> dict:
+        snapshot = self.snapshot(engine, force)
+        analytics = self._analytics
+        # Sonuçlar snapshot'a bağlı; snapshot değişince yeniden hesaplanır
+        if analytics is None or analytics[0] is not snapshot:
+            analytics = (snapshot, compute_analytics(snapshot))
+            self._analytics = analytics
+        return analytics[1]
+
+    def invalidate(self):
+        self._expires_at = 0.0
+
+
+analytics_cache = AnalyticsCache()
+
+
+def _configure(app):
+    analytics_cache.ttl_seconds = int(app.config.get("ANALYTICS_SNAPSHOT_TTL", DEFAULT_TTL_SECONDS))
+
+    source = app.config.get("ANALYTICS_SOURCE", "auto").lower()
+    base_dir = app.config.get("ANALYTICS_EXPORT_DIR")
+    # İki export aralığı kaçırılmışsa store bayat sayılır
+    max_age = 2 * 60 * int(app.config.get("ANALYTICS_EXPORT_INTERVAL_MINUTES", 15))
+
+    def loader(engine):
+        if source != "db" and base_dir:
+            snapshot = load_snapshot_from_store(engine, base_dir, max_age)
+            if snapshot is not None:
+                return snapshot
+            if source == "store":
+                raise RuntimeError("Columnar analytics store has not been exported recently")
+        return load_snapshot(engine)
+
+    analytics_cache.loader = loader
+
+
+def get_attendance_analytics(app, force=False) -> dict:
+    """Cached analytics for the app; TTL from ANALYTICS_SNAPSHOT_TTL (seconds)."""
+    _configure(app)
+    return analytics_cache.analytics(app.engine, force)
+
+
+def get_top_attendance_events(app, limit=10):
+    _configure(app)
+    events = top_attendance_events(analytics_cache.snapshot(app.engine), limit)
+
+    # Store snapshot'ında başlık yok: sadece top-N için PK lookup
+    missing = [event["event_id"] for event in events if event["event_name"] is None]
+    if missing:
+        with app.engine.connect() as conn:
+            titles = dict(conn.execute(
+                text("SELECT id, title FROM events WHERE id IN :ids").bindparams(
+                    bindparam("ids", expanding=True)
+                ),
+                {"ids": missing}
+            ).fetchall())
+        for event in events:
+            if event["event_name"] is None:
+                event["event_name"] = titles.get(event["event_id"])
+
+    return events
@@ -13,9 +13,16 @@ class AuthError(Exception):
         self.code = code
 
 
-def get_token_from_header():
-    """Extracts JWT token from Authorization header."""
-    auth_header = request.headers.get("Authorization")
+def get_token_from_header(headers=None):
+    """
+    Extracts JWT token from Authorization header.
+
+    Args:
+        headers: Header mapping (default: current Flask request, ASGI path passes its own)
+    """
+    if headers is None:
+        headers = request.headers
+    auth_header = headers.get("Authorization")
     if not auth_header or not auth_header.startswith("Bearer "):
         raise AuthError("Authorization header missing or invalid", 401)
     return auth_header.split(" ", 1)[1]
@@ -32,12 +39,12 @@ def decode_jwt(token: str):
         raise AuthError("Invalid token", 401)
 
 
-def verify_jwt():
+def verify_jwt(headers=None):
     """
     Full helper: verifies Authorization header,
     decodes JWT, and returns user_id.
     """
-    token = get_token_from_header()
+    token = get_token_from_header(headers)
     payload = decode_jwt(token)
     user_id = payload.get("userId")
 
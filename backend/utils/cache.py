@@ -0,0 +1,634 @@
+# utils/cache.py
+"""
+Shared Cache
+Endpoint ve servislerin ortak cache katmanı: get / set / delete, TTL, tag
+bazlı invalidation, single-flight yükleme ve sınırlı bellek.
+
+Backend'ler (CACHE_BACKEND):
+- local: process içi LRU (CACHE_MAX_ENTRIES ve yaklaşık CACHE_MAX_BYTES ile
+  sınırlı); invalidation sadece
+  bu worker'ı etkiler, diğer worker'lar TTL dolunca yeniler
+- redis: Redis protokolü konuşan paylaşımlı store (CACHE_REDIS_URL). Değerler
+  uygulamanın JSON provider'ıyla serileştirilir; invalidation tüm worker'lara
+  yansır. CACHE_REDIS_URL=memory:// ile sunucusuz, process içi bir Redis
+  taklidi (InMemoryRedis) kullanılır (lokal geliştirme / doğrulama için)
+
+Tag'ler versiyon sayaçlarıdır: her kayıt yazıldığı andaki tag versiyonlarını
+saklar, invalidate_tags() versiyonu artırır ve eski kayıtlar okunurken bayat
+sayılır (tek tek anahtar silmeye gerek kalmaz).
+
+Single-flight: aynı anahtar için eş zamanlı miss'lerde loader bir kez çalışır,
+diğerleri sonucu bekler (stale_ttl verilmişse eski değeri döner). Paylaşımlı
+backend'de worker'lar arası kısa ömürlü bir lock anahtarı kullanılır.
+
+Cache hataları isteği bozmaz: backend'e ulaşılamazsa loader doğrudan çalışır.
+
+Kullanım:
+    cache.get_or_set(key, load_something, ttl=30, tags=(TAG_EVENTS,))
+
+    invalidate_tags(TAG_EVENTS)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# Write path'lerin kullandığı tag'ler
+TAG_EVENTS = "events"
+TAG_ORGANIZATIONS = "organizations"
+TAG_ADMIN = "admin"
+
+# Her kayda eklenen tag; clear() bunu artırır
+_ALL_TAG = "*"
+
+FRESH, STALE, MISS = "fresh", "stale", "miss"
+
+DEFAULT_LOCK_TIMEOUT = 5.0
+_LOCK_POLL_SECONDS = 0.05
+
+
+class LocalBackend:
+    """
+    Process-local LRU store.
+
+    Args:
+        max_entries: Entries kept before the least recently used are evicted
+        max_bytes: Approximate payload budget (0: unbounded). Sizes are the
+            serialized length of each value; a value larger than the whole
+            budget is not stored.
+        serializer: Object with dumps (the app's JSON provider) used for sizing
+    """
+
+    name = "local"
+    shared = False
+
+    def __init__(self, max_entries=10000, max_bytes=0, serializer=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.serializer = serializer
+        self.evictions = 0
+        self.rejected = 0
+        self.bytes = 0
+        self._entries = OrderedDict()  # key -> (expires_at, entry, size)
+        self._tags = {}
+        self._lock = threading.Lock()
+
+    def _size(self, entry):
+        if not self.max_bytes:
+            return 0
+        value = entry[0]
+        if self.serializer is not None:
+            return len(self.serializer.dumps(value))
+        # init_cache() öncesi: app JSON provider'ı yok
+        return len(json.dumps(value, default=str))
+
+    def _pop(self, key):
+        item = self._entries.pop(key, None)
+        if item is not None:
+            self.bytes -= item[2]
+        return item
+
+    def get(self, key, tags=()):
+        """
+        Returns:
+            tuple: (entry or None, current versions of `tags`)
+        """
+        now = time.time()
+        with self._lock:
+            versions = [self._tags.get(tag, 0) for tag in tags]
+            item = self._entries.get(key)
+            if item is None:
+                return None, versions
+            if item[0] <= now:
+                self._pop(key)
+                return None, versions
+            self._entries.move_to_end(key)
+            return item[1], versions
+
+    def set(self, key, entry, ttl):
+        # Serileştirme lock dışında (büyük değerler diğer thread'leri bekletmesin)
+        size = self._size(entry)
+        with self._lock:
+            self._pop(key)
+            if self.max_bytes and size > self.max_bytes:
+                self.rejected += 1
+                return
+            self._entries[key] = (time.time() + ttl, entry, size)
+            self.bytes += size
+            while len(self._entries) > self.max_entries or (self.max_bytes and self.bytes > self.max_bytes):
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def add(self, key, entry, ttl):
+        """Sets `key` only if it is absent; returns True if it was set."""
+        size = self._size(entry)
+        now = time.time()
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None and item[0] > now:
+                return False
+            self._pop(key)
+            self._entries[key] = (now + ttl, entry, size)
+            self.bytes += size
+            return True
+
+    def delete(self, key):
+        with self._lock:
+            self._pop(key)
+
+    def bump_tags(self, tags):
+        with self._lock:
+            for tag in tags:
+                self._tags[tag] = self._tags.get(tag, 0) + 1
+
+    def status(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "rejected": self.rejected,
+                "tags": dict(self._tags)
+            }
+
+
+class InMemoryRedis:
+    """
+    In-process stand-in for the subset of the redis-py client used by
+    RedisBackend (get, mget, set with ex/px/nx, delete, incr, ping).
+    Values are stored as bytes, like a real server.
+    """
+
+    def __init__(self):
+        self._data = {}  # key -> (expires_at or None, bytes)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _encode(value):
+        if isinstance(value, bytes):
+            return value
+        return str(value).encode()
+
+    def _get(self, key):
+        item = self._data.get(key)
+        if item is None:
+            return None
+        if item[0] is not None and item[0] <= time.time():
+            del self._data[key]
+            return None
+        return item[1]
+
+    def ping(self):
+        return True
+
+    def get(self, name):
+        with self._lock:
+            return self._get(name)
+
+    def mget(self, keys, *args):
+        keys = list(keys) + list(args) if not isinstance(keys, str) else [keys, *args]
+        with self._lock:
+            return [self._get(key) for key in keys]
+
+    def set(self, name, value, ex=None, px=None, nx=False):
+        expires_at = None
+        if ex is not None:
+            expires_at = time.time() + ex
+        elif px is not None:
+            expires_at = time.time() + px / 1000
+        with self._lock:
+            if nx and self._get(name) is not None:
+                return None
+            self._data[name] = (expires_at, self._encode(value))
+            return True
+
+    def delete(self, *names):
+        with self._lock:
+            return sum(self._data.pop(name, None) is not None for name in names)
+
+    def incr(self, name, amount=1):
+        with self._lock:
+            current = self._get(name)
+            value = int(current or 0) + amount
+            expires_at = self._data[name][0] if current is not None else None
+            self._data[name] = (expires_at, self._encode(value))
+            return value
+
+    def flushdb(self):
+        with self._lock:
+            self._data.clear()
+        return True
+
+
+class RedisBackend:
+    """
+    Shared store over the Redis protocol.
+
+    Args:
+        client: redis.Redis-compatible client (or InMemoryRedis)
+        serializer: Object with dumps/loads (the app's JSON provider)
+        prefix: Key namespace
+    """
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, client, serializer, prefix="etkinlink:cache:"):
+        self.client = client
+        self.serializer = serializer
+        self.prefix = prefix
+
+    def _key(self, key):
+        return f"{self.prefix}{key}"
+
+    def _tag_key(self, tag):
+        return f"{self.prefix}tag:{tag}"
+
+    def get(self, key, tags=()):
+        # Kayıt ve tag versiyonları tek round trip'te
+        raw, *versions = self.client.mget([self._key(key)] + [self._tag_key(tag) for tag in tags])
+        versions = [int(v) if v is not None else 0 for v in versions]
+        if raw is None:
+            return None, versions
+        value, fresh_until, entry_versions = self.serializer.loads(raw)
+        return (value, fresh_until, tuple(entry_versions)), versions
+
+    def _dumps(self, entry):
+        value, fresh_until, versions = entry
+        return self.serializer.dumps([value, fresh_until, list(versions)])
+
+    def set(self, key, entry, ttl):
+        self.client.set(self._key(key), self._dumps(entry), px=max(1, int(ttl * 1000)))
+
+    def add(self, key, entry, ttl):
+        return bool(self.client.set(self._key(key), self._dumps(entry), px=max(1, int(ttl * 1000)), nx=True))
+
+    def delete(self, key):
+        self.client.delete(self._key(key))
+
+    def bump_tags(self, tags):
+        for tag in tags:
+            self.client.incr(self._tag_key(tag))
+
+    def status(self):
+        return {"client": type(self.client).__name__, "prefix": self.prefix}
+
+
+class _Flight:
+    __slots__ = ("lock", "users")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users = 0
+
+
+class Cache:
+    """
+    Cache front-end: TTL + tag freshness, single-flight loading and stats.
+
+    Args:
+        backend: LocalBackend or RedisBackend
+        lock_timeout: Max seconds a miss waits for another loader
+    """
+
+    def __init__(self, backend, lock_timeout=DEFAULT_LOCK_TIMEOUT):
+        self.backend = backend
+        self.lock_timeout = lock_timeout
+        self.enabled = True
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "loads": 0, "coalesced": 0, "errors": 0}
+        self._flights = {}
+        self._flights_lock = threading.Lock()
+        self._async_flights = {}
+
+    # --- internals ---
+
+    def _count(self, name):
+        # GIL altında += yarış halinde birkaç sayım kaçırabilir; istatistik için yeterli
+        self.stats[name] += 1
+
+    @staticmethod
+    def _tags(tags):
+        return (_ALL_TAG,) + tuple(tags)
+
+    def _lookup(self, key, tags, stale_ttl=0):
+        """
+        Returns:
+            tuple: (FRESH | STALE | MISS, value, current tag versions)
+        """
+        try:
+            entry, versions = self.backend.get(key, tags)
+        except Exception as e:
+            self._count("errors")
+            logger.warning(f"Cache read failed for {key}: {e}")
+            return MISS, None, None
+
+        versions = tuple(versions)
+        if entry is None:
+            return MISS, None, versions
+
+        value, fresh_until, entry_versions = entry
+        now = time.time()
+        if now < fresh_until and tuple(entry_versions) == versions:
+            return FRESH, value, versions
+        if stale_ttl and now < fresh_until + stale_ttl:
+            return STALE, value, versions
+        return MISS, None, versions
+
+    def _store(self, key, value, ttl, stale_ttl, versions):
+        if versions is None:
+            return
+        try:
+            self.backend.set(key, (value, time.time() + ttl, versions), ttl + stale_ttl)
+        except Exception as e:
+            self._count("errors")
+            logger.warning(f"Cache write failed for {key}: {e}")
+
+    def _try_lock(self, key):
+        # Worker'lar arası single-flight (sadece paylaşımlı backend'de)
+        if not self.backend.shared:
+            return True
+        try:
+            return self.backend.add(f"lock:{key}", (None, 0, ()), self.lock_timeout)
+        except Exception:
+            return True
+
+    def _unlock(self, key):
+        if self.backend.shared:
+            try:
+                self.backend.delete(f"lock:{key}")
+            except Exception:
+                pass
+
+    def _join_flight(self, key):
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+            flight.users += 1
+            return flight
+
+    def _leave_flight(self, key, flight):
+        with self._flights_lock:
+            flight.users -= 1
+            if flight.users == 0 and self._flights.get(key) is flight:
+                del self._flights[key]
+
+    # --- public API ---
+
+    def get(self, key, tags=()):
+        """Fresh value for `key`, or None."""
+        if not self.enabled:
+            return None
+        state, value, _ = self._lookup(key, self._tags(tags))
+        self._count("hits" if state == FRESH else "misses")
+        return value if state == FRESH else None
+
+    def set(self, key, value, ttl, tags=()):
+        if not self.enabled:
+            return
+        tags = self._tags(tags)
+        try:
+            _, versions = self.backend.get(key, tags)
+        except Exception as e:
+            self._count("errors")
+            logger.warning(f"Cache write failed for {key}: {e}")
+            return
+        self._store(key, value, ttl, 0, tuple(versions))
+
+    def delete(self, key):
+        try:
+            self.backend.delete(key)
+        except Exception as e:
+            self._count("errors")
+            logger.warning(f"Cache delete failed for {key}: {e}")
+
+    def invalidate_tags(self, *tags):
+        """Marks every entry carrying one of `tags` as stale."""
+        try:
+            self.backend.bump_tags(tags)
+        except Exception as e:
+            self._count("errors")
+            logger.warning(f"Cache invalidation failed for {tags}: {e}")
+
+    def clear(self):
+        self.invalidate_tags(_ALL_TAG)
+
+    def get_or_set(self, key, loader, ttl, tags=(), stale_ttl=0):
+        """
+        Returns the cached value or loads it once per key (single-flight).
+
+        Args:
+            key: Cache key
+            loader: Zero-argument callable producing the value
+            ttl: Seconds the value is fresh
+            tags: Tags for invalidate_tags()
+            stale_ttl: Seconds an expired / invalidated value may still be
+                served while another caller refreshes it (0: never)
+
+        Returns:
+            Cached or freshly loaded value. Treat it as read-only; the local
+            backend hands the same object to every caller.
+        """
+        if not self.enabled:
+            return loader()
+
+        tags = self._tags(tags)
+        state, value, versions = self._lookup(key, tags, stale_ttl)
+        if state == FRESH:
+            self._count("hits")
+            return value
+
+        flight = self._join_flight(key)
+        try:
+            # Eski değer varsa beklemeden dene; başka thread yüklüyorsa stale dön
+            if state == STALE:
+                acquired = flight.lock.acquire(blocking=False)
+                if not acquired:
+                    self._count("stale_hits")
+                    return value
+            else:
+                acquired = flight.lock.acquire(timeout=self.lock_timeout)
+
+            try:
+                if acquired:
+                    state, value, versions = self._lookup(key, tags, stale_ttl)
+                    if state == FRESH:
+                        self._count("coalesced")
+                        return value
+                self._count("misses")
+                return self._load(key, loader, ttl, stale_ttl, tags, versions)
+            finally:
+                if acquired:
+                    flight.lock.release()
+        finally:
+            self._leave_flight(key, flight)
+
+    def _load(self, key, loader, ttl, stale_ttl, tags, versions):
+        locked = self._try_lock(key)
+        if not locked:
+            # Başka bir worker yüklüyor; sonucu bekle
+            deadline = time.monotonic() + self.lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(_LOCK_POLL_SECONDS)
+                state, value, versions = self._lookup(key, tags)
+                if state == FRESH:
+                    self._count("coalesced")
+                    return value
+
+        try:
+            self._count("loads")
+            value = loader()
+            self._store(key, value, ttl, stale_ttl, versions)
+            return value
+        finally:
+            if locked:
+                self._unlock(key)
+
+    async def aget_or_set(self, key, loader, ttl, tags=(), stale_ttl=0):
+        """
+        Async get_or_set for the ASGI path. `loader` returns an awaitable;
+        concurrent misses in this event loop await a single load.
+        """
+        if not self.enabled:
+            return await loader()
+
+        # Paylaşımlı backend çağrıları bloklar; event loop'u tutmasın
+        run = asyncio.to_thread if self.backend.shared else _call
+
+        tags = self._tags(tags)
+        state, value, versions = await run(self._lookup, key, tags, stale_ttl)
+        if state == FRESH:
+            self._count("hits")
+            return value
+
+        pending = self._async_flights.get(key)
+        if pending is not None:
+            if state == STALE:
+                self._count("stale_hits")
+                return value
+            self._count("coalesced")
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._async_flights[key] = future
+        self._count("misses")
+        locked = await run(self._try_lock, key)
+        try:
+            if not locked:
+                deadline = time.monotonic() + self.lock_timeout
+                while time.monotonic() < deadline:
+                    await asyncio.sleep(_LOCK_POLL_SECONDS)
+                    state, value, versions = await run(self._lookup, key, tags)
+                    if state == FRESH:
+                        future.set_result(value)
+                        return value
+
+            self._count("loads")
+            value = await loader()
+            await run(self._store, key, value, ttl, stale_ttl, versions)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Bekleyen yoksa "exception was never retrieved" uyarısı çıkmasın
+            future.exception()
+            raise
+        finally:
+            self._async_flights.pop(key, None)
+            if locked:
+                await run(self._unlock, key)
+
+    def status(self):
+        return {
+            "enabled": self.enabled,
+            "backend": self.backend.name,
+            "in_flight": len(self._flights) + len(self._async_flights),
+            **self.stats,
+            **self.backend.status()
+        }
+
+
+async def _call(fn, *args):
+    return fn(*args)
+
+
+# Uygulama başlarken init_cache() ile yapılandırılır; öncesinde local backend
+cache = Cache(LocalBackend())
+
+
+def invalidate_tags(*tags):
+    """Invalidates cached entries by tag (called from write paths after commit)."""
+    cache.invalidate_tags(*tags)
+
+
+def create_backend(config, serializer):
+    """
+    Builds the configured backend.
+
+    Config:
+        CACHE_BACKEND: local | redis
+        CACHE_REDIS_URL: redis://... or memory:// (InMemoryRedis)
+        CACHE_MAX_ENTRIES, CACHE_MAX_BYTES, CACHE_KEY_PREFIX
+    """
+    kind = config.get("CACHE_BACKEND", "local")
+
+    if kind == "local":
+        return LocalBackend(
+            int(config.get("CACHE_MAX_ENTRIES", 10000)),
+            int(config.get("CACHE_MAX_BYTES", 0)),
+            serializer
+        )
+
+    if kind != "redis":
+        raise ValueError("CACHE_BACKEND must be 'local' or 'redis'")
+
+    url = config.get("CACHE_REDIS_URL") or "memory://"
+    if url.startswith("memory://"):
+        client = InMemoryRedis()
+    else:
+        import redis  # opsiyonel: sadece redis backend'inde gerekli
+
+        client = redis.Redis.from_url(url, socket_timeout=1.0, socket_connect_timeout=1.0)
+    return RedisBackend(client, serializer, config.get("CACHE_KEY_PREFIX", "etkinlink:cache:"))
+
+
+def init_cache(app):
+    """
+    Configures the shared cache for the app. Call after init_json_provider
+    (the redis backend serializes with app.json).
+
+    Config:
+        CACHE_ENABLED, CACHE_BACKEND, CACHE_REDIS_URL, CACHE_MAX_ENTRIES,
+        CACHE_MAX_BYTES, CACHE_KEY_PREFIX, CACHE_LOCK_TIMEOUT
+    """
+    cache.backend = create_backend(app.config, app.json)
+    cache.enabled = bool(app.config.get("CACHE_ENABLED", True))
+    cache.lock_timeout = float(app.config.get("CACHE_LOCK_TIMEOUT", DEFAULT_LOCK_TIMEOUT))
+
+    if cache.backend.shared:
+        try:
+            cache.backend.client.ping()
+        except Exception as e:
+            # Cache opsiyonel: istekler loader'a düşer
+            logger.warning(f"Cache backend is unreachable: {e}")
+
+    if not cache.backend.shared and int(os.getenv("SERVER_WORKERS", 1)) > 1:
+        logger.warning(
+            "CACHE_BACKEND=local with several workers: invalidation only reaches the writing "
+            "worker, others serve cached entries until their TTL (use CACHE_BACKEND=redis)"
+        )
+
+    logger.info(f"Cache backend: {cache.backend.name}")
+    return cache
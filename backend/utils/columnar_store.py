@@ -0,0 +1,401 @@
+# utils/columnar_store.py
+"""
+Columnar Analytics Store
+events, participants, ratings, reports ve organization_members tablolarını
+(updated_at, id) watermark'ı ile artımlı olarak lokal kolon dosyalarına
+(.npy, memory-map edilebilir) aktarır. Ağır admin analitikleri bu dosyaları
+okur; böylece analitik taramalar OLTP tablolarından uzak tutulur.
+
+Dizin yapısı:
+    <ANALYTICS_EXPORT_DIR>/<table>/manifest.json
+    <ANALYTICS_EXPORT_DIR>/<table>/<generation>/<column>.npy
+
+Her export yeni bir generation dizinine yazılır ve manifest atomik olarak
+(os.replace) değiştirilir; okuyucular her zaman tutarlı bir kümeyi görür.
+Silinen satırlar her çalışmada PK index taramasıyla (SELECT id) ayıklanır.
+"""
+
+import json
+import logging
+import os
+import shutil
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+import numpy as np
+from sqlalchemy import Engine, text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 5000
+MANIFEST_NAME = "manifest.json"
+WATERMARK_OVERLAP = timedelta(seconds=5)
+
+# Sayısallaştırılmış ENUM kodları (0 = NULL / bilinmiyor)
+EVENT_STATUS_CODES = {"DRAFT": 1, "PENDING_REVIEW": 2, "FUTURE": 3, "COMPLETED": 4, "REJECTED": 5}
+PARTICIPANT_STATUS_CODES = {"NO_SHOW": 1, "ATTENDED": 2}
+REPORT_STATUS_CODES = {"PENDING": 1, "ACCEPTED": 2, "REJECTED": 3}
+MEMBER_ROLE_CODES = {"MEMBER": 1, "ADMIN": 2, "REPRESENTATIVE": 3}
+
+
+@dataclass
+class TableSpec:
+    """Source query and column types of one exported table."""
+    name: str
+    select: str
+    columns: dict
+    codes: dict = field(default_factory=dict)
+
+
+# Kolon tipleri: "int" (NULL -> 0), "datetime" (datetime64[s], NULL -> NaT), "code" (ENUM -> int8)
+TABLE_SPECS = {
+    "events": TableSpec(
+        name="events",
+        select="""
+            SELECT
+                e.id, e.owner_user_id, e.owner_organization_id, e.type_id,
+                u.university_id, e.user_limit, e.price, e.status,
+                e.starts_at, e.ends_at, e.created_at, e.updated_at
+            FROM events e
+            LEFT JOIN users u ON u.id = e.owner_user_id
+        """,
+        columns={
+            "id": "int", "owner_user_id": "int", "owner_organization_id": "int", "type_id": "int",
+            "university_id": "int", "user_limit": "int", "price": "float", "status": "code",
+            "starts_at": "datetime", "ends_at": "datetime", "created_at": "datetime",
+            "updated_at": "datetime"
+        },
+        codes={"status": EVENT_STATUS_CODES}
+    ),
+    "participants": TableSpec(
+        name="participants",
+        select="""
+            SELECT p.id, p.event_id, p.user_id, p.status, p.created_at, p.updated_at
+            FROM participants p
+        """,
+        columns={
+            "id": "int", "event_id": "int", "user_id": "int", "status": "code",
+            "created_at": "datetime", "updated_at": "datetime"
+        },
+        codes={"status": PARTICIPANT_STATUS_CODES}
+    ),
+    "ratings": TableSpec(
+        name="ratings",
+        select="""
+            SELECT r.id, r.event_id, r.user_id, r.rating, r.updated_at
+            FROM ratings r
+        """,
+        columns={
+            "id": "int", "event_id": "int", "user_id": "int", "rating": "int",
+            "updated_at": "datetime"
+        }
+    ),
+    "reports": TableSpec(
+        name="reports",
+        select="""
+            SELECT
+                r.id, r.event_id, r.organization_id, r.reporter_user_id,
+                r.status, r.is_reviewed, r.created_at, r.updated_at
+            FROM reports r
+        """,
+        columns={
+            "id": "int", "event_id": "int", "organization_id": "int", "reporter_user_id": "int",
+            "status": "code", "is_reviewed": "int", "created_at": "datetime", "updated_at": "datetime"
+        },
+        codes={"status": REPORT_STATUS_CODES}
+    ),
+    "organization_members": TableSpec(
+        name="organization_members",
+        select="""
+            SELECT m.id, m.organization_id, m.user_id, m.role, m.joined_at, m.updated_at
+            FROM organization_members m
+        """,
+        columns={
+            "id": "int", "organization_id": "int", "user_id": "int", "role": "code",
+            "joined_at": "datetime", "updated_at": "datetime"
+        },
+        codes={"role": MEMBER_ROLE_CODES}
+    )
+}
+
+_DTYPES = {"int": np.int64, "float": np.float64, "code": np.int8, "datetime": "datetime64[s]"}
+
+
+def _table_alias(spec):
+    # select'teki "FROM <table> <alias>" -> alias
+    return spec.select.split(f"FROM {spec.name}")[1].split()[0]
+
+
+def _column_array(spec, column, values):
+    kind = spec.columns[column]
+    if kind == "datetime":
+        return np.array(values, dtype="datetime64[s]")
+    if kind == "code":
+        mapping = spec.codes[column]
+        return np.fromiter((mapping.get(v, 0) for v in values), dtype=np.int8, count=len(values))
+    if kind == "float":
+        return np.fromiter((float(v or 0) for v in values), dtype=np.float64, count=len(values))
+    return np.fromiter((int(v or 0) for v in values), dtype=np.int64, count=len(values))
+
+
+def _empty_columns(spec):
+    return {column: np.empty(0, dtype=_DTYPES[kind]) for column, kind in spec.columns.items()}
+
+
+def _rows_to_columns(spec, rows):
+    names = list(spec.columns)
+    transposed = list(zip(*rows)) if rows else [() for _ in names]
+    return {name: _column_array(spec, name, list(values)) for name, values in zip(names, transposed)}
+
+
+# -------------------------------------------------------------------
+# Manifest / dosya okuma-yazma
+# -------------------------------------------------------------------
+def _table_dir(base_dir, table):
+    return os.path.join(base_dir, table)
+
+
+def read_manifest(base_dir, table):
+    path = os.path.join(_table_dir(base_dir, table), MANIFEST_NAME)
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def load_table(base_dir, table, mmap=True):
+    """
+    Loads the current generation of an exported table.
+
+    Args:
+        base_dir: Export root directory
+        table: Table name (see TABLE_SPECS)
+        mmap: Memory-map the .npy files instead of reading them
+
+    Returns:
+        dict | None: Column name -> array, or None if never exported
+    """
+    manifest = read_manifest(base_dir, table)
+    if manifest is None:
+        return None
+
+    generation_dir = os.path.join(_table_dir(base_dir, table), manifest["generation"])
+    mode = "r" if mmap else None
+    return {
+        column: np.load(os.path.join(generation_dir, f"{column}.npy"), mmap_mode=mode)
+        for column in manifest["columns"]
+    }
+
+
+def _write_generation(base_dir, table, columns, manifest):
+    table_dir = _table_dir(base_dir, table)
+    generation = f"g{time.time_ns()}"
+    generation_dir = os.path.join(table_dir, generation)
+    os.makedirs(generation_dir, exist_ok=True)
+
+    for column, values in columns.items():
+        np.save(os.path.join(generation_dir, f"{column}.npy"), values)
+
+    previous = read_manifest(base_dir, table)
+    manifest = {**manifest, "generation": generation, "columns": list(columns)}
+
+    tmp_path = os.path.join(table_dir, f".{MANIFEST_NAME}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, os.path.join(table_dir, MANIFEST_NAME))
+
+    # Bir önceki generation okuyucular için tutulur, daha eskileri silinir
+    keep = {generation, previous["generation"] if previous else None}
+    for entry in os.listdir(table_dir):
+        path = os.path.join(table_dir, entry)
+        if entry.startswith("g") and entry not in keep and os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+
+    return manifest
+
+
+# -------------------------------------------------------------------
+# Export
+# -------------------------------------------------------------------
+def _fetch_changed(conn, spec, watermark, batch_size):
+    alias = _table_alias(spec)
+    rows = []
+    ts, last_id = watermark
+
+    while True:
+        where = ""
+        params = {"limit": batch_size}
+        if ts is not None:
+            where = f"""
+                WHERE {alias}.updated_at > :ts
+                   OR ({alias}.updated_at = :ts AND {alias}.id > :last_id)
+            """
+            params.update({"ts": ts, "last_id": last_id})
+
+        batch = conn.execute(text(f"""
+            {spec.select}
+            {where}
+            ORDER BY {alias}.updated_at, {alias}.id
+            LIMIT :limit
+        """), params).fetchall()
+
+        rows.extend(batch)
+        if len(batch) < batch_size:
+            return rows
+
+        last = batch[-1]._mapping
+        ts, last_id = last["updated_at"], last["id"]
+
+
+def _live_ids(conn, table, batch_size):
+    result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(
+        text(f"SELECT id FROM {table}")
+    )
+    chunks = [np.fromiter((row[0] for row in batch), dtype=np.int64) for batch in result.partitions()]
+    return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int64)
+
+
+def _unchanged(current, changed):
+    """True if every fetched row already exists in the store with identical values."""
+    if changed["id"].size == 0:
+        return True
+
+    # current id'ye göre sıralı tutulur
+    positions = np.searchsorted(current["id"], changed["id"])
+    positions = np.minimum(positions, max(current["id"].size - 1, 0))
+    if current["id"].size == 0 or not np.array_equal(current["id"][positions], changed["id"]):
+        return False
+
+    return all(
+        np.array_equal(current[column][positions], values, equal_nan=True)
+        for column, values in changed.items()
+    )
+
+
+def export_table(engine: Engine, base_dir, table, full=False, batch_size=DEFAULT_BATCH_SIZE,
+                 fence=None) -> dict:
+    """
+    Incrementally exports one table into the columnar store.
+
+    Rows changed since the stored (updated_at, id) watermark replace their
+    previous versions; rows deleted at the source are dropped. `fence`
+    (callable(conn)) is checked right before the new generation is published.
+
+    Returns:
+        dict: table, rows, changed, removed, watermark
+    """
+    spec = TABLE_SPECS[table]
+    manifest = None if full else read_manifest(base_dir, table)
+    if manifest is not None and manifest["columns"] != list(spec.columns):
+        # Kolon listesi değişti (ör. yeni kolon eklendi): eski generation birleştirilemez
+        logger.info(f"Columns of '{table}' changed; running a full export")
+        manifest = None
+
+    stored = (None, 0)
+    fetch_from = (None, 0)
+    if manifest is not None:
+        current = {k: np.asarray(v) for k, v in load_table(base_dir, table, mmap=False).items()}
+        if manifest.get("watermark_ts"):
+            stored = (datetime.fromisoformat(manifest["watermark_ts"]), manifest.get("watermark_id", 0))
+            # Aynı saniyede geç commit edilen satırları kaçırmamak için pencere geri kaydırılır;
+            # tekrar okunan satırlar idempotent olarak yerlerine yazılır
+            fetch_from = (stored[0] - WATERMARK_OVERLAP, 0)
+    else:
+        current = _empty_columns(spec)
+
+    with engine.connect() as conn:
+        changed_rows = _fetch_changed(conn, spec, fetch_from, batch_size)
+        live_ids = _live_ids(conn, table, batch_size)
+
+    changed = _rows_to_columns(spec, changed_rows) if changed_rows else _empty_columns(spec)
+
+    # Değişen satırların eski halleri çıkarılır, kaynakta silinmiş satırlar ayıklanır
+    superseded = np.isin(current["id"], changed["id"])
+    merged = {
+        column: np.concatenate([current[column][~superseded], changed[column]])
+        for column in spec.columns
+    }
+    alive = np.isin(merged["id"], live_ids)
+    removed = int((~alive).sum())
+
+    watermark = stored
+    if changed_rows:
+        last = changed_rows[-1]._mapping
+        last_ts = last["updated_at"]
+        if isinstance(last_ts, str):
+            last_ts = datetime.fromisoformat(last_ts)
+        if watermark[0] is None or (last_ts, int(last["id"])) > watermark:
+            watermark = (last_ts, int(last["id"]))
+
+    if manifest is not None and not removed and _unchanged(current, changed):
+        return {"table": table, "rows": manifest["rows"], "changed": 0, "removed": 0,
+                "watermark": manifest["watermark_ts"]}
+
+    order = np.argsort(merged["id"][alive], kind="stable")
+    merged = {column: values[alive][order] for column, values in merged.items()}
+
+    if fence is not None:
+        with engine.connect() as conn:
+            fence(conn)
+
+    manifest = _write_generation(base_dir, table, merged, {
+        "table": table,
+        "rows": int(merged["id"].shape[0]),
+        "watermark_ts": watermark[0].isoformat() if watermark[0] else None,
+        "watermark_id": watermark[1],
+        "exported_at": datetime.now().isoformat()
+    })
+
+    return {
+        "table": table,
+        "rows": manifest["rows"],
+        "changed": len(changed_rows),
+        "removed": removed,
+        "watermark": manifest["watermark_ts"]
+    }
+
+
+def export_all(engine: Engine, base_dir, full=False, tables=None, fence=None) -> dict:
+    """
+    Scheduler entry point: exports every table in TABLE_SPECS.
+
+    Args:
+        engine: SQLAlchemy database engine
+        base_dir: Export root directory
+        full: Ignore watermarks and rewrite everything
+        tables: Subset of table names (default: all)
+        fence: Optional callable(conn) checked before each table is published
+
+    Returns:
+        dict: success, tables, timestamp, errors
+    """
+    results = []
+    errors = []
+
+    for table in tables or TABLE_SPECS:
+        try:
+            results.append(export_table(engine, base_dir, table, full=full, fence=fence))
+        except Exception as e:
+            error_msg = f"Error exporting {table}: {str(e)}"
+            logger.error(error_msg)
+            errors.append(error_msg)
+
+    if results:
+        logger.info(
+            "Columnar export finished: "
+            + ", ".join(f"{r['table']}={r['rows']} (+{r['changed']})" for r in results)
+        )
+
+    return {
+        "success": not errors,
+        "tables": results,
+        "timestamp": datetime.now().isoformat(),
+        "errors": errors or None
+    }
+
+
+def get_store_status(base_dir) -> dict:
+    """Manifest summary per table (for the admin status endpoint)."""
+    return {table: read_manifest(base_dir, table) for table in TABLE_SPECS}
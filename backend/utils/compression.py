@@ -0,0 +1,240 @@
+# utils/compression.py
+"""
+Response Compression
+Accept-Encoding'e göre brotli (br) veya gzip ile yanıt sıkıştırma.
+
+- COMPRESSION_MIN_SIZE altındaki gövdeler sıkıştırılmaz (küçük JSON'larda
+  CPU maliyeti kazançtan fazla)
+- Sadece metin tipleri (JSON, *+json, MessagePack, text/*, JS, XML); streaming export'lar,
+  zaten encode edilmiş yanıtlar ve 204/304 atlanır
+- brotli paketi kurulu değilse yalnızca gzip kullanılır
+- Önbelleğe alınabilir yanıtların (GET 200, no-store / private değil)
+  sıkıştırılmış hali gövde hash'iyle byte sınırlı bir LRU'da tutulur; aynı sayfa
+  tekrar istendiğinde yeniden sıkıştırılmaz
+
+Flask yanıtları after_request'te, ASGI yolu (backend/asgi.py) compress_body()
+ile aynı kurallarla sıkıştırılır.
+"""
+
+import gzip
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - opsiyonel
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/msgpack",
+    "application/javascript",
+    "application/xml",
+    "application/x-ndjson",
+    "text/",
+)
+
+# Eşit q değerinde tercih sırası
+PREFERENCE = ("br", "gzip") if brotli is not None else ("gzip",)
+
+_settings = {
+    "min_size": 1024,
+    "gzip_level": 6,
+    "brotli_quality": 4,
+}
+
+
+class CompressedBodyCache:
+    """
+    Byte-bounded LRU of compressed bodies keyed by (encoding, body digest).
+
+    Args:
+        max_bytes: Total compressed bytes kept
+        max_entry_bytes: Larger bodies are compressed but not cached
+    """
+
+    def __init__(self, max_bytes=32 * 1024 * 1024, max_entry_bytes=2 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key, body):
+        if len(body) > self.max_entry_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = body
+            self.size += len(body)
+            while self.size > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def status(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+
+_cache = None
+
+
+def get_compression_cache():
+    return _cache
+
+
+def negotiate(accept_encoding):
+    """
+    Picks the best supported encoding from an Accept-Encoding header.
+
+    Returns:
+        str | None: "br", "gzip" or None (identity)
+    """
+    if not accept_encoding:
+        return None
+
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for encoding in PREFERENCE:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def is_compressible(mimetype):
+    return bool(mimetype) and (mimetype.startswith(COMPRESSIBLE_TYPES) or mimetype.endswith("+json"))
+
+
+def _compress(body, encoding):
+    if encoding == "br":
+        return brotli.compress(body, quality=_settings["brotli_quality"])
+    return gzip.compress(body, compresslevel=_settings["gzip_level"], mtime=0)
+
+
+def compress_body(body, encoding, cacheable=False):
+    """
+    Compresses `body`, reusing a cached result for identical cacheable bodies.
+
+    Args:
+        body: Response bytes
+        encoding: "br" or "gzip"
+        cacheable: Store / look up the compressed body in the LRU
+    """
+    if not cacheable or _cache is None:
+        return _compress(body, encoding)
+
+    key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+    compressed = _cache.get(key)
+    if compressed is None:
+        compressed = _compress(body, encoding)
+        _cache.put(key, compressed)
+    return compressed
+
+
+def is_cacheable(method, status_code, cache_control):
+    if method not in ("GET", "HEAD") or status_code != 200:
+        return False
+    cache_control = (cache_control or "").lower()
+    return "no-store" not in cache_control and "private" not in cache_control
+
+
+def should_compress(body_length, status_code, mimetype, content_encoding):
+    if content_encoding or status_code < 200 or status_code in (204, 304):
+        return False
+    return is_compressible(mimetype) and body_length >= _settings["min_size"]
+
+
+def add_vary(headers):
+    vary = headers.get("Vary", "")
+    if "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding" if vary else "Accept-Encoding"
+
+
+def init_compression(app):
+    """
+    Registers response compression. Register before other after_request
+    hooks so it runs last (Flask calls them in reverse order).
+
+    Config:
+        COMPRESSION_ENABLED, COMPRESSION_MIN_SIZE, COMPRESSION_GZIP_LEVEL,
+        COMPRESSION_BROTLI_QUALITY, COMPRESSION_CACHE_BYTES
+    """
+    global _cache
+
+    if not app.config.get("COMPRESSION_ENABLED", True):
+        return None
+
+    _settings.update({
+        "min_size": int(app.config.get("COMPRESSION_MIN_SIZE", 1024)),
+        "gzip_level": int(app.config.get("COMPRESSION_GZIP_LEVEL", 6)),
+        "brotli_quality": int(app.config.get("COMPRESSION_BROTLI_QUALITY", 4)),
+    })
+    cache_bytes = int(app.config.get("COMPRESSION_CACHE_BYTES", 32 * 1024 * 1024))
+    _cache = CompressedBodyCache(cache_bytes) if cache_bytes > 0 else None
+
+    if brotli is None:
+        logger.info("brotli is not installed; responses are compressed with gzip only")
+
+    from flask import request
+
+    @app.after_request
+    def compress_response(response):
+        if response.direct_passthrough or response.is_streamed:
+            return response
+        if not is_compressible(response.mimetype):
+            return response
+
+        add_vary(response.headers)
+
+        if not should_compress(
+            response.content_length or 0, response.status_code,
+            response.mimetype, response.headers.get("Content-Encoding")
+        ):
+            return response
+
+        encoding = negotiate(request.headers.get("Accept-Encoding"))
+        if encoding is None:
+            return response
+
+        cacheable = is_cacheable(request.method, response.status_code, response.headers.get("Cache-Control"))
+        response.set_data(compress_body(response.get_data(), encoding, cacheable))
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    return _cache
@@ -0,0 +1,412 @@
+# utils/db.py
+"""
+Database Engines
+Primary (yazma) ve opsiyonel replica (okuma) engine'lerini oluşturur ve
+app.engine'i istek bazında yönlendiren bir RoutingEngine ile sarar.
+
+Yönlendirme kuralları (app.engine.connect()):
+- İstek dışı kullanım (scheduler, script)            -> primary
+- GET/HEAD dışı istekler veya @use_primary endpoint'ler -> primary
+- Kullanıcı son READ_YOUR_WRITES_SECONDS içinde yazdıysa -> primary
+- Replica gecikmesi REPLICA_MAX_LAG_SECONDS'ı aşarsa, ölçülemezse
+  veya replica'ya bağlanılamazsa                     -> primary
+- Aksi halde                                          -> replica
+
+app.engine.begin() her zaman primary'yi kullanır (açık transaction = yazma).
+
+Başarılı her yazmadan sonra (replica olmasa da) kısa ömürlü etk_primary_until
+cookie'si set edilir; recently_wrote() ile okuma cache'leri de atlanır.
+
+Her iş yükü ayrı pool kullanır (bkz. utils/db_pools.py):
+- background:  istek dışı kullanım (scheduler, script)
+- admin:       admin blueprint'i veya @db_workload("admin")
+- interactive: diğer tüm istekler
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import g, has_request_context, request
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from backend.utils.auth_utils import AuthError, decode_jwt
+from backend.utils.db_pools import WORKLOADS, create_pooled_engine, fit_pools_to_budget, prewarm
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+STICKY_COOKIE = "etk_primary_until"
+
+# SHOW REPLICA STATUS için REPLICATION CLIENT yetkisi yok
+ER_SPECIFIC_ACCESS_DENIED = 1227
+
+
+def _mysql_error_code(error):
+    args = getattr(error.orig, "args", ())
+    return args[0] if args else None
+
+
+def _engine_kwargs(url):
+    kwargs = {"pool_pre_ping": True, "future": True}
+    if url.startswith("mysql"):
+        # Ulaşılamayan replica istekleri uzun süre bloklamasın
+        kwargs["connect_args"] = {"connect_timeout": 3}
+    return kwargs
+
+
+class StickinessTracker:
+    """
+    Remembers callers that wrote recently so their reads go to the primary.
+    Process-local; the response cookie carries the window across workers.
+    """
+
+    def __init__(self, window_seconds=5, max_entries=50000):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._until = OrderedDict()
+        self._lock = threading.Lock()
+
+    def mark(self, key):
+        until = time.time() + self.window_seconds
+        with self._lock:
+            self._until[key] = until
+            self._until.move_to_end(key)
+            while len(self._until) > self.max_entries:
+                self._until.popitem(last=False)
+        return until
+
+    def is_sticky(self, key):
+        with self._lock:
+            until = self._until.get(key)
+            if until is None:
+                return False
+            if until < time.time():
+                del self._until[key]
+                return False
+            return True
+
+
+class ReplicaMonitor:
+    """Caches replica health / lag for a short interval."""
+
+    def __init__(self, engine, max_lag_seconds=5, check_interval=5, assume_no_lag=False):
+        self.engine = engine
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        # Lag ölçülemezse varsayılan: replica kullanılmaz (REPLICA_ASSUME_NO_LAG ile açılır)
+        self.assume_no_lag = assume_no_lag
+        self._healthy = True
+        self._lag = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        # REPLICATION CLIENT yetkisi yoksa lag ölçülemez (bir kez loglanır)
+        self.lag_measurable = True
+
+    def mark_unhealthy(self, reason):
+        logger.warning(f"Read replica disabled for {self.check_interval}s: {reason}")
+        self._healthy = False
+        self._checked_at = time.monotonic()
+
+    def _lag_unmeasurable(self):
+        if self.lag_measurable:
+            self.lag_measurable = False
+            logger.error(
+                "Read replica lag can't be measured: the DATABASE_READ_URL user lacks the "
+                "REPLICATION CLIENT privilege (GRANT REPLICATION CLIENT ON *.* TO ...). "
+                + ("Reads are routed to the replica assuming no lag (REPLICA_ASSUME_NO_LAG)."
+                   if self.assume_no_lag else
+                   "Reads are routed to the primary; set REPLICA_ASSUME_NO_LAG=true to override.")
+            )
+        # None: gecikme bilinmiyor, is_usable() replica'yı sağlıksız sayar
+        return 0 if self.assume_no_lag else None
+
+    def _measure_lag(self):
+        if not self.lag_measurable:
+            if not self.assume_no_lag:
+                return None
+            # Sadece bağlantı sağlığı kontrol edilir
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            return 0
+
+        with self.engine.connect() as conn:
+            try:
+                row = conn.execute(text("SHOW REPLICA STATUS")).mappings().fetchone()
+                key = "Seconds_Behind_Source"
+            except DBAPIError as e:
+                if _mysql_error_code(e) == ER_SPECIFIC_ACCESS_DENIED:
+                    return self._lag_unmeasurable()
+                # MySQL < 8.0.22
+                try:
+                    row = conn.execute(text("SHOW SLAVE STATUS")).mappings().fetchone()
+                except DBAPIError as e:
+                    if _mysql_error_code(e) == ER_SPECIFIC_ACCESS_DENIED:
+                        return self._lag_unmeasurable()
+                    raise
+                key = "Seconds_Behind_Master"
+
+        if row is None:
+            # Replikasyon tanımlı değil (ör. lokal ikinci instance): gecikme yok kabul edilir
+            return 0
+        return row[key]
+
+    @property
+    def check_due(self):
+        """True if the next is_usable() call will measure lag (a blocking query)."""
+        return time.monotonic() - self._checked_at >= self.check_interval
+
+    def is_usable(self):
+        if not self.check_due:
+            return self._healthy
+
+        # Tek bir thread ölçer; diğerleri son bilinen durumu kullanır
+        if not self._lock.acquire(blocking=False):
+            return self._healthy
+
+        try:
+            lag = self._measure_lag()
+            self._lag = lag
+            # NULL: replikasyon thread'i durmuş veya gecikme ölçülemiyor
+            self._healthy = lag is not None and lag <= self.max_lag_seconds
+            if not self._healthy and self.lag_measurable:
+                logger.warning(f"Read replica lag too high ({lag}s), routing reads to primary")
+        except Exception as e:
+            self._healthy = False
+            logger.warning(f"Read replica health check failed: {str(e)}")
+        finally:
+            self._checked_at = time.monotonic()
+            self._lock.release()
+
+        return self._healthy
+
+    def status(self):
+        return {
+            "healthy": self._healthy,
+            "lag_seconds": self._lag,
+            "lag_measurable": self.lag_measurable,
+            "max_lag_seconds": self.max_lag_seconds
+        }
+
+
+class RoutingEngine:
+    """
+    Drop-in replacement for app.engine that picks the workload pool and
+    routes connect() to the replica for read-only requests.
+    Unknown attributes are delegated to the current primary engine.
+
+    Args:
+        engines: {workload: {"primary": Engine, "replica": Engine | None}}
+    """
+
+    def __init__(self, engines, stickiness=None, monitor=None):
+        self.engines = engines
+        self.stickiness = stickiness
+        self.monitor = monitor
+
+    def __getattr__(self, name):
+        return getattr(self.primary, name)
+
+    @staticmethod
+    def workload():
+        if not has_request_context():
+            return "background"
+        if g.get("db_workload"):
+            return g.db_workload
+        return "admin" if request.blueprint == "admin" else "interactive"
+
+    @property
+    def primary(self):
+        return self.engines[self.workload()]["primary"]
+
+    @property
+    def replica(self):
+        return self.engines[self.workload()]["replica"]
+
+    def _should_read_replica(self):
+        if self.replica is None or not has_request_context():
+            return False
+        if request.method not in SAFE_METHODS or g.get("use_primary"):
+            return False
+        if _sticky_cookie_active() or self.stickiness.is_sticky(_caller_key()):
+            return False
+        return self.monitor.is_usable()
+
+    def reader(self):
+        """Engine a read in the current context should use."""
+        return self.replica if self._should_read_replica() else self.primary
+
+    def connect(self):
+        if self._should_read_replica():
+            try:
+                return self.replica.connect()
+            except DBAPIError as e:
+                self.monitor.mark_unhealthy(str(e))
+        return self.primary.connect()
+
+    def begin(self):
+        return self.primary.begin()
+
+    def all_engines(self):
+        for workload, pair in self.engines.items():
+            for role, engine in pair.items():
+                if engine is not None:
+                    yield workload, role, engine
+
+    def dispose(self, close=True):
+        for _, _, engine in self.all_engines():
+            engine.dispose(close=close)
+
+    def pool_metrics(self):
+        return [engine.pool_metrics.snapshot(engine.pool) for _, _, engine in self.all_engines()]
+
+    def status(self):
+        if self.monitor is None:
+            return {"replica": None}
+        return {
+            "replica": self.monitor.status(),
+            "read_your_writes_seconds": self.stickiness.window_seconds
+        }
+
+
+def caller_key(headers, remote_addr):
+    """Stickiness key: the JWT user if present, otherwise the client address."""
+    auth_header = headers.get("Authorization", "")
+    if auth_header.startswith("Bearer "):
+        try:
+            user_id = decode_jwt(auth_header.split(" ", 1)[1]).get("userId")
+            if user_id:
+                return f"u:{user_id}"
+        except AuthError:
+            pass
+    return f"ip:{remote_addr}"
+
+
+def _caller_key():
+    return caller_key(request.headers, request.remote_addr)
+
+
+def _sticky_cookie_active():
+    try:
+        return float(request.cookies.get(STICKY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+def recently_wrote():
+    """
+    True if the caller wrote within the read-your-writes window (sticky cookie).
+    The cookie is set after every successful write, with or without a replica.
+    """
+    return has_request_context() and _sticky_cookie_active()
+
+
+def db_workload(name):
+    """Runs an endpoint on the given workload pool (e.g. a heavy non-admin report)."""
+    if name not in WORKLOADS:
+        raise ValueError(f"Unknown workload: {name}")
+
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            g.db_workload = name
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
+
+
+def use_primary(f):
+    """
+    Forces the primary for a read-method endpoint that writes
+    (e.g. GET verification links).
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        g.use_primary = True
+        return f(*args, **kwargs)
+    return decorated_function
+
+
+def init_engines(app):
+    """
+    Creates per-workload primary (and optional replica) engines and installs
+    the routing engine as app.engine.
+
+    Config:
+        DATABASE_URL, DATABASE_READ_URL (optional), DB_POOLS, DB_POOL_PREWARM,
+        DB_MAX_CONNECTIONS, READ_YOUR_WRITES_SECONDS, REPLICA_MAX_LAG_SECONDS,
+        REPLICA_LAG_CHECK_INTERVAL, REPLICA_ASSUME_NO_LAG
+    """
+    # Worker başına pool'lar instance bütçesine sığdırılır (async pool dahil)
+    app.config.update(fit_pools_to_budget(app.config))
+
+    primary_url = app.config["DATABASE_URL"]
+    read_url = app.config.get("DATABASE_READ_URL")
+    pools = app.config.get("DB_POOLS", {})
+
+    engines = {}
+    for workload in WORKLOADS:
+        pool_config = pools.get(workload, {})
+        engines[workload] = {
+            "primary": create_pooled_engine(
+                primary_url, f"{workload}.primary", pool_config, **_engine_kwargs(primary_url)
+            ),
+            "replica": create_pooled_engine(
+                read_url, f"{workload}.replica", pool_config, **_engine_kwargs(read_url)
+            ) if read_url else None
+        }
+
+    window = int(app.config.get("READ_YOUR_WRITES_SECONDS", 5))
+    if not read_url:
+        app.engine = RoutingEngine(engines)
+    else:
+        app.engine = RoutingEngine(
+            engines,
+            stickiness=StickinessTracker(window),
+            monitor=ReplicaMonitor(
+                engines["background"]["replica"],
+                max_lag_seconds=int(app.config.get("REPLICA_MAX_LAG_SECONDS", 5)),
+                check_interval=int(app.config.get("REPLICA_LAG_CHECK_INTERVAL", 5)),
+                assume_no_lag=bool(app.config.get("REPLICA_ASSUME_NO_LAG", False))
+            )
+        )
+
+        logger.info("Read replica configured; read-only requests are routed to DATABASE_READ_URL")
+
+    # Yazma işareti replica olmasa da set edilir: recently_wrote() okuma cache'lerini
+    # atlatır (local cache'te invalidation sadece yazan worker'ı etkiler)
+    marker_window = max(window, int(app.config.get("EVENT_FILTER_CACHE_TTL", 0)))
+
+    @app.after_request
+    def mark_read_your_writes(response):
+        # Başarılı yazmadan sonra bu çağıranın okumaları kısa süre primary'ye / cache dışına gider
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            if app.engine.stickiness is not None:
+                app.engine.stickiness.mark(_caller_key())
+            until = time.time() + marker_window
+            response.set_cookie(
+                STICKY_COOKIE, f"{until:.3f}", max_age=marker_window, httponly=True, samesite="Lax"
+            )
+        return response
+
+    return app.engine
+
+
+def prewarm_pools(app):
+    """
+    Opens DB_POOL_PREWARM connections per pool (capped at the pool size).
+    Call after fork in pre-fork servers.
+    """
+    routing = app.engine
+    pools = app.config.get("DB_POOLS", {})
+    warmed = {}
+    for workload, role, engine in routing.all_engines():
+        count = min(int(app.config.get("DB_POOL_PREWARM", 0)), pools.get(workload, {}).get("size", 0))
+        if count > 0:
+            warmed[f"{workload}.{role}"] = prewarm(engine, count)
+    if warmed:
+        logger.info(f"Connection pools prewarmed: {warmed}")
+    return warmed
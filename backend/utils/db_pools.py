@@ -0,0 +1,214 @@
+# utils/db_pools.py
+"""
+Workload Connection Pools
+Her iş yükü (interactive, admin, background) kendi connection pool'unu
+kullanır; yavaş bir admin chart'ı check-in trafiğinin bağlantılarını
+tüketemez. Pool'lar checkout bekleme süresi histogramı, timeout sayısı
+ve anlık checked-out değerlerini raporlar.
+
+Bağlantı bütçesi: DB_MAX_CONNECTIONS, bir instance'ın DB sunucusu başına
+açabileceği toplam bağlantıdır. Pre-fork sunucuda her worker kendi pool'larını
+açtığı için bütçe worker sayısına (SERVER_WORKERS) bölünür; worker başına
+toplam (size + max_overflow, ASGI'de async pool dahil) bunu aşarsa pool'lar
+oranla küçültülür.
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+
+from sqlalchemy import create_engine, exc
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+WORKLOADS = ("interactive", "admin", "background")
+
+# Checkout bekleme süresi histogram sınırları (saniye)
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class PoolMetrics:
+    """Thread-safe counters for one pool; survives engine.dispose()."""
+
+    def __init__(self, name):
+        self.name = name
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_sum = 0.0
+        self.wait_max = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS) + 1)
+        self._lock = threading.Lock()
+
+    def observe_wait(self, seconds):
+        index = len(WAIT_BUCKETS)
+        for i, bound in enumerate(WAIT_BUCKETS):
+            if seconds <= bound:
+                index = i
+                break
+
+        with self._lock:
+            self.checkouts += 1
+            self.wait_sum += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            self.wait_buckets[index] += 1
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, pool=None):
+        with self._lock:
+            cumulative = []
+            running = 0
+            for bound, count in zip(WAIT_BUCKETS + (float("inf"),), self.wait_buckets):
+                running += count
+                cumulative.append({"le": "+Inf" if bound == float("inf") else bound, "count": running})
+
+            data = {
+                "name": self.name,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds": {
+                    "sum": round(self.wait_sum, 6),
+                    "max": round(self.wait_max, 6),
+                    "avg": round(self.wait_sum / self.checkouts, 6) if self.checkouts else 0.0,
+                    "buckets": cumulative
+                }
+            }
+
+        if isinstance(pool, QueuePool):
+            data.update({
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "timeout": pool.timeout()
+            })
+        return data
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection."""
+
+    metrics = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_timeout()
+            raise
+
+        if self.metrics is not None:
+            self.metrics.observe_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        # dispose() yeni bir pool oluşturur; metrikler korunur
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def create_pooled_engine(url, name, pool_config, **kwargs):
+    """
+    Creates an engine with its own instrumented pool.
+
+    Args:
+        url: Database URL
+        name: Pool name used in metrics (e.g. "interactive.primary")
+        pool_config: dict with size, max_overflow, recycle, timeout
+
+    Returns:
+        Engine
+    """
+    if url.startswith("sqlite"):
+        # SQLite (lokal denemeler) kendi pool sınıfını kullanır
+        engine = create_engine(url, **kwargs)
+    else:
+        engine = create_engine(
+            url,
+            poolclass=InstrumentedQueuePool,
+            pool_size=pool_config.get("size", 5),
+            max_overflow=pool_config.get("max_overflow", 10),
+            pool_recycle=pool_config.get("recycle", 1800),
+            pool_timeout=pool_config.get("timeout", 30),
+            **kwargs
+        )
+
+    metrics = PoolMetrics(name)
+    engine.pool.metrics = metrics
+    engine.pool_metrics = metrics
+    return engine
+
+
+def prewarm(engine, connections):
+    """Opens and returns `connections` connections so the first requests skip the handshake."""
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(engine.connect())
+    except Exception as e:
+        logger.warning(f"Pool prewarm for {engine.pool_metrics.name} stopped: {str(e)}")
+    finally:
+        for conn in opened:
+            conn.close()
+    return len(opened)
+
+
+def fit_pools_to_budget(config):
+    """
+    Scales the per-process pools down so all workers stay within DB_MAX_CONNECTIONS.
+
+    Args:
+        config: App config (DB_POOLS, DB_MAX_CONNECTIONS, ASYNC_DB_POOL_SIZE, ASYNC_DB_MAX_OVERFLOW)
+
+    Returns:
+        dict: Config updates (DB_POOLS and, on the ASGI server, ASYNC_DB_*); empty if within budget
+    """
+    budget = int(config.get("DB_MAX_CONNECTIONS", 0))
+    if budget <= 0:
+        return {}
+
+    workers = max(int(os.getenv("SERVER_WORKERS", 1)), 1)
+    per_worker = budget // workers
+
+    pools = {name: dict(pool) for name, pool in config.get("DB_POOLS", {}).items()}
+    if os.getenv("SERVER_ASGI", "false").lower() == "true":
+        pools["async"] = {
+            "size": int(config.get("ASYNC_DB_POOL_SIZE", 20)),
+            "max_overflow": int(config.get("ASYNC_DB_MAX_OVERFLOW", 10))
+        }
+
+    demand = sum(pool["size"] + pool["max_overflow"] for pool in pools.values())
+    if demand <= per_worker:
+        return {}
+
+    if per_worker < len(pools):
+        logger.error(
+            f"DB_MAX_CONNECTIONS={budget} over {workers} worker(s) leaves {per_worker} connection(s) "
+            f"per worker for {len(pools)} pools; every pool keeps 1 connection and the budget is exceeded"
+        )
+
+    ratio = per_worker / demand
+    for pool in pools.values():
+        pool["size"] = max(1, math.floor(pool["size"] * ratio))
+        pool["max_overflow"] = math.floor(pool["max_overflow"] * ratio)
+
+    logger.warning(
+        f"Connection pools scaled to {ratio:.2f}x to fit DB_MAX_CONNECTIONS={budget} "
+        f"across {workers} worker(s): "
+        + ", ".join(f"{name}={pool['size']}+{pool['max_overflow']}" for name, pool in pools.items())
+    )
+
+    async_pool = pools.pop("async", None)
+    updates = {"DB_POOLS": pools}
+    if async_pool:
+        updates["ASYNC_DB_POOL_SIZE"] = async_pool["size"]
+        updates["ASYNC_DB_MAX_OVERFLOW"] = async_pool["max_overflow"]
+    return updates
@@ -1,12 +1,32 @@
 import os
 import json
 import re
-from openai import OpenAI
+import threading
+from backend.utils.metrics import observe_outbound
 
 # -------------------------------------------------
 # OpenAI client
 # -------------------------------------------------
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# openai paketi (~0.7 sn import) ve client ilk moderasyon çağrısında oluşturulur;
+# soğuk başlangıçta yüklenmez (bkz. utils/startup.py)
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """
+    Returns the shared OpenAI client, importing openai on first use.
+
+    Returns:
+        OpenAI: Client instance
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from openai import OpenAI
+                _client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _client
 
 # -------------------------------------------------
 # HARD PROFANITY FILTER (FAIL-SAFE)
@@ -146,14 +166,16 @@ Event description:
 {description}
 """
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            temperature=0.0,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ]
-        )
+        client = get_client()
+        with observe_outbound("openai_moderation"):
+            response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                temperature=0.0,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ]
+            )
 
         content = response.choices[0].message.content.strip()
         parsed = json.loads(content)
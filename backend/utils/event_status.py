@@ -0,0 +1,147 @@
+# utils/event_status.py
+"""
+Effective Event Status
+Bitmiş bir FUTURE etkinlik, status kolonu henüz güncellenmemiş olsa bile
+okuma anında COMPLETED sayılır. Listeleme / filtre sorguları bu modüldeki
+SQL parçalarını kullanır; (status, ends_at) index'i ile aralık taraması yapılır.
+
+status kolonunun kalıcı güncellenmesi compact_event_statuses() ile arka
+planda, PK aralıklarına bölünmüş küçük transaction'larla yapılır; tek bir
+sweep'in çok sayıda satırı kilitlemesi engellenir.
+"""
+
+import logging
+import time
+from datetime import datetime
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def has_ended(alias="e"):
+    """SQL predicate: the event's end (or start, if no end) is in the past."""
+    return (
+        f"(({alias}.ends_at IS NOT NULL AND {alias}.ends_at < NOW()) "
+        f"OR ({alias}.ends_at IS NULL AND {alias}.starts_at < NOW()))"
+    )
+
+
+def is_upcoming(alias="e"):
+    """SQL predicate: published and not yet ended (effective status FUTURE)."""
+    return (
+        f"({alias}.status = 'FUTURE' AND ({alias}.ends_at >= NOW() "
+        f"OR ({alias}.ends_at IS NULL AND {alias}.starts_at >= NOW())))"
+    )
+
+
+def effective_status(alias="e"):
+    """SQL expression for the status as users should see it."""
+    return f"(CASE WHEN {alias}.status = 'FUTURE' AND {has_ended(alias)} THEN 'COMPLETED' ELSE {alias}.status END)"
+
+
+def status_filter(status, alias="e", param="status"):
+    """
+    WHERE fragment matching the effective status.
+
+    Returns:
+        tuple: (sql, params)
+    """
+    status = status.upper()
+    if status == "FUTURE":
+        return is_upcoming(alias), {}
+    if status == "COMPLETED":
+        return f"({alias}.status = 'COMPLETED' OR ({alias}.status = 'FUTURE' AND {has_ended(alias)}))", {}
+    return f"{alias}.status = :{param}", {param: status}
+
+
+def _candidate_id_range(conn, after=0):
+    # İki dal da idx_events_status_ends_at üzerinden aralık taraması yapar
+    row = conn.execute(text("""
+        SELECT MIN(id) AS lo, MAX(id) AS hi FROM (
+            SELECT id FROM events
+            WHERE status = 'FUTURE' AND ends_at < NOW() AND id > :after
+            UNION ALL
+            SELECT id FROM events
+            WHERE status = 'FUTURE' AND ends_at IS NULL AND starts_at < NOW() AND id > :after
+        ) ended
+    """), {"after": after}).fetchone()
+    return row.lo, row.hi
+
+
+def compact_event_statuses(engine, chunk_size=DEFAULT_CHUNK_SIZE, pause_seconds=0.0, fence=None):
+    """
+    Persists COMPLETED for ended FUTURE events in PK-ranged batches.
+
+    Each batch updates at most `chunk_size` consecutive ids and commits, so
+    row locks are bounded and short-lived.
+
+    Args:
+        engine: SQLAlchemy engine
+        chunk_size: Width of each id range
+        pause_seconds: Sleep between batches (throttling)
+        fence: Optional callable(conn) run in every batch transaction (leader fencing)
+
+    Returns:
+        dict: success, updated_count, batches, timestamp, errors
+    """
+    updated = 0
+    batches = 0
+    try:
+        with engine.connect() as conn:
+            lo, hi = _candidate_id_range(conn)
+
+        if lo is None:
+            return {
+                "success": True,
+                "updated_count": 0,
+                "batches": 0,
+                "timestamp": datetime.now().isoformat(),
+                "errors": None
+            }
+
+        start = lo
+        while start <= hi:
+            end = start + chunk_size - 1
+            with engine.begin() as conn:
+                if fence is not None:
+                    fence(conn)
+                result = conn.execute(text(f"""
+                    UPDATE events e
+                    SET e.status = 'COMPLETED', e.updated_at = NOW()
+                    WHERE e.id BETWEEN :start AND :end
+                      AND e.status = 'FUTURE'
+                      AND {has_ended('e')}
+                """), {"start": start, "end": end})
+                updated += result.rowcount
+            batches += 1
+            if pause_seconds:
+                time.sleep(pause_seconds)
+
+            # Aday olmayan id aralıkları atlanır
+            with engine.connect() as conn:
+                start, _ = _candidate_id_range(conn, after=end)
+            if start is None:
+                break
+
+        logger.info(f"Event status compaction: {updated} events -> COMPLETED in {batches} batches")
+        return {
+            "success": True,
+            "updated_count": updated,
+            "batches": batches,
+            "timestamp": datetime.now().isoformat(),
+            "errors": None
+        }
+
+    except Exception as e:
+        error_msg = f"Error compacting event statuses: {str(e)}"
+        logger.error(error_msg)
+        return {
+            "success": False,
+            "updated_count": updated,
+            "batches": batches,
+            "timestamp": datetime.now().isoformat(),
+            "errors": error_msg
+        }
@@ -0,0 +1,205 @@
+# utils/export.py
+"""
+Streaming Export
+Büyük sonuç kümelerini server-side cursor (stream_results) üzerinden
+parça parça okuyup CSV / NDJSON / JSON array olarak generator response ile gönderir.
+Bellek kullanımı satır sayısından bağımsızdır: aynı anda en fazla bir
+batch (yield_per) bellekte tutulur. İstemci destekliyorsa çıktı anında
+gzip ile sıkıştırılır.
+"""
+
+import csv
+import io
+import itertools
+import json
+import logging
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+
+from flask import Response, request
+from sqlalchemy import Engine, text
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson"
+}
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def get_export_format():
+    """
+    Reads ?format= from the request (default: csv).
+
+    Returns:
+        str | None: Normalized format, or None if unsupported
+    """
+    fmt = request.args.get("format", "csv").lower()
+    return fmt if fmt in EXPORT_FORMATS else None
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def stream_batches(engine: Engine, query, params=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Executes a query on a server-side cursor and yields (columns, rows) per batch.
+    The connection stays open until the generator is exhausted or closed.
+    """
+    with engine.connect() as conn:
+        result = conn.execution_options(
+            stream_results=True,
+            yield_per=batch_size
+        ).execute(text(query), params or {})
+
+        columns = list(result.keys())
+        empty = True
+        for batch in result.partitions():
+            empty = False
+            yield columns, batch
+
+        # Boş sonuçta da CSV header'ı yazılabilsin
+        if empty:
+            yield columns, []
+
+
+def encode_csv(batches):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    header_written = False
+
+    for columns, rows in batches:
+        if not header_written:
+            writer.writerow(columns)
+            header_written = True
+        for row in rows:
+            writer.writerow([_csv_value(value) for value in row])
+
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+
+
+def encode_ndjson(batches):
+    for columns, rows in batches:
+        lines = [
+            json.dumps(dict(zip(columns, row)), default=_json_default, ensure_ascii=False)
+            for row in rows
+        ]
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def gzip_chunks(chunks, level=6):
+    """Compresses a byte stream incrementally into a single gzip member."""
+    # wbits=31 -> gzip header/trailer
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _client_accepts_gzip():
+    if request.args.get("compress", "true").lower() == "false":
+        return False
+    return "gzip" in request.headers.get("Accept-Encoding", "").lower()
+
+
+def _logged(chunks, filename):
+    # Header'lar gönderildikten sonra status değiştirilemez; hatayı logla ve akışı kes
+    try:
+        yield from chunks
+    except Exception as e:
+        logger.error(f"Export {filename} aborted: {str(e)}")
+
+
+def encode_json_array(batches):
+    """Encodes batches as one JSON array, written incrementally."""
+    yield b"["
+    first = True
+    for columns, rows in batches:
+        parts = [
+            json.dumps(dict(zip(columns, row)), default=_json_default, ensure_ascii=False)
+            for row in rows
+        ]
+        if not parts:
+            continue
+        prefix = "" if first else ","
+        first = False
+        yield (prefix + ",".join(parts)).encode("utf-8")
+    yield b"]"
+
+
+def _streaming_response(engine, query, params, encoder, content_type, headers, name, batch_size):
+    # İlk batch'i response'tan önce çek: sorgu hataları normal hata yanıtı olarak döner
+    batches = stream_batches(engine, query, params, batch_size)
+    first = next(batches)
+    chunks = encoder(itertools.chain([first], batches))
+
+    headers = {**headers, "Vary": "Accept-Encoding"}
+
+    if _client_accepts_gzip():
+        chunks = gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+
+    return Response(_logged(chunks, name), headers=headers, content_type=content_type)
+
+
+def streaming_export(engine: Engine, query, params, fmt, filename, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Builds a streaming download response for a query.
+
+    Args:
+        engine: SQLAlchemy engine (the generator outlives the request context)
+        query: SQL string (should have a stable ORDER BY)
+        params: Bound parameters
+        fmt: "csv" or "ndjson"
+        filename: Download name without extension
+        batch_size: Rows fetched per round trip
+
+    Returns:
+        Response: Chunked response, gzip-encoded if the client accepts it
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    encoder = encode_csv if fmt == "csv" else encode_ndjson
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}.{fmt}"',
+        "Cache-Control": "no-store"
+    }
+
+    return _streaming_response(
+        engine, query, params, encoder, EXPORT_FORMATS[fmt], headers, filename, batch_size
+    )
+
+
+def streaming_json(engine: Engine, query, params, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Streams a query result as a JSON array without building the list in memory.
+    Same semantics as streaming_export (server-side cursor, optional gzip).
+    """
+    return _streaming_response(
+        engine, query, params, encode_json_array, "application/json",
+        {"Cache-Control": "no-store"}, "json", batch_size
+    )
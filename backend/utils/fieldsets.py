@@ -0,0 +1,95 @@
+# utils/fieldsets.py
+"""
+Sparse Fieldsets
+Liste endpoint'lerinde ?fields=id,title,starts_at ile yalnızca istenen
+kolonlar döner. Budama çıktıda değil sorguda yapılır: SELECT listesine sadece
+istenen ifadeler, FROM'a sadece bu alanların (ve filtrelerin) ihtiyaç duyduğu
+JOIN'ler eklenir; örneğin owner_username istenmezse users JOIN'i yapılmaz.
+
+Her alan bir SQL ifadesi ve gerektirdiği join alias'larıyla tanımlanır;
+join'ler bağımlılık sırasıyla (un -> u) üretilir.
+"""
+
+from collections import OrderedDict
+
+
+class FieldError(ValueError):
+    """Raised for unknown names in ?fields=."""
+
+
+class Field:
+    """
+    One selectable output column.
+
+    Args:
+        sql: Column expression (e.g. "u.username")
+        joins: Join aliases the expression needs
+    """
+
+    __slots__ = ("sql", "joins")
+
+    def __init__(self, sql, joins=()):
+        self.sql = sql
+        self.joins = tuple(joins)
+
+
+class FieldSet:
+    """
+    Selectable fields of one listing.
+
+    Args:
+        fields: OrderedDict {output name: Field}
+        joins: OrderedDict {alias: (join SQL, (dependency aliases))}, in emit order
+        default: Field names returned without ?fields=
+        always: Fields always included (e.g. the pagination key)
+    """
+
+    def __init__(self, fields, joins, default=None, always=("id",)):
+        self.fields = OrderedDict(fields)
+        self.join_defs = OrderedDict(joins)
+        self.default = tuple(default or self.fields)
+        self.always = tuple(always)
+
+    def resolve(self, requested=None):
+        """
+        Validated, de-duplicated field names for a ?fields= value.
+
+        Raises:
+            FieldError: If a name is not selectable
+        """
+        if not requested:
+            names = list(self.default)
+        else:
+            names = [name.strip() for name in requested.split(",") if name.strip()]
+            unknown = [name for name in names if name not in self.fields]
+            if unknown:
+                raise FieldError(
+                    f"Unknown field(s): {', '.join(unknown)}. "
+                    f"Available: {', '.join(self.fields)}"
+                )
+
+        result = [name for name in self.always if name not in names]
+        for name in names:
+            if name not in result:
+                result.append(name)
+        return result
+
+    def select_clause(self, names):
+        return ",\n    ".join(f"{self.fields[name].sql} AS {name}" for name in names)
+
+    def join_clause(self, names, extra_joins=()):
+        """JOIN lines needed by the fields and by the caller's filters."""
+        needed = set(extra_joins)
+        for name in names:
+            needed.update(self.fields[name].joins)
+
+        # Bağımlılıkları ekle (ör. un için u)
+        pending = list(needed)
+        while pending:
+            alias = pending.pop()
+            for dep in self.join_defs[alias][1]:
+                if dep not in needed:
+                    needed.add(dep)
+                    pending.append(dep)
+
+        return "\n".join(sql for alias, (sql, _) in self.join_defs.items() if alias in needed)
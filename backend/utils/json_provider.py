@@ -0,0 +1,101 @@
+# utils/json_provider.py
+"""
+Fast JSON Provider
+Flask'ın varsayılan json modülü yerine orjson kullanan JSON provider.
+jsonify, dict dönen view'lar ve ASGI yolu (backend/asgi.py) aynı provider'ı
+kullanır.
+
+Çıktı varsayılan olarak Flask'ınkiyle aynıdır:
+- datetime / date: RFC 822 (http_date), JSON_DATETIME_FORMAT=iso ile orjson'un
+  native ISO 8601 çıktısı (en hızlısı)
+- Decimal (price, latitude, longitude): string
+- Anahtarlar sıralı (sort_keys), debug'da girintili
+- dataclass kayıtlar (bkz. utils/row_encoder.py) ara dict olmadan serileştirilir
+
+Config:
+    JSON_PROVIDER: orjson | default
+    JSON_DATETIME_FORMAT: http | iso
+"""
+
+import dataclasses
+import decimal
+import logging
+from datetime import date
+
+from flask.json.provider import DefaultJSONProvider
+
+from backend.utils.row_encoder import http_date, set_datetime_format
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - requirements.txt'te var
+    orjson = None
+
+
+def _default(o):
+    if isinstance(o, date):
+        return http_date(o)
+    if isinstance(o, decimal.Decimal):
+        return str(o)
+    if dataclasses.is_dataclass(o):
+        return dataclasses.asdict(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """DefaultJSONProvider-compatible provider backed by orjson."""
+
+    datetime_format = "http"
+
+    def _options(self, indent=False):
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if self.datetime_format == "http":
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        return option
+
+    def _dumps_bytes(self, obj, indent=False):
+        return orjson.dumps(obj, default=_default, option=self._options(indent))
+
+    def dumps(self, obj, **kwargs):
+        return self._dumps_bytes(obj, indent=bool(kwargs.get("indent"))).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            self._dumps_bytes(obj, indent) + b"\n", mimetype=self.mimetype
+        )
+
+
+def init_json_provider(app):
+    """
+    Installs the orjson provider on the app (falls back to Flask's default).
+
+    Config:
+        JSON_PROVIDER, JSON_DATETIME_FORMAT
+    """
+    fmt = app.config.get("JSON_DATETIME_FORMAT", "http")
+
+    if app.config.get("JSON_PROVIDER", "orjson") != "orjson" or orjson is None:
+        if orjson is None:
+            logger.warning("orjson is not installed; using Flask's default JSON provider")
+        # Varsayılan provider datetime'ları her zaman http formatında yazar
+        set_datetime_format("http")
+        return app.json
+
+    provider = OrjsonProvider(app)
+    provider.datetime_format = fmt
+    set_datetime_format(fmt)
+    app.json = provider
+    return provider
@@ -0,0 +1,353 @@
+# utils/leader.py
+"""
+Scheduler Leader Election
+Her instance/process kendi scheduler'ını çalıştırır; job'ları ise cluster
+genelinde yalnızca lease'i tutan lider çalıştırır.
+
+- scheduler_leases tablosunda isim başına tek satır: holder, fencing_token, expires_at
+- Lider lease'i TTL/3 aralıkla yeniler; lider ölürse lease TTL sonunda düşer
+  ve heartbeat'i ilk çalışan process liderliği devralır (otomatik failover)
+- Her yeni lider fencing_token'ı bir artırır. Job'lar yazdıkları transaction
+  içinde verify_fence(conn) çağırarak eski bir liderin (GC duraklaması, ağ
+  kopması) lease kaybından sonra yazmasını engeller
+- Zaman karşılaştırmaları DB saatiyle yapılır (instance saat kaymasından etkilenmez)
+
+GET_LOCK yerine lease tablosu: GET_LOCK bağlantıya bağlıdır (pool'dan dönen
+bağlantıyla kilit de taşınır/kaybolur) ve fencing token sağlamaz.
+
+Lider seçimi kapalıyken pre-fork sunucuda (gunicorn) her worker scheduler'ı
+başlatır; job'ları tek worker'ın çalıştırması için host içi dosya kilidi
+(FileLockElector) kullanılır.
+"""
+
+import atexit
+import fcntl
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from functools import wraps
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_NAME = "scheduler"
+DEFAULT_TTL_SECONDS = 60
+
+# MySQL: Table doesn't exist (db/init.sql veya scripts/upgrade_schema.py uygulanmamış)
+ER_NO_SUCH_TABLE = 1146
+
+
+def _is_missing_table(error):
+    args = getattr(getattr(error, "orig", None), "args", ())
+    return bool(args) and args[0] == ER_NO_SUCH_TABLE
+
+# Job'un çalıştığı thread'deki aktif fence: (elector, token)
+_fence = threading.local()
+
+
+class LeaseLost(RuntimeError):
+    """Raised when a job's fencing token is no longer the current one."""
+
+
+class LeaderElector:
+    """
+    Acquires and renews a named lease in scheduler_leases.
+
+    Args:
+        engine: SQLAlchemy engine (primary)
+        name: Lease name (one leader per name)
+        ttl: Lease duration in seconds; renewed every ttl / 3
+    """
+
+    def __init__(self, engine, name=DEFAULT_LEASE_NAME, ttl=DEFAULT_TTL_SECONDS):
+        self.engine = engine
+        self.name = name
+        self.ttl = ttl
+        self.identity = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.token = None
+        # Lokal son geçerlilik (monotonic); DB'ye sormadan "hâlâ lider miyim?"
+        self._valid_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_leader(self):
+        return self.token is not None and time.monotonic() < self._valid_until
+
+    def heartbeat(self):
+        """Acquires the lease if free/expired, renews it if held. Returns True if leader."""
+        with self._lock:
+            started = time.monotonic()
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(text("""
+                        INSERT IGNORE INTO scheduler_leases (name, holder, fencing_token, expires_at)
+                        VALUES (:name, NULL, 0, CURRENT_TIMESTAMP)
+                    """), {"name": self.name})
+
+                    # fencing_token, holder değişmeden önce değerlendirilir (MySQL SET soldan sağa)
+                    acquired = conn.execute(text("""
+                        UPDATE scheduler_leases
+                        SET fencing_token = IF(holder <=> :me, fencing_token, fencing_token + 1),
+                            acquired_at = IF(holder <=> :me, acquired_at, CURRENT_TIMESTAMP),
+                            holder = :me,
+                            expires_at = DATE_ADD(CURRENT_TIMESTAMP, INTERVAL :ttl SECOND),
+                            renewed_at = CURRENT_TIMESTAMP
+                        WHERE name = :name
+                          AND (holder <=> :me OR expires_at < CURRENT_TIMESTAMP)
+                    """), {"name": self.name, "me": self.identity, "ttl": self.ttl}).rowcount
+
+                    token = None
+                    if acquired:
+                        token = conn.execute(
+                            text("SELECT fencing_token FROM scheduler_leases WHERE name = :name"),
+                            {"name": self.name}
+                        ).scalar()
+            except Exception as e:
+                if isinstance(e, DBAPIError) and _is_missing_table(e):
+                    # Geçici değil: hiçbir process lider olamaz, job'lar çalışmaz
+                    logger.error(f"Lease heartbeat failed for '{self.name}': scheduler_leases table is missing")
+                    return self.is_leader
+                # DB'ye ulaşılamıyorsa lokal süre dolana kadar lider sayılmaya devam edilir
+                logger.warning(f"Lease heartbeat failed for '{self.name}': {str(e)}")
+                return self.is_leader
+
+            if token is None:
+                if self.token is not None:
+                    logger.warning(f"Lost scheduler leadership ('{self.name}', token {self.token})")
+                self.token = None
+                self._valid_until = 0.0
+                return False
+
+            if token != self.token:
+                logger.info(f"Acquired scheduler leadership ('{self.name}', token {token}) as {self.identity}")
+            self.token = token
+            # Ölçülen tur süresi kadar erken bırakılır (saat kayması yerine güvenlik payı)
+            self._valid_until = started + self.ttl - (time.monotonic() - started) - 1
+            return True
+
+    def release(self):
+        """Gives up the lease so another process can take over immediately."""
+        if self.token is None:
+            return
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(text("""
+                    UPDATE scheduler_leases
+                    SET expires_at = CURRENT_TIMESTAMP
+                    WHERE name = :name AND holder = :me
+                """), {"name": self.name, "me": self.identity})
+            logger.info(f"Released scheduler leadership ('{self.name}')")
+        except Exception as e:
+            logger.warning(f"Lease release failed for '{self.name}': {str(e)}")
+        finally:
+            self.token = None
+            self._valid_until = 0.0
+
+    def table_exists(self):
+        """
+        Checks that scheduler_leases exists.
+
+        Returns:
+            bool: False only if the table is missing (True if the DB can't be reached)
+        """
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1 FROM scheduler_leases LIMIT 1"))
+        except DBAPIError as e:
+            if _is_missing_table(e):
+                return False
+            logger.warning(f"Could not check scheduler_leases: {str(e)}")
+        return True
+
+    def check_fence(self, conn, token):
+        """
+        Verifies inside the caller's transaction that `token` is still current.
+
+        Raises:
+            LeaseLost: If another process took over the lease
+        """
+        row = conn.execute(text("""
+            SELECT fencing_token, holder, expires_at > CURRENT_TIMESTAMP AS active
+            FROM scheduler_leases
+            WHERE name = :name
+            FOR UPDATE
+        """), {"name": self.name}).fetchone()
+
+        if row is None or row.fencing_token != token or row.holder != self.identity or not row.active:
+            raise LeaseLost(f"Lease '{self.name}' token {token} is no longer valid")
+
+    def status(self):
+        return {
+            "mode": "lease",
+            "identity": self.identity,
+            "is_leader": self.is_leader,
+            "fencing_token": self.token,
+            "ttl_seconds": self.ttl
+        }
+
+
+class FileLockElector:
+    """
+    Single-host elector: the process holding an exclusive flock on `path` is the leader.
+
+    The kernel drops the lock when the holder exits, so a recycled or crashed
+    worker hands leadership to the next process whose heartbeat runs.
+
+    Args:
+        path: Lock file shared by the processes on this host
+        ttl: Heartbeat interval is ttl / 3 (same as LeaderElector)
+    """
+
+    def __init__(self, path, ttl=DEFAULT_TTL_SECONDS):
+        self.path = path
+        self.ttl = ttl
+        self.identity = f"{socket.gethostname()}:{os.getpid()}"
+        self.token = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_leader(self):
+        return self._file is not None
+
+    def heartbeat(self):
+        """Takes the lock if no other process holds it. Returns True if leader."""
+        with self._lock:
+            if self._file is not None:
+                return True
+
+            lock_file = open(self.path, "a")
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                return False
+
+            self._file = lock_file
+            logger.info(f"Acquired scheduler leadership (file lock {self.path}) as {self.identity}")
+            return True
+
+    def release(self):
+        with self._lock:
+            if self._file is None:
+                return
+            try:
+                fcntl.flock(self._file, fcntl.LOCK_UN)
+            finally:
+                self._file.close()
+                self._file = None
+            logger.info(f"Released scheduler leadership (file lock {self.path})")
+
+    def check_fence(self, conn, token):
+        # Tek host: kilit process ölene kadar kaybedilmez
+        return None
+
+    def status(self):
+        return {
+            "mode": "file_lock",
+            "identity": self.identity,
+            "is_leader": self.is_leader,
+            "lock_file": self.path,
+            "ttl_seconds": self.ttl
+        }
+
+
+def read_lease(engine, name=DEFAULT_LEASE_NAME):
+    """Current holder of a lease as seen by the database (usable from any process)."""
+    with engine.connect() as conn:
+        row = conn.execute(text("""
+            SELECT name, holder, fencing_token, acquired_at, renewed_at, expires_at,
+                   expires_at > CURRENT_TIMESTAMP AS active
+            FROM scheduler_leases
+            WHERE name = :name
+        """), {"name": name}).fetchone()
+
+    if row is None:
+        return None
+    return {
+        "name": row.name,
+        "holder": row.holder if row.active else None,
+        "last_holder": row.holder,
+        "fencing_token": row.fencing_token,
+        "acquired_at": row.acquired_at.isoformat() if row.acquired_at else None,
+        "renewed_at": row.renewed_at.isoformat() if row.renewed_at else None,
+        "expires_at": row.expires_at.isoformat() if row.expires_at else None,
+        "active": bool(row.active)
+    }
+
+
+def leader_only(elector, func):
+    """
+    Wraps a job so it runs only on the leader, with its fencing token
+    available to verify_fence() for the duration of the call.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not elector.is_leader and not elector.heartbeat():
+            logger.debug(f"Skipping {func.__name__}: not the scheduler leader")
+            return None
+
+        _fence.current = (elector, elector.token)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _fence.current = None
+    return wrapper
+
+
+def verify_fence(conn):
+    """
+    Fencing check for jobs: no-op outside a leader_only job (e.g. manual admin trigger).
+
+    Raises:
+        LeaseLost: If this process is no longer the leader that started the job
+    """
+    current = getattr(_fence, "current", None)
+    if current is not None:
+        elector, token = current
+        elector.check_fence(conn, token)
+
+
+def init_leader_election(app):
+    """
+    Creates the elector for the scheduler (None if disabled).
+
+    Election off in a pre-fork server still elects one worker per host with
+    a file lock, since every worker starts its own scheduler. If the
+    scheduler_leases table is missing, election falls back the same way
+    instead of skipping every job.
+
+    Config:
+        SCHEDULER_LEADER_ELECTION, SCHEDULER_LEASE_TTL, SCHEDULER_LOCK_FILE
+    """
+    ttl = int(app.config.get("SCHEDULER_LEASE_TTL", DEFAULT_TTL_SECONDS))
+
+    if not app.config.get("SCHEDULER_LEADER_ELECTION", True):
+        logger.warning("Scheduler leader election disabled")
+        return _local_elector(app, ttl)
+
+    elector = LeaderElector(app.engine, ttl=ttl)
+    if not elector.table_exists():
+        logger.error(
+            "Scheduler leader election disabled: scheduler_leases table is missing "
+            "(run backend/scripts/upgrade_schema.py); jobs are not coordinated across instances"
+        )
+        return _local_elector(app, ttl)
+
+    atexit.register(elector.release)
+    return elector
+
+
+def _local_elector(app, ttl):
+    """File lock across pre-fork workers on this host; None (every run executes) otherwise."""
+    if os.getenv("SERVER_PREFORK", "false").lower() != "true":
+        return None
+    elector = FileLockElector(app.config.get("SCHEDULER_LOCK_FILE", "/tmp/etkinlink-scheduler.lock"), ttl=ttl)
+    logger.warning("Scheduler jobs run in one worker per host (file lock)")
+    atexit.register(elector.release)
+    return elector
@@ -1,9 +1,9 @@
 # utils/mail_service.py
 
-import requests
 from datetime import datetime, timedelta
 from flask import current_app, url_for, render_template
 import jwt
+from backend.utils.metrics import observe_outbound
 
 # Mailtrap REST API endpoint
 MAILTRAP_SEND_URL = "https://send.api.mailtrap.io/api/send"
@@ -45,18 +45,22 @@ def send_email(to_email: str, subject: str, html_body: str):
         "Content-Type": "application/json"
     }
 
-    response = requests.post(
-        MAILTRAP_SEND_URL,
-        json=payload,
-        headers=headers,
-        timeout=10
-    )
+    # requests sadece mail gönderiminde yüklenir (cold start)
+    import requests
 
-    if not response.ok:
-        raise RuntimeError(
-            f"Mailtrap send failed ({response.status_code}): {response.text}"
+    with observe_outbound("mailtrap"):
+        response = requests.post(
+            MAILTRAP_SEND_URL,
+            json=payload,
+            headers=headers,
+            timeout=10
         )
 
+        if not response.ok:
+            raise RuntimeError(
+                f"Mailtrap send failed ({response.status_code}): {response.text}"
+            )
+
     return True
 
 
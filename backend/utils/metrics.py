@@ -0,0 +1,264 @@
+# utils/metrics.py
+"""
+Prometheus Metrics
+/metrics endpoint'i için istek, DB pool, dış servis ve scheduler metrikleri.
+
+- etkinlink_http_requests_total / _request_duration_seconds: route (endpoint) bazında
+- etkinlink_db_pool_*: workload pool'larının anlık ve kümülatif değerleri
+- etkinlink_outbound_request_duration_seconds: moderasyon modeli, mail sağlayıcısı
+- etkinlink_scheduler_job_duration_seconds: scheduler job süreleri
+
+Çoklu worker: PROMETHEUS_MULTIPROC_DIR ortam değişkeni prometheus_client import
+edilmeden önce ayarlanmışsa her worker değerlerini bu dizindeki mmap dosyalarına
+yazar ve /metrics MultiProcessCollector ile tüm worker'ları toplar. Dizin her
+deploy'da boş başlamalıdır (bkz. gunicorn ayarları).
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import Response, g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+JOB_BUCKETS = (0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+
+HTTP_REQUESTS = Counter(
+    "etkinlink_http_requests_total",
+    "HTTP requests by route, method and status",
+    ["endpoint", "method", "status"]
+)
+HTTP_LATENCY = Histogram(
+    "etkinlink_http_request_duration_seconds",
+    "HTTP request latency by route",
+    ["endpoint", "method"],
+    buckets=LATENCY_BUCKETS
+)
+HTTP_EXCEPTIONS = Counter(
+    "etkinlink_http_exceptions_total",
+    "Unhandled exceptions by route",
+    ["endpoint", "exception"]
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "etkinlink_db_pool_checked_out",
+    "Connections currently checked out",
+    ["pool"],
+    multiprocess_mode="livesum"
+)
+DB_POOL_SIZE = Gauge(
+    "etkinlink_db_pool_size",
+    "Configured pool size",
+    ["pool"],
+    multiprocess_mode="livesum"
+)
+DB_POOL_OVERFLOW = Gauge(
+    "etkinlink_db_pool_overflow",
+    "Current overflow connections",
+    ["pool"],
+    multiprocess_mode="livesum"
+)
+DB_POOL_CHECKOUTS = Counter(
+    "etkinlink_db_pool_checkouts_total",
+    "Connection checkouts",
+    ["pool"]
+)
+DB_POOL_TIMEOUTS = Counter(
+    "etkinlink_db_pool_timeouts_total",
+    "Connection checkout timeouts",
+    ["pool"]
+)
+DB_POOL_WAIT = Counter(
+    "etkinlink_db_pool_wait_seconds_total",
+    "Total time spent waiting for a connection",
+    ["pool"]
+)
+
+OUTBOUND_LATENCY = Histogram(
+    "etkinlink_outbound_request_duration_seconds",
+    "Latency of calls to external services",
+    ["service", "outcome"],
+    buckets=LATENCY_BUCKETS
+)
+
+JOB_DURATION = Histogram(
+    "etkinlink_scheduler_job_duration_seconds",
+    "Scheduler job durations",
+    ["job", "outcome"],
+    buckets=JOB_BUCKETS
+)
+JOB_LAST_SUCCESS = Gauge(
+    "etkinlink_scheduler_job_last_success_timestamp_seconds",
+    "Unix time of the last successful job run",
+    ["job"],
+    multiprocess_mode="max"
+)
+
+
+def is_multiprocess():
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+@contextmanager
+def observe_outbound(service):
+    """
+    Times a call to an external service.
+
+    Usage:
+        with observe_outbound("mailtrap"):
+            requests.post(...)
+    """
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "success"
+    finally:
+        OUTBOUND_LATENCY.labels(service, outcome).observe(time.perf_counter() - started)
+
+
+def record_request(endpoint, method, status, seconds):
+    """Records one handled request (used by the Flask hooks and the ASGI routes)."""
+    HTTP_LATENCY.labels(endpoint, method).observe(seconds)
+    HTTP_REQUESTS.labels(endpoint, method, str(status)).inc()
+
+
+def record_exception(endpoint, exc):
+    HTTP_EXCEPTIONS.labels(endpoint, type(exc).__name__).inc()
+
+
+def timed_job(job_id, func):
+    """Wraps a scheduler job function to record its duration and outcome."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = func(*args, **kwargs)
+            # Job'lar hatayı genelde {"success": False} olarak döndürür
+            if not (isinstance(result, dict) and result.get("success") is False):
+                outcome = "success"
+                JOB_LAST_SUCCESS.labels(job_id).set(time.time())
+            return result
+        finally:
+            JOB_DURATION.labels(job_id, outcome).observe(time.perf_counter() - started)
+    return wrapper
+
+
+class PoolMetricsExporter:
+    """Copies PoolMetrics snapshots into Prometheus metrics (counters as deltas)."""
+
+    def __init__(self, routing_engine, interval=1.0):
+        self.routing_engine = routing_engine
+        self.interval = interval
+        self._last = {}
+        self._next_refresh = 0.0
+        self._lock = threading.Lock()
+
+    def refresh(self, force=False):
+        now = time.monotonic()
+        if not force and now < self._next_refresh:
+            return
+        if not self._lock.acquire(blocking=False):
+            return
+
+        try:
+            self._next_refresh = now + self.interval
+            for snapshot in self.routing_engine.pool_metrics():
+                name = snapshot["name"]
+                if "checked_out" in snapshot:
+                    DB_POOL_CHECKED_OUT.labels(name).set(snapshot["checked_out"])
+                    DB_POOL_SIZE.labels(name).set(snapshot["size"])
+                    DB_POOL_OVERFLOW.labels(name).set(max(snapshot["overflow"], 0))
+
+                current = (
+                    snapshot["checkouts"], snapshot["timeouts"], snapshot["wait_seconds"]["sum"]
+                )
+                previous = self._last.get(name, (0, 0, 0.0))
+                # Pool metrikleri dispose() sonrası korunur; delta negatif olmaz
+                DB_POOL_CHECKOUTS.labels(name).inc(max(current[0] - previous[0], 0))
+                DB_POOL_TIMEOUTS.labels(name).inc(max(current[1] - previous[1], 0))
+                DB_POOL_WAIT.labels(name).inc(max(current[2] - previous[2], 0))
+                self._last[name] = current
+        except Exception as e:
+            logger.warning(f"Pool metrics refresh failed: {str(e)}")
+        finally:
+            self._lock.release()
+
+
+def render_metrics():
+    """Metrics payload for this process or, in multiprocess mode, all workers."""
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+def mark_worker_dead(pid):
+    """Call from the server's child_exit hook so live gauges drop the worker."""
+    if is_multiprocess():
+        multiprocess.mark_process_dead(pid)
+
+
+def init_metrics(app):
+    """
+    Registers request instrumentation and the /metrics endpoint.
+
+    Config:
+        METRICS_ENABLED, METRICS_TOKEN (optional bearer token for /metrics)
+    """
+    if not app.config.get("METRICS_ENABLED", True):
+        return None
+
+    exporter = PoolMetricsExporter(app.engine)
+    token = app.config.get("METRICS_TOKEN")
+
+    @app.before_request
+    def start_request_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def record_request_metrics(response):
+        started = g.get("request_started")
+        if started is None or request.endpoint == "metrics":
+            return response
+
+        # Eşleşmeyen URL'ler tek etikette toplanır (kardinalite sınırlı kalsın)
+        record_request(
+            request.endpoint or "unmatched", request.method, response.status_code,
+            time.perf_counter() - started
+        )
+        exporter.refresh()
+        return response
+
+    @app.teardown_request
+    def record_request_exception(exc):
+        if exc is not None:
+            record_exception(request.endpoint or "unmatched", exc)
+
+    @app.get("/metrics")
+    def metrics():
+        if token and request.headers.get("Authorization") != f"Bearer {token}":
+            return {"error": "Unauthorized"}, 401
+
+        exporter.refresh(force=True)
+        return Response(render_metrics(), mimetype=CONTENT_TYPE_LATEST)
+
+    app.metrics_exporter = exporter
+    return exporter
@@ -1,12 +1,17 @@
 from flask import request
 from sqlalchemy import text
+from backend.utils.row_encoder import encode_rows
 import math
 
 
-def get_pagination_params():
+def get_pagination_params(args=None):
     """
     Request'ten pagination parametrelerini alır ve validate eder.
     
+    Args:
+        args: Query parametreleri (None ise Flask request.args; ASGI yolu kendi
+            query_params'ını verir)
+    
     Returns:
         dict: {
             'page': int,
@@ -14,9 +19,12 @@ def get_pagination_params():
             'offset': int
         }
     """
+    if args is None:
+        args = request.args
+    
     # Page parametresi
     try:
-        page = int(request.args.get('page', 1))
+        page = int(args.get('page', 1))
         if page < 1:
             page = 1
     except (ValueError, TypeError):
@@ -24,7 +32,7 @@ def get_pagination_params():
     
     # Per page parametresi (limit olarak da gelebilir)
     try:
-        per_page = int(request.args.get('per_page', request.args.get('limit', 20)))
+        per_page = int(args.get('per_page', args.get('limit', 20)))
         if per_page < 1:
             per_page = 20
         elif per_page > 100:  # Maksimum limit
@@ -106,9 +114,9 @@ def paginate_query(conn, base_query, count_query, params=None, pagination_params
         'offset': offset
     })
     
-    # Veriyi al
+    # Veriyi al (ara dict'ler yerine derlenmiş row encoder, bkz. utils/row_encoder.py)
     result = conn.execute(text(paginated_query), params)
-    data = [dict(r._mapping) for r in result]
+    data = encode_rows(result)
     
     # Response oluştur
     return create_pagination_response(data, total_count, page, per_page)
@@ -136,3 +144,83 @@ def apply_pagination_to_query(base_query, pagination_params=None):
     }
     
     return paginated_query, pagination_sql_params
+
+
+def get_cursor_params(default_limit=50, max_limit=100):
+    """
+    Request'ten keyset (cursor) pagination parametrelerini alır.
+    ?cursor=<son görülen id>&limit=50
+
+    Returns:
+        dict: {
+            'cursor': int | None,
+            'limit': int
+        }
+    """
+    try:
+        cursor = int(request.args['cursor']) if request.args.get('cursor') else None
+        if cursor is not None and cursor < 0:
+            cursor = None
+    except (ValueError, TypeError):
+        cursor = None
+
+    try:
+        limit = int(request.args.get('limit', default_limit))
+        if limit < 1:
+            limit = default_limit
+        elif limit > max_limit:
+            limit = max_limit
+    except (ValueError, TypeError):
+        limit = default_limit
+
+    return {
+        'cursor': cursor,
+        'limit': limit
+    }
+
+
+def paginate_keyset(conn, base_query, params=None, cursor_params=None, cursor_column="id"):
+    """
+    Keyset pagination uygular: OFFSET ve COUNT(*) yerine son görülen
+    id'den sonrasını okur, derin sayfalarda da maliyet sabittir.
+
+    Args:
+        conn: Database connection
+        base_query: WHERE içeren SELECT query (ORDER BY / LIMIT olmadan)
+        params: Query parametreleri
+        cursor_params: get_cursor_params() çıktısı (None ise request'ten alır)
+        cursor_column: Unique, index'li sıralama kolonu (ör. "a.id")
+
+    Returns:
+        dict: {'data': [...], 'pagination': {'limit', 'next_cursor', 'has_next'}}
+    """
+    params = dict(params or {})
+
+    if cursor_params is None:
+        cursor_params = get_cursor_params()
+
+    limit = cursor_params['limit']
+    query = base_query
+
+    if cursor_params['cursor'] is not None:
+        query += f" AND {cursor_column} > :cursor"
+        params['cursor'] = cursor_params['cursor']
+
+    # Bir fazla satır çek: sonraki sayfa var mı?
+    query += f" ORDER BY {cursor_column} LIMIT :limit"
+    params['limit'] = limit + 1
+
+    rows = encode_rows(conn.execute(text(query), params))
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    cursor_key = cursor_column.split(".")[-1]
+
+    return {
+        'data': rows,
+        'pagination': {
+            'limit': limit,
+            'next_cursor': rows[-1][cursor_key] if has_next else None,
+            'has_next': has_next
+        }
+    }
@@ -0,0 +1,318 @@
+# utils/query_stats.py
+"""
+Query Fingerprint Statistics
+pg_stat_statements benzeri, process içi sorgu istatistikleri.
+
+Her çalışan statement literal'lerden arındırılarak bir fingerprint'e
+indirgenir; çağrı sayısı, toplam/ortalama süre, p95 (log ölçekli
+histogramdan) ve dönen satır sayısı sınırlı bir tabloda toplanır.
+
+Worker'lar arası toplama: her process kendi istatistiğini periyodik olarak
+QUERY_STATS_DIR/<pid>.json dosyasına yazar; admin endpoint'i tüm dosyaları
+birleştirir. Histogramlar birleştirilebilir olduğu için p95 de doğru toplanır.
+Reset, dizine bir RESET işareti bırakır; diğer worker'lar bir sonraki flush'ta
+kendi tablolarını sıfırlar.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 500
+
+# Süre histogramı: 0.1ms'den ~100s'ye, log2 ölçekli kovalar
+_BUCKET_BASE_SECONDS = 0.0001
+_BUCKET_COUNT = 20
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_NAMED_PARAM = re.compile(r"%\(\w+\)s|:\w+|\?|%s")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"(\(\s*\?(?:\s*,\s*\?)*\s*\))(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+")
+
+
+def fingerprint(statement):
+    """
+    Normalizes a statement: literals and bind params -> ?, IN/VALUES lists collapsed.
+
+    Returns:
+        tuple: (fingerprint_id, normalized_sql)
+    """
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _STRING_LITERAL.sub("?", normalized)
+    normalized = _NAMED_PARAM.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _IN_LIST.sub("IN (...)", normalized)
+    normalized = _VALUES_LIST.sub(r"\1, ...", normalized)
+    digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+    return digest, normalized
+
+
+def _bucket_index(seconds):
+    if seconds <= _BUCKET_BASE_SECONDS:
+        return 0
+    return min(int(math.log2(seconds / _BUCKET_BASE_SECONDS)) + 1, _BUCKET_COUNT - 1)
+
+
+def _bucket_upper(index):
+    return _BUCKET_BASE_SECONDS * (2 ** index)
+
+
+def _percentile(buckets, calls, q):
+    if not calls:
+        return 0.0
+    target = math.ceil(calls * q)
+    running = 0
+    for index, count in enumerate(buckets):
+        running += count
+        if running >= target:
+            return _bucket_upper(index)
+    return _bucket_upper(len(buckets) - 1)
+
+
+class QueryStatsTable:
+    """Bounded fingerprint -> aggregate table (thread-safe)."""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = {}
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def _fingerprint(self, statement):
+        # Aynı statement metni tekrar tekrar normalize edilmesin
+        cached = self._fingerprints.get(statement)
+        if cached is None:
+            cached = fingerprint(statement)
+            if len(self._fingerprints) > self.max_entries * 4:
+                self._fingerprints.clear()
+            self._fingerprints[statement] = cached
+        return cached
+
+    def record(self, statement, seconds, rows):
+        fid, normalized = self._fingerprint(statement)
+        with self._lock:
+            entry = self._entries.get(fid)
+            if entry is None:
+                if len(self._entries) >= self.max_entries:
+                    self._evict()
+                entry = self._entries[fid] = {
+                    "query": normalized,
+                    "calls": 0,
+                    "total_seconds": 0.0,
+                    "max_seconds": 0.0,
+                    "rows": 0,
+                    "buckets": [0] * _BUCKET_COUNT
+                }
+            entry["calls"] += 1
+            entry["total_seconds"] += seconds
+            entry["max_seconds"] = max(entry["max_seconds"], seconds)
+            entry["rows"] += max(rows, 0)
+            entry["buckets"][_bucket_index(seconds)] += 1
+
+    def _evict(self):
+        # pg_stat_statements gibi: en az süre tüketen %10 atılır
+        victims = sorted(self._entries, key=lambda k: self._entries[k]["total_seconds"])
+        for fid in victims[:max(1, len(victims) // 10)]:
+            del self._entries[fid]
+
+    def export(self):
+        with self._lock:
+            return {
+                "pid": os.getpid(),
+                "started_at": self.started_at,
+                "updated_at": time.time(),
+                "entries": {
+                    fid: {**entry, "buckets": list(entry["buckets"])}
+                    for fid, entry in self._entries.items()
+                }
+            }
+
+    def reset(self):
+        with self._lock:
+            self._entries.clear()
+            self.started_at = time.time()
+
+
+query_stats = QueryStatsTable()
+
+
+def merge_exports(exports):
+    """Merges per-process exports into one fingerprint table."""
+    merged = {}
+    for data in exports:
+        for fid, entry in data.get("entries", {}).items():
+            target = merged.get(fid)
+            if target is None:
+                merged[fid] = {**entry, "buckets": list(entry["buckets"])}
+                continue
+            target["calls"] += entry["calls"]
+            target["total_seconds"] += entry["total_seconds"]
+            target["max_seconds"] = max(target["max_seconds"], entry["max_seconds"])
+            target["rows"] += entry["rows"]
+            target["buckets"] = [a + b for a, b in zip(target["buckets"], entry["buckets"])]
+    return merged
+
+
+ORDER_KEYS = {
+    "total": lambda e: e["total_ms"],
+    "mean": lambda e: e["mean_ms"],
+    "p95": lambda e: e["p95_ms"],
+    "calls": lambda e: e["calls"],
+    "rows": lambda e: e["rows"]
+}
+
+
+def summarize(merged, limit=20, order="total"):
+    """Top-N fingerprints with derived mean / p95 (milliseconds)."""
+    grand_total = sum(entry["total_seconds"] for entry in merged.values()) or 1.0
+    rows = []
+    for fid, entry in merged.items():
+        calls = entry["calls"]
+        rows.append({
+            "fingerprint": fid,
+            "query": entry["query"],
+            "calls": calls,
+            "total_ms": round(entry["total_seconds"] * 1000, 2),
+            "mean_ms": round(entry["total_seconds"] * 1000 / calls, 3) if calls else 0.0,
+            "p95_ms": round(_percentile(entry["buckets"], calls, 0.95) * 1000, 3),
+            "max_ms": round(entry["max_seconds"] * 1000, 3),
+            "rows": entry["rows"],
+            "rows_per_call": round(entry["rows"] / calls, 2) if calls else 0.0,
+            "share_of_total": round(entry["total_seconds"] / grand_total * 100, 2)
+        })
+
+    rows.sort(key=ORDER_KEYS.get(order, ORDER_KEYS["total"]), reverse=True)
+    return rows[:limit]
+
+
+# -------------------------------------------------------------------
+# Worker'lar arası paylaşım
+# -------------------------------------------------------------------
+class StatsFlusher:
+    """Writes this process' table to <dir>/<pid>.json at most every `interval` seconds."""
+
+    def __init__(self, table, directory, interval=10):
+        self.table = table
+        self.directory = directory
+        self.interval = interval
+        self._next_flush = 0.0
+        self._lock = threading.Lock()
+
+    def maybe_flush(self):
+        now = time.monotonic()
+        if now < self._next_flush or not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._next_flush = now + self.interval
+            self.flush()
+        except Exception as e:
+            logger.warning(f"Query stats flush failed: {str(e)}")
+        finally:
+            self._lock.release()
+
+    def _reset_marker(self):
+        return os.path.join(self.directory, "RESET")
+
+    def flush(self):
+        os.makedirs(self.directory, exist_ok=True)
+        # Başka bir worker'da reset istendiyse bu worker da sıfırlanır
+        try:
+            if os.path.getmtime(self._reset_marker()) > self.table.started_at:
+                self.table.reset()
+        except OSError:
+            pass
+
+        path = os.path.join(self.directory, f"{os.getpid()}.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.table.export(), f)
+        os.replace(tmp_path, path)
+
+    def load_all(self):
+        """Exports of every worker (this process read live, others from disk)."""
+        exports = [self.table.export()]
+        if not os.path.isdir(self.directory):
+            return exports
+
+        own = f"{os.getpid()}.json"
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json") or name == own:
+                continue
+            try:
+                with open(os.path.join(self.directory, name)) as f:
+                    exports.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return exports
+
+    def reset_all(self):
+        self.table.reset()
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._reset_marker(), "w") as f:
+            f.write(str(time.time()))
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+
+_flusher = None
+
+
+def get_flusher():
+    return _flusher
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _flusher is not None:
+        conn.info.setdefault("query_stats_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _flusher is None:
+        return
+    starts = conn.info.get("query_stats_start")
+    if not starts:
+        return
+
+    elapsed = time.perf_counter() - starts.pop()
+    query_stats.record(statement, elapsed, getattr(cursor, "rowcount", 0) or 0)
+    _flusher.maybe_flush()
+
+
+def init_query_stats(app):
+    """
+    Enables fingerprint statistics for all engines.
+
+    Config:
+        QUERY_STATS_ENABLED, QUERY_STATS_MAX_ENTRIES, QUERY_STATS_DIR, QUERY_STATS_FLUSH_SECONDS
+    """
+    global _flusher
+
+    if not app.config.get("QUERY_STATS_ENABLED", True):
+        return None
+
+    query_stats.max_entries = int(app.config.get("QUERY_STATS_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+    _flusher = StatsFlusher(
+        query_stats,
+        app.config.get("QUERY_STATS_DIR", "/tmp/etkinlink-query-stats"),
+        int(app.config.get("QUERY_STATS_FLUSH_SECONDS", 10))
+    )
+    return _flusher
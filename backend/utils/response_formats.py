@@ -0,0 +1,125 @@
+# utils/response_formats.py
+"""
+Compact List Formats
+Sayfalı listeler Accept header'ı (veya ?format=) ile üç biçimde döner:
+
+- application/json (varsayılan): {"data": [{...}, ...], "pagination": {...}}
+- application/vnd.etkinlink.columnar+json: kolon adları bir kez yazılır
+  {"columns": [...], "rows": [[...], ...], "pagination": {...}}
+- application/msgpack: columnar yapının MessagePack hali (msgpack kuruluysa)
+
+Kolon sırası ?fields= ile istenen sıradır (bkz. utils/fieldsets.py).
+"""
+
+from datetime import date
+from decimal import Decimal
+from operator import attrgetter, itemgetter
+
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - opsiyonel
+    msgpack = None
+
+JSON_MIMETYPE = "application/json"
+COLUMNAR_MIMETYPE = "application/vnd.etkinlink.columnar+json"
+MSGPACK_MIMETYPE = "application/msgpack"
+
+FORMATS = {
+    "json": JSON_MIMETYPE,
+    "columnar": COLUMNAR_MIMETYPE,
+    "msgpack": MSGPACK_MIMETYPE,
+}
+
+
+class FormatError(ValueError):
+    """Raised when the requested format can't be produced (HTTP 406)."""
+
+
+def negotiate_format(accept=None, format_param=None):
+    """
+    Picks the list format from ?format= or the Accept header.
+
+    Returns:
+        str: "json", "columnar" or "msgpack"
+
+    Raises:
+        FormatError: Unknown ?format= value or msgpack not installed
+    """
+    if format_param:
+        if format_param not in FORMATS:
+            raise FormatError(f"Unknown format: {format_param}. Available: {', '.join(FORMATS)}")
+        if format_param == "msgpack" and msgpack is None:
+            raise FormatError("msgpack format is not available")
+        return format_param
+
+    if not accept:
+        return "json"
+
+    offered = [JSON_MIMETYPE, COLUMNAR_MIMETYPE]
+    if msgpack is not None:
+        offered += [MSGPACK_MIMETYPE, "application/x-msgpack"]
+
+    # Eşit kalitede (ör. */*) ilk sunulan, yani JSON kazanır
+    best = parse_accept_header(accept, MIMEAccept).best_match(offered, default=JSON_MIMETYPE)
+    if best == COLUMNAR_MIMETYPE:
+        return "columnar"
+    if best in (MSGPACK_MIMETYPE, "application/x-msgpack"):
+        return "msgpack"
+    return "json"
+
+
+def to_columnar(page, columns):
+    """Converts a {'data', 'pagination'} page to the columnar shape."""
+    rows = page["data"]
+    if rows:
+        getter = (itemgetter if isinstance(rows[0], dict) else attrgetter)(*columns)
+        if len(columns) == 1:
+            rows = [[getter(row)] for row in rows]
+        else:
+            rows = [getter(row) for row in rows]
+
+    return {"columns": list(columns), "rows": rows, "pagination": page["pagination"]}
+
+
+def _msgpack_default(o):
+    if isinstance(o, date):
+        return o.isoformat()
+    if isinstance(o, Decimal):
+        return str(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not MessagePack serializable")
+
+
+def render_page(page, columns, fmt, json_provider):
+    """
+    Serializes a page in the negotiated format.
+
+    Args:
+        page: {'data': [...], 'pagination': {...}}
+        columns: Field names in output order
+        fmt: negotiate_format() result
+        json_provider: app.json
+
+    Returns:
+        tuple: (body bytes, mimetype)
+    """
+    if fmt == "msgpack":
+        return msgpack.packb(to_columnar(page, columns), default=_msgpack_default, use_bin_type=True), MSGPACK_MIMETYPE
+    if fmt == "columnar":
+        return json_provider.dumps(to_columnar(page, columns)).encode(), COLUMNAR_MIMETYPE
+    return json_provider.dumps(page).encode(), JSON_MIMETYPE
+
+
+def page_response(page, columns, fmt):
+    """Flask response for render_page(); JSON keeps the regular jsonify path."""
+    from flask import current_app, jsonify
+
+    if fmt == "json":
+        response = jsonify(page)
+    else:
+        body, mimetype = render_page(page, columns, fmt, current_app.json)
+        response = current_app.response_class(body, mimetype=mimetype)
+    response.vary.add("Accept")
+    return response
@@ -0,0 +1,364 @@
+# utils/rollups.py
+"""
+Daily Rollups
+Admin chart'ları için günlük ön-hesaplanmış sayaçları (daily_event_stats) yönetir.
+
+Metrikler ve tarih anahtarları:
+- events_created: DATE(events.created_at)
+- registrations:  DATE(participants.created_at)
+- attendance:     DATE(events.starts_at)  (mevcut chart'larla aynı semantik)
+
+Boyutlar: etkinlik sahibinin üniversitesi ve etkinlik tipi (bilinmiyorsa 0).
+Yazma yolları sayaçları artımlı günceller; scheduler son N günü kaynak
+tablolardan yeniden hesaplayarak olası sapmaları düzeltir. Etkinliğin tipi
+veya başlangıç günü değişirse katkıları yeni kovaya taşınır (record_event_moved).
+
+Günler her yolda DB saatiyle hesaplanır (DATE(...), CURDATE()); uygulama ve
+DB saat dilimi farklı olsa da gece yarısına yakın satırlar aynı kovaya düşer.
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+from sqlalchemy import Engine, text
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_METRICS = ("events_created", "registrations", "attendance")
+
+# Etkinliğin rollup boyutları (university_id, type_id)
+_EVENT_DIMENSIONS_SQL = """
+    SELECT
+        COALESCE(u.university_id, 0) AS university_id,
+        COALESCE(e.type_id, 0) AS type_id,
+        DATE(e.created_at) AS created_day,
+        DATE(e.starts_at) AS starts_day
+    FROM events e
+    LEFT JOIN users u ON e.owner_user_id = u.id
+    WHERE e.id = :eid
+"""
+
+
+def _bump(conn, stat_date, university_id, type_id, metric, delta):
+    if metric not in ROLLUP_METRICS:
+        raise ValueError(f"Unknown rollup metric: {metric}")
+
+    # stat_date None: bugün (DB saati)
+    conn.execute(text(f"""
+        INSERT INTO daily_event_stats (stat_date, university_id, type_id, {metric})
+        VALUES (COALESCE(:stat_date, CURDATE()), :university_id, :type_id, :delta)
+        ON DUPLICATE KEY UPDATE {metric} = {metric} + :delta
+    """), {
+        "stat_date": stat_date,
+        "university_id": university_id,
+        "type_id": type_id,
+        "delta": delta
+    })
+
+
+def event_dimensions(conn, event_id):
+    """Rollup buckets of an event; take before an UPDATE and pass to record_event_moved()."""
+    return conn.execute(text(_EVENT_DIMENSIONS_SQL), {"eid": event_id}).fetchone()
+
+
+def record_event_created(conn, event_id):
+    """Increments events_created for a newly inserted event (same transaction)."""
+    dims = event_dimensions(conn, event_id)
+    if dims:
+        _bump(conn, dims.created_day, dims.university_id, dims.type_id, "events_created", 1)
+
+
+def record_registration(conn, event_id, delta=1, stat_date=None):
+    """
+    Adjusts registrations for an event.
+
+    Args:
+        conn: Database connection
+        event_id: Event ID
+        delta: +1 on registration, -1 on removal
+        stat_date: Registration day (default: today, by the database clock)
+    """
+    dims = event_dimensions(conn, event_id)
+    if dims:
+        _bump(conn, stat_date, dims.university_id, dims.type_id, "registrations", delta)
+
+
+def record_attendance(conn, event_id, delta=1):
+    """Adjusts attendance for an event on its start day (check-in paths)."""
+    dims = event_dimensions(conn, event_id)
+    if dims:
+        _bump(conn, dims.starts_day, dims.university_id, dims.type_id, "attendance", delta)
+
+
+def record_participant_removed(conn, event_id, registered_at, was_attended):
+    """Reverts the contribution of a participant row that is about to be deleted."""
+    registered_day = registered_at.date() if registered_at else None
+    record_registration(conn, event_id, -1, registered_day)
+    if was_attended:
+        record_attendance(conn, event_id, -1)
+
+
+def _apply_event(conn, event_id, dims, sign):
+    # Etkinliğin tüm katkılarını dims kovalarına ekler (+1) veya çıkarır (-1)
+    keys = {"eid": event_id, "uni": dims.university_id, "type_id": dims.type_id, "sign": sign}
+
+    _bump(conn, dims.created_day, dims.university_id, dims.type_id, "events_created", sign)
+
+    conn.execute(text("""
+        INSERT INTO daily_event_stats (stat_date, university_id, type_id, registrations)
+        SELECT * FROM (
+            SELECT DATE(p.created_at) AS stat_date, :uni AS university_id, :type_id AS type_id,
+                   :sign * COUNT(*) AS cnt
+            FROM participants p
+            WHERE p.event_id = :eid
+            GROUP BY DATE(p.created_at)
+        ) AS src
+        ON DUPLICATE KEY UPDATE registrations = registrations + src.cnt
+    """), keys)
+
+    attended = conn.execute(
+        text("SELECT COUNT(*) FROM participants WHERE event_id = :eid AND status = 'ATTENDED'"),
+        {"eid": event_id}
+    ).scalar()
+    if attended:
+        _bump(conn, dims.starts_day, dims.university_id, dims.type_id, "attendance", sign * attended)
+
+
+def record_event_removed(conn, event_id):
+    """
+    Reverts all contributions of an event. Must run BEFORE the DELETE,
+    while participants still exist (cascade removes them afterwards).
+    """
+    dims = event_dimensions(conn, event_id)
+    if dims:
+        _apply_event(conn, event_id, dims, -1)
+
+
+def record_event_moved(conn, event_id, before):
+    """
+    Moves an event's contributions to its new buckets after its type or
+    start day changed (same transaction as the UPDATE).
+
+    Args:
+        conn: Database connection
+        event_id: Event ID
+        before: event_dimensions() taken before the UPDATE
+    """
+    after = event_dimensions(conn, event_id)
+    if before is None or after is None:
+        return
+    if (before.type_id, before.starts_day) == (after.type_id, after.starts_day):
+        return
+
+    _apply_event(conn, event_id, before, -1)
+    _apply_event(conn, event_id, after, 1)
+
+
+def rebuild_rollups(engine: Engine, days: int = 2, fence=None) -> dict:
+    """
+    Son `days` günün rollup satırlarını kaynak tablolardan yeniden hesaplar.
+    Tek transaction içinde çalışır; sadece index'li aralık taramaları kullanır.
+
+    Args:
+        engine: SQLAlchemy database engine
+        days: Kaç gün geriye gidileceği (bugün dahil)
+        fence: Optional callable(conn) run right before commit (leader fencing)
+
+    Returns:
+        dict: success, start, rows, timestamp, errors
+    """
+    start = None
+
+    try:
+        with engine.begin() as conn:
+            # Gün sınırları DB saatiyle (yazma yollarındaki CURDATE() / DATE() ile aynı)
+            today = conn.execute(text("SELECT CURDATE()")).scalar()
+            if isinstance(today, str):
+                today = date.fromisoformat(today)
+            start = today - timedelta(days=max(days, 0))
+            # starts_at ileri tarihli olabilir; attendance için üst sınır koymuyoruz
+            end = today + timedelta(days=1)
+            params = {"start": start, "end": end}
+
+            conn.execute(text("""
+                DELETE FROM daily_event_stats
+                WHERE stat_date >= :start
+            """), params)
+
+            conn.execute(text("""
+                INSERT INTO daily_event_stats (stat_date, university_id, type_id, events_created)
+                SELECT * FROM (
+                    SELECT
+                        DATE(e.created_at) AS stat_date,
+                        COALESCE(u.university_id, 0) AS university_id,
+                        COALESCE(e.type_id, 0) AS type_id,
+                        COUNT(*) AS cnt
+                    FROM events e
+                    LEFT JOIN users u ON e.owner_user_id = u.id
+                    WHERE e.created_at >= :start AND e.created_at < :end
+                    GROUP BY 1, 2, 3
+                ) AS src
+                ON DUPLICATE KEY UPDATE events_created = src.cnt
+            """), params)
+
+            conn.execute(text("""
+                INSERT INTO daily_event_stats (stat_date, university_id, type_id, registrations)
+                SELECT * FROM (
+                    SELECT
+                        DATE(p.created_at) AS stat_date,
+                        COALESCE(u.university_id, 0) AS university_id,
+                        COALESCE(e.type_id, 0) AS type_id,
+                        COUNT(*) AS cnt
+                    FROM participants p
+                    JOIN events e ON p.event_id = e.id
+                    LEFT JOIN users u ON e.owner_user_id = u.id
+                    WHERE p.created_at >= :start AND p.created_at < :end
+                    GROUP BY 1, 2, 3
+                ) AS src
+                ON DUPLICATE KEY UPDATE registrations = src.cnt
+            """), params)
+
+            conn.execute(text("""
+                INSERT INTO daily_event_stats (stat_date, university_id, type_id, attendance)
+                SELECT * FROM (
+                    SELECT
+                        DATE(e.starts_at) AS stat_date,
+                        COALESCE(u.university_id, 0) AS university_id,
+                        COALESCE(e.type_id, 0) AS type_id,
+                        COUNT(*) AS cnt
+                    FROM participants p
+                    JOIN events e ON p.event_id = e.id
+                    LEFT JOIN users u ON e.owner_user_id = u.id
+                    WHERE e.starts_at >= :start
+                      AND p.status = 'ATTENDED'
+                    GROUP BY 1, 2, 3
+                ) AS src
+                ON DUPLICATE KEY UPDATE attendance = src.cnt
+            """), params)
+
+            rows = conn.execute(
+                text("SELECT COUNT(*) FROM daily_event_stats WHERE stat_date >= :start"),
+                params
+            ).scalar()
+
+            # Liderlik kaybedildiyse rollback (yeni lider aynı aralığı yazıyor olabilir)
+            if fence is not None:
+                fence(conn)
+
+        logger.info(f"Daily rollups rebuilt from {start} ({rows} rows).")
+        return {
+            "success": True,
+            "start": start.isoformat(),
+            "rows": rows,
+            "timestamp": datetime.now().isoformat(),
+            "errors": None
+        }
+
+    except Exception as e:
+        error_msg = f"Error rebuilding daily rollups: {str(e)}"
+        logger.error(error_msg)
+        return {
+            "success": False,
+            "start": start.isoformat() if start else None,
+            "rows": 0,
+            "timestamp": datetime.now().isoformat(),
+            "errors": error_msg
+        }
+
+
+# -------------------------------------------------------------------
+# Okuma (chart) yardımcıları
+# -------------------------------------------------------------------
+def _subtract_months(day, months):
+    month_index = day.year * 12 + (day.month - 1) - months
+    year, month = divmod(month_index, 12)
+    return date(year, month + 1, 1)
+
+
+def _fetch_daily_totals(conn, metric, start, end, university_id=None, type_id=None):
+    if metric not in ROLLUP_METRICS:
+        raise ValueError(f"Unknown rollup metric: {metric}")
+
+    filters = ["stat_date >= :start", "stat_date <= :end"]
+    params = {"start": start, "end": end}
+
+    if university_id is not None:
+        filters.append("university_id = :university_id")
+        params["university_id"] = university_id
+
+    if type_id is not None:
+        filters.append("type_id = :type_id")
+        params["type_id"] = type_id
+
+    rows = conn.execute(text(f"""
+        SELECT stat_date, SUM({metric}) AS total
+        FROM daily_event_stats
+        WHERE {" AND ".join(filters)}
+        GROUP BY stat_date
+    """), params).fetchall()
+
+    totals = {}
+    for row in rows:
+        stat_date = row.stat_date
+        if isinstance(stat_date, str):
+            stat_date = date.fromisoformat(stat_date[:10])
+        totals[stat_date] = int(row.total or 0)
+    return totals
+
+
+def get_daily_series(conn, metric, days, university_id=None, type_id=None, end=None):
+    """
+    Returns a zero-filled daily series covering the last `days` days (inclusive).
+
+    Returns:
+        list: [{"date": "YYYY-MM-DD", "count": int}, ...]
+    """
+    end = end or date.today()
+    start = end - timedelta(days=days)
+    totals = _fetch_daily_totals(conn, metric, start, end, university_id, type_id)
+
+    series = []
+    day = start
+    while day <= end:
+        series.append({"date": day.strftime('%Y-%m-%d'), "count": totals.get(day, 0)})
+        day += timedelta(days=1)
+    return series
+
+
+def get_monthly_series(conn, metric, months, university_id=None, type_id=None, end=None):
+    """
+    Returns a zero-filled monthly series for the last `months` months (current month included).
+
+    Returns:
+        list: [{"date": "YYYY-MM", "count": int}, ...]
+    """
+    end = end or date.today()
+    start = _subtract_months(end, months)
+    totals = _fetch_daily_totals(conn, metric, start, end, university_id, type_id)
+
+    buckets = {}
+    for day, count in totals.items():
+        key = day.strftime('%Y-%m')
+        buckets[key] = buckets.get(key, 0) + count
+
+    series = []
+    month = start
+    while month <= end:
+        key = month.strftime('%Y-%m')
+        series.append({"date": key, "count": buckets.get(key, 0)})
+        month = _subtract_months(month, -1)
+    return series
+
+
+def get_last_month_series(conn, metric, university_id=None, type_id=None):
+    """Daily series since the same day last month (DATE_SUB(NOW(), INTERVAL 1 MONTH))."""
+    today = date.today()
+    month_start = _subtract_months(today, 1)
+    # Ayın günü hedef ayda yoksa (ör. 31 Mart -> Şubat) ayın son gününe sabitlenir
+    day = today.day
+    while True:
+        try:
+            start = month_start.replace(day=day)
+            break
+        except ValueError:
+            day -= 1
+    return get_daily_series(conn, metric, (today - start).days, university_id, type_id)
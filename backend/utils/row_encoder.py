@@ -0,0 +1,188 @@
+# utils/row_encoder.py
+"""
+Typed Row Encoders
+Liste endpoint'lerinde satır başına dict(r._mapping) kurmak yerine, sorgunun
+kolon düzeni ve tipleri için bir kez derlenen bir encoder satırları
+__slots__'lu dataclass kayıtlarına çevirir. orjson (bkz. utils/json_provider.py)
+dataclass'ları ara dict oluşturmadan doğrudan serileştirir.
+
+- Encoder (kolonlar, kolon tipleri) başına bir kez üretilir ve cache'lenir
+- Dönüşüm gereken kolonlar (Decimal -> str, http tarih formatında datetime)
+  derlenen fonksiyona gömülür; diğer kolonlar olduğu gibi aktarılır
+- Alanlar Flask'ın sort_keys davranışıyla aynı çıktı için alfabetik sıralıdır
+- Kayıtlar record["kolon"] ile de okunabilir (mevcut dict erişimleri için)
+
+Kolon adı Python identifier'ı değilse (ör. COUNT(*)) dict'lere geri düşülür.
+"""
+
+import dataclasses
+import keyword
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+MAX_ENCODERS = 256
+
+# "http": Flask varsayılanı (RFC 822, mevcut API sözleşmesi) | "iso": ISO 8601
+_datetime_format = "http"
+
+_encoders = OrderedDict()
+_lock = threading.Lock()
+
+
+class RowRecord:
+    """Base for generated row records: attribute and item access."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def keys(self):
+        return [f.name for f in dataclasses.fields(self)]
+
+
+_DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def http_date(value):
+    """
+    werkzeug.http.http_date equivalent (naive values are UTC), ~10x faster.
+
+    Returns:
+        str: e.g. "Wed, 01 May 2024 10:00:00 GMT"
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+    else:
+        value = datetime(value.year, value.month, value.day)
+    return (
+        f"{_DAYS[value.weekday()]}, {value.day:02d} {_MONTHS[value.month - 1]} {value.year:04d} "
+        f"{value.hour:02d}:{value.minute:02d}:{value.second:02d} GMT"
+    )
+
+
+def set_datetime_format(fmt):
+    if fmt not in ("http", "iso"):
+        raise ValueError("JSON_DATETIME_FORMAT must be 'http' or 'iso'")
+    global _datetime_format
+    _datetime_format = fmt
+    with _lock:
+        _encoders.clear()
+
+
+def _converter(value):
+    if isinstance(value, Decimal):
+        return str
+    if isinstance(value, date) and _datetime_format == "http":
+        return http_date
+    return None
+
+
+def _column_types(keys, rows):
+    """First non-NULL value's type per column (rows are homogeneous per column)."""
+    types = [None] * len(keys)
+    missing = set(range(len(keys)))
+    for row in rows:
+        for i in list(missing):
+            if row[i] is not None:
+                types[i] = type(row[i])
+                missing.discard(i)
+        if not missing:
+            break
+    return types
+
+
+def _compile(keys, types, sample_rows):
+    # Tekrarlanan kolon adında dict(r._mapping) gibi sonuncusu kazanır
+    last_index = {}
+    for i, key in enumerate(keys):
+        last_index[key] = i
+    names = sorted(last_index)
+
+    if any(not name.isidentifier() or keyword.iskeyword(name) for name in names):
+        return None
+
+    record_cls = dataclasses.make_dataclass(
+        "Row", names, bases=(RowRecord,), slots=True, eq=False, repr=False
+    )
+
+    converters = {}
+    for i, t in enumerate(types):
+        if t is None:
+            continue
+        sample = next(row[i] for row in sample_rows if row[i] is not None)
+        conv = _converter(sample)
+        if conv is not None:
+            converters[i] = conv
+
+    namespace = {"cls": record_cls}
+    args = []
+    for name in names:
+        i = last_index[name]
+        if i in converters:
+            namespace[f"c{i}"] = converters[i]
+            args.append(f"(None if r[{i}] is None else c{i}(r[{i}]))")
+        else:
+            args.append(f"r[{i}]")
+
+    source = f"def encode(rows):\n    return [cls({', '.join(args)}) for r in rows]\n"
+    exec(compile(source, "<row-encoder>", "exec"), namespace)
+    return namespace["encode"]
+
+
+def get_encoder(keys, rows):
+    """
+    Encoder for a result shape; compiled on first use.
+
+    Args:
+        keys: Column names (result.keys())
+        rows: Fetched rows (used to detect column types)
+
+    Returns:
+        callable(rows) -> list, or None if the shape can't use records
+    """
+    keys = tuple(keys)
+    types = _column_types(keys, rows)
+    cache_key = (keys, tuple(types))
+
+    with _lock:
+        encoder = _encoders.get(cache_key, False)
+        if encoder is not False:
+            _encoders.move_to_end(cache_key)
+            return encoder
+
+    encoder = _compile(keys, types, rows)
+
+    with _lock:
+        _encoders[cache_key] = encoder
+        if len(_encoders) > MAX_ENCODERS:
+            _encoders.popitem(last=False)
+    return encoder
+
+
+def encode_rows(result):
+    """
+    Replacement for [dict(r._mapping) for r in result].
+
+    Args:
+        result: SQLAlchemy CursorResult
+
+    Returns:
+        list: Row records (or dicts if the shape is not supported)
+    """
+    keys = list(result.keys())
+    rows = result.fetchall()
+    if not rows:
+        return []
+
+    encoder = get_encoder(keys, rows)
+    if encoder is None:
+        return [dict(zip(keys, row)) for row in rows]
+    return encoder(rows)
@@ -1,69 +1,72 @@
 """
 Event Status Scheduler
 APScheduler kullanarak event status'larını otomatik günceller.
-Her saat başında tarihi geçmiş event'leri COMPLETED'e çeker.
+Her saat başında bitmiş FUTURE event'lerin status kolonunu COMPLETED'e sıkıştırır
+(okuma sorguları etkin status'u zaten anlık hesaplar, bkz. utils/event_status.py).
+Ayrıca admin chart rollup'larını (daily_event_stats) periyodik olarak düzeltir.
+
+Birden fazla process/instance varsa job'ları yalnızca lider çalıştırır
+(bkz. utils/leader.py); diğerleri sadece lease heartbeat'ini sürdürür.
+Columnar store export'u istisnadır: store her instance'ın lokal diskindedir,
+bu yüzden her host'ta dosya kilidini tutan tek worker export eder.
 """
 
 import logging
+import os
 from datetime import datetime
-from typing import Optional
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
-from sqlalchemy import Engine, text
+from typing import TYPE_CHECKING, Optional
+from sqlalchemy import Engine
 from flask import Flask
+from backend.utils.rollups import rebuild_rollups
+from backend.utils.user_activity import rebuild_user_activity
+from backend.utils.metrics import timed_job
+from backend.utils.leader import FileLockElector, init_leader_election, leader_only, read_lease, verify_fence
+from backend.utils.event_status import DEFAULT_CHUNK_SIZE, compact_event_statuses
+
+if TYPE_CHECKING:
+    from apscheduler.schedulers.background import BackgroundScheduler
 
 # Logger setup
 logger = logging.getLogger(__name__)
 
+# Cluster lider'i yerine host başına çalışan job'lar (lokal columnar store)
+HOST_LOCAL_JOBS = ("export_analytics_store", "export_analytics_store_full")
 
-def update_completed_events(engine: Engine) -> dict:
+
+def update_completed_events(engine: Engine, chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict:
     """
-    Tarihi geçmiş event'leri COMPLETED status'una günceller.
+    Tarihi geçmiş FUTURE event'leri kalıcı olarak COMPLETED status'una çeker.
+    Okuma sorguları bitmiş event'leri zaten COMPLETED gösterir (bkz. utils/event_status.py);
+    bu job sadece status kolonunu PK aralıklı küçük batch'lerle sıkıştırır.
     
     Args:
         engine: SQLAlchemy database engine
+        chunk_size: Batch başına id aralığı genişliği
         
     Returns:
-        dict: Güncelleme sonuçları (updated_count, errors)
+        dict: Güncelleme sonuçları (updated_count, batches, errors)
     """
-    try:
-        logger.info("Starting event status update job...")
-        
-        with engine.connect() as conn:
-            # SQL query: Tarihi geçmiş FUTURE event'leri bul ve COMPLETED'e çek
-            update_query = text("""
-                UPDATE events
-                SET status = 'COMPLETED', updated_at = NOW()
-                WHERE status = 'FUTURE'
-                  AND (
-                      (ends_at IS NOT NULL AND ends_at < NOW())
-                      OR
-                      (ends_at IS NULL AND starts_at < NOW())
-                  )
-            """)
-            
-            result = conn.execute(update_query)
-            updated_count = result.rowcount
-            conn.commit()
-            
-            logger.info(f"Event status update completed. Updated {updated_count} events to COMPLETED.")
-            
-            return {
-                "success": True,
-                "updated_count": updated_count,
-                "timestamp": datetime.now().isoformat(),
-                "errors": None
-            }
-            
-    except Exception as e:
-        error_msg = f"Error updating event statuses: {str(e)}"
-        logger.error(error_msg)
-        return {
-            "success": False,
-            "updated_count": 0,
-            "timestamp": datetime.now().isoformat(),
-            "errors": error_msg
-        }
+    logger.info("Starting event status compaction job...")
+    # Lider değişmişse eski lider yazmasın (manuel tetiklemede no-op)
+    return compact_event_statuses(engine, chunk_size=chunk_size, fence=verify_fence)
+
+
+def export_analytics_store(engine: Engine, export_dir: str, full: bool = False, fence=None) -> dict:
+    """
+    Columnar store export job'ı. numpy'li columnar_store modülü scheduler
+    kurulurken değil, job ilk çalıştığında yüklenir (cold start).
+    
+    Args:
+        engine: SQLAlchemy database engine
+        export_dir: Export kök dizini
+        full: Watermark'ları yok sayıp her şeyi yeniden yaz
+        fence: Lider fencing kontrolü (bkz. utils/leader.py)
+        
+    Returns:
+        dict: export_all sonuçları
+    """
+    from backend.utils.columnar_store import export_all
+    return export_all(engine, export_dir, full=full, fence=fence)
 
 
 def manual_trigger_update(engine: Engine) -> dict:
@@ -81,7 +84,7 @@ def manual_trigger_update(engine: Engine) -> dict:
     return update_completed_events(engine)
 
 
-def init_scheduler(app: Flask) -> Optional[BackgroundScheduler]:
+def init_scheduler(app: Flask) -> Optional["BackgroundScheduler"]:
     """
     APScheduler'ı başlatır ve event status güncelleme job'ını ekler.
     
@@ -98,16 +101,21 @@ def init_scheduler(app: Flask) -> Optional[BackgroundScheduler]:
             logger.info("Scheduler disabled via SKIP_SCHEDULER environment variable")
             return None
         
+        # apscheduler yalnızca scheduler gerçekten başlatılırken yüklenir (cold start)
+        from apscheduler.schedulers.background import BackgroundScheduler
+        from apscheduler.triggers.cron import CronTrigger
+        from apscheduler.triggers.interval import IntervalTrigger
+        
         # Scheduler'ı oluştur
         scheduler = BackgroundScheduler(
             timezone='Europe/Istanbul',
             daemon=True
         )
         
-        # Job'ı ekle: Her saat başında çalış
+        # Job'ı ekle: Her saat başında status kolonunu PK aralıklı batch'lerle sıkıştır
         scheduler.add_job(
             func=update_completed_events,
-            args=[app.engine],
+            args=[app.engine, int(app.config.get('EVENT_STATUS_CHUNK_SIZE', DEFAULT_CHUNK_SIZE))],
             trigger=CronTrigger(
                 minute=0,  # Her saat başında (00:00, 01:00, 02:00...)
                 timezone='Europe/Istanbul'
@@ -119,6 +127,103 @@ def init_scheduler(app: Flask) -> Optional[BackgroundScheduler]:
             misfire_grace_time=1800  # 30 dakika grace time
         )
         
+        # Job: Rollup tablolarını son N gün için yeniden hesapla (her saat :10)
+        scheduler.add_job(
+            func=rebuild_rollups,
+            args=[app.engine, int(app.config.get('ROLLUP_REBUILD_DAYS', 2))],
+            kwargs={'fence': verify_fence},
+            trigger=CronTrigger(
+                minute=10,
+                timezone='Europe/Istanbul'
+            ),
+            id='rebuild_daily_rollups',
+            name='Rebuild Daily Admin Rollups (Hourly)',
+            replace_existing=True,
+            max_instances=1,
+            misfire_grace_time=1800
+        )
+        
+        # Job: user_activity leaderboard'unu baştan kur (her gece 03:30)
+        scheduler.add_job(
+            func=rebuild_user_activity,
+            args=[app.engine],
+            kwargs={'fence': verify_fence},
+            trigger=CronTrigger(
+                hour=3,
+                minute=30,
+                timezone='Europe/Istanbul'
+            ),
+            id='rebuild_user_activity',
+            name='Rebuild User Activity Leaderboard (Nightly)',
+            replace_existing=True,
+            max_instances=1,
+            misfire_grace_time=1800
+        )
+        
+        # Job: Analitik tabloları columnar store'a artımlı aktar
+        export_dir = app.config.get('ANALYTICS_EXPORT_DIR')
+        if export_dir:
+            scheduler.add_job(
+                func=export_analytics_store,
+                args=[app.engine, export_dir],
+                kwargs={'fence': verify_fence},
+                trigger=IntervalTrigger(
+                    minutes=int(app.config.get('ANALYTICS_EXPORT_INTERVAL_MINUTES', 15)),
+                    timezone='Europe/Istanbul'
+                ),
+                id='export_analytics_store',
+                name='Incremental Columnar Analytics Export',
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True,
+                next_run_time=datetime.now()
+            )
+            
+            # Job: Tam yeniden yazım (her gece 04:00) - join'li kolonlardaki sapmaları düzeltir
+            scheduler.add_job(
+                func=export_analytics_store,
+                args=[app.engine, export_dir],
+                kwargs={'full': True, 'fence': verify_fence},
+                trigger=CronTrigger(
+                    hour=4,
+                    minute=0,
+                    timezone='Europe/Istanbul'
+                ),
+                id='export_analytics_store_full',
+                name='Full Columnar Analytics Export (Nightly)',
+                replace_existing=True,
+                max_instances=1,
+                misfire_grace_time=1800
+            )
+        
+        # Job sürelerini /metrics'e raporla; lider seçimi açıksa job'ları sadece lider çalıştırır
+        elector = init_leader_election(app)
+        app._scheduler_leader = elector
+        host_elector = None
+        if export_dir:
+            os.makedirs(export_dir, exist_ok=True)
+            host_elector = FileLockElector(os.path.join(export_dir, ".export.lock"))
+        for job in scheduler.get_jobs():
+            func = timed_job(job.id, job.func)
+            gate = host_elector if job.id in HOST_LOCAL_JOBS else elector
+            job.modify(func=leader_only(gate, func) if gate else func)
+        
+        if elector:
+            # Job: Lease heartbeat (her process'te; liderlik alma / yenileme / failover)
+            scheduler.add_job(
+                func=elector.heartbeat,
+                trigger=IntervalTrigger(
+                    seconds=max(elector.ttl // 3, 1),
+                    timezone='Europe/Istanbul'
+                ),
+                id='scheduler_leader_heartbeat',
+                name='Scheduler Leader Lease Heartbeat',
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True,
+                next_run_time=datetime.now()
+            )
+        
         # Scheduler'ı başlat
         scheduler.start()
         
@@ -133,7 +238,31 @@ def init_scheduler(app: Flask) -> Optional[BackgroundScheduler]:
         return None
 
 
-def get_scheduler_status(scheduler: Optional[BackgroundScheduler]) -> dict:
+def get_scheduler_leadership(engine: Engine, elector=None) -> dict:
+    """
+    Cluster genelindeki lider bilgisini döndürür.
+    Scheduler'ı çalıştırmayan process'lerden (ör. gunicorn worker) de çağrılabilir.
+    
+    Args:
+        engine: SQLAlchemy database engine
+        elector: Bu process'in LeaderElector'ı veya None
+        
+    Returns:
+        dict: lease (DB'deki lider) ve local (bu process) bilgileri
+    """
+    try:
+        lease = read_lease(engine)
+    except Exception as e:
+        logger.error(f"Error reading scheduler lease: {str(e)}")
+        lease = {"error": str(e)}
+    
+    return {
+        "lease": lease,
+        "local": elector.status() if elector else None
+    }
+
+
+def get_scheduler_status(scheduler: Optional["BackgroundScheduler"]) -> dict:
     """
     Scheduler durumunu döndürür.
     Admin endpoint'i tarafından kullanılır.
@@ -147,7 +276,7 @@ def get_scheduler_status(scheduler: Optional[BackgroundScheduler]) -> dict:
     if scheduler is None:
         return {
             "running": False,
-            "reason": "Scheduler not initialized or disabled",
+            "reason": "Scheduler not initialized or disabled in this process",
             "jobs": [],
             "next_run": None
         }
@@ -0,0 +1,289 @@
+# utils/session_service.py
+"""
+Refresh Token Sessions
+Login sonrası verilen rotating refresh token'ları yönetir.
+Token'lar DB'de HMAC-SHA256 özeti olarak saklanır; yenileme işlemi şifre
+hash'i yerine tek bir HMAC + index'li lookup maliyetindedir.
+"""
+
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+import jwt
+from flask import current_app
+from sqlalchemy import text
+
+from backend.utils.auth_utils import AuthError
+
+ACCESS_TOKEN_TTL = timedelta(hours=2)
+
+# Cache state değerleri
+SESSION_ACTIVE = "ACTIVE"
+SESSION_ROTATED = "ROTATED"
+SESSION_REVOKED = "REVOKED"
+
+
+class SessionCache:
+    """
+    Process-local validity cache for refresh token hashes.
+
+    Tracks the last known state of token hashes seen by this worker so that
+    replayed (already rotated / revoked) tokens are rejected without a DB
+    round trip. The database stays the source of truth; a miss always falls
+    back to the indexed lookup.
+    """
+
+    def __init__(self, max_entries=10000, ttl_seconds=3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token_hash):
+        with self._lock:
+            entry = self._entries.get(token_hash)
+            if entry is None:
+                return None
+            if entry["cached_at"] + self.ttl_seconds < time.monotonic():
+                del self._entries[token_hash]
+                return None
+            self._entries.move_to_end(token_hash)
+            return entry
+
+    def put(self, token_hash, user_id, family_id, state):
+        with self._lock:
+            self._entries[token_hash] = {
+                "user_id": user_id,
+                "family_id": family_id,
+                "state": state,
+                "cached_at": time.monotonic()
+            }
+            self._entries.move_to_end(token_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def revoke_where(self, user_id=None, family_id=None):
+        with self._lock:
+            for entry in self._entries.values():
+                if user_id is not None and entry["user_id"] == user_id:
+                    entry["state"] = SESSION_REVOKED
+                elif family_id is not None and entry["family_id"] == family_id:
+                    entry["state"] = SESSION_REVOKED
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+session_cache = SessionCache()
+
+
+def hash_refresh_token(token: str) -> str:
+    """Returns the HMAC-SHA256 digest stored in user_sessions.token_hash."""
+    key = current_app.config["SECRET_KEY"].encode()
+    return hmac.new(key, token.encode(), hashlib.sha256).hexdigest()
+
+
+def create_access_token(user_id, session_id=None):
+    """
+    Creates a short-lived JWT access token.
+
+    Args:
+        user_id: User ID
+        session_id: Refresh session the token was issued from (optional)
+
+    Returns:
+        str: Encoded JWT
+    """
+    payload = {
+        "userId": user_id,
+        "exp": datetime.utcnow() + ACCESS_TOKEN_TTL
+    }
+    if session_id is not None:
+        payload["sid"] = session_id
+
+    return jwt.encode(payload, current_app.config["SECRET_KEY"], algorithm="HS256")
+
+
+def _refresh_expiry():
+    days = int(current_app.config.get("REFRESH_TOKEN_EXPIRES_DAYS", 30))
+    return datetime.utcnow() + timedelta(days=days)
+
+
+def _insert_session(conn, user_id, family_id, user_agent=None):
+    refresh_token = secrets.token_urlsafe(48)
+    token_hash = hash_refresh_token(refresh_token)
+
+    result = conn.execute(text("""
+        INSERT INTO user_sessions (user_id, family_id, token_hash, expires_at, user_agent, created_at)
+        VALUES (:uid, :family_id, :token_hash, :expires_at, :user_agent, NOW())
+    """), {
+        "uid": user_id,
+        "family_id": family_id,
+        "token_hash": token_hash,
+        "expires_at": _refresh_expiry(),
+        "user_agent": (user_agent or "")[:255] or None
+    })
+
+    return result.lastrowid, refresh_token
+
+
+def create_session(conn, user_id, user_agent=None):
+    """
+    Starts a new refresh token family for a user (called on login).
+    Caller is responsible for committing.
+
+    Returns:
+        dict: access_token, refresh_token, expires_in
+    """
+    family_id = secrets.token_hex(16)
+    session_id, refresh_token = _insert_session(conn, user_id, family_id, user_agent)
+
+    return {
+        "access_token": create_access_token(user_id, session_id),
+        "refresh_token": refresh_token,
+        "expires_in": int(ACCESS_TOKEN_TTL.total_seconds())
+    }
+
+
+def revoke_family(conn, family_id):
+    """Revokes every session in a refresh token family."""
+    session_cache.revoke_where(family_id=family_id)
+    result = conn.execute(text("""
+        UPDATE user_sessions
+        SET revoked_at = NOW()
+        WHERE family_id = :family_id AND revoked_at IS NULL
+    """), {"family_id": family_id})
+    return result.rowcount
+
+
+def revoke_user_sessions(conn, user_id):
+    """
+    Revokes all active sessions of a user in one statement.
+    Used when a user is blocked or resets their password.
+
+    Returns:
+        int: Number of revoked sessions
+    """
+    session_cache.revoke_where(user_id=user_id)
+    result = conn.execute(text("""
+        UPDATE user_sessions
+        SET revoked_at = NOW()
+        WHERE user_id = :uid AND revoked_at IS NULL
+    """), {"uid": user_id})
+    return result.rowcount
+
+
+def rotate_session(engine, refresh_token, user_agent=None):
+    """
+    Exchanges a refresh token for a new access/refresh token pair.
+
+    The presented token is marked as replaced and a new token is issued in
+    the same family. Presenting an already rotated token is treated as
+    token theft and revokes the whole family. Runs in its own transaction
+    so the cache is only updated after a successful commit.
+
+    Args:
+        engine: SQLAlchemy engine
+        refresh_token: Token presented by the client
+        user_agent: Client User-Agent (optional)
+
+    Returns:
+        dict: access_token, refresh_token, expires_in
+
+    Raises:
+        AuthError: If the token is unknown, expired, revoked or reused
+    """
+    if not refresh_token:
+        raise AuthError("Refresh token is required", 400)
+
+    token_hash = hash_refresh_token(refresh_token)
+
+    cached = session_cache.get(token_hash)
+    if cached and cached["state"] == SESSION_ROTATED:
+        with engine.begin() as conn:
+            revoke_family(conn, cached["family_id"])
+        raise AuthError("Refresh token reuse detected. Please log in again.", 401)
+    if cached and cached["state"] == SESSION_REVOKED:
+        raise AuthError("Session has been revoked", 401)
+
+    error = None
+    with engine.begin() as conn:
+        session = conn.execute(text("""
+            SELECT
+                s.id,
+                s.user_id,
+                s.family_id,
+                s.expires_at,
+                s.revoked_at,
+                s.replaced_by,
+                u.is_blocked
+            FROM user_sessions s
+            JOIN users u ON u.id = s.user_id
+            WHERE s.token_hash = :token_hash
+            FOR UPDATE
+        """), {"token_hash": token_hash}).fetchone()
+
+        if not session:
+            raise AuthError("Invalid refresh token", 401)
+
+        if session.replaced_by is not None:
+            revoke_family(conn, session.family_id)
+            error = AuthError("Refresh token reuse detected. Please log in again.", 401)
+        elif session.revoked_at is not None:
+            error = AuthError("Session has been revoked", 401)
+        elif session.expires_at < datetime.utcnow():
+            error = AuthError("Refresh token expired", 401)
+        elif session.is_blocked:
+            revoke_user_sessions(conn, session.user_id)
+            error = AuthError("Account has been blocked. Please contact support.", 403)
+        else:
+            new_session_id, new_refresh_token = _insert_session(
+                conn, session.user_id, session.family_id, user_agent
+            )
+            conn.execute(text("""
+                UPDATE user_sessions
+                SET replaced_by = :new_id, last_used_at = NOW()
+                WHERE id = :id
+            """), {"new_id": new_session_id, "id": session.id})
+
+    if error is not None:
+        state = SESSION_ROTATED if session.replaced_by is not None else SESSION_REVOKED
+        session_cache.put(token_hash, session.user_id, session.family_id, state)
+        raise error
+
+    session_cache.put(token_hash, session.user_id, session.family_id, SESSION_ROTATED)
+    session_cache.put(
+        hash_refresh_token(new_refresh_token), session.user_id, session.family_id, SESSION_ACTIVE
+    )
+
+    return {
+        "access_token": create_access_token(session.user_id, new_session_id),
+        "refresh_token": new_refresh_token,
+        "expires_in": int(ACCESS_TOKEN_TTL.total_seconds())
+    }
+
+
+def revoke_session(conn, refresh_token):
+    """
+    Revokes the family of the given refresh token (logout).
+
+    Returns:
+        bool: True if a session was found
+    """
+    token_hash = hash_refresh_token(refresh_token)
+    session = conn.execute(
+        text("SELECT family_id FROM user_sessions WHERE token_hash = :token_hash"),
+        {"token_hash": token_hash}
+    ).fetchone()
+
+    if not session:
+        return False
+
+    revoke_family(conn, session.family_id)
+    return True
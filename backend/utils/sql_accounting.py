@@ -0,0 +1,211 @@
+# utils/sql_accounting.py
+"""
+SQL Accounting
+SQLAlchemy cursor event'leri ile istek başına sorgu sayısı, toplam DB
+süresi ve en yavaş sorguyu toplar.
+
+- SQL_SERVER_TIMING=true ise sonuç Server-Timing header'ında döner (debug)
+- Aynı statement farklı parametrelerle N+1 eşiği kadar tekrarlanırsa loglanır
+- Testlerde query_budget() ile route başına sorgu bütçesi doğrulanabilir:
+
+    with query_budget(max_queries=6):
+        client.get("/events/1")
+"""
+
+import contextvars
+import logging
+import time
+from contextlib import contextmanager
+
+from flask import g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_N_PLUS_ONE_THRESHOLD = 5
+
+# Aktif toplayıcılar (iç içe: istek + test bütçesi)
+_collectors = contextvars.ContextVar("sql_collectors", default=())
+
+
+class QueryStats:
+    """Query count, total time and per-statement repetition for one scope."""
+
+    def __init__(self, label=None):
+        self.label = label
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement = None
+        self.statements = {}
+
+    def record(self, statement, parameters, seconds):
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+
+        entry = self.statements.get(statement)
+        if entry is None:
+            entry = self.statements[statement] = {"count": 0, "params": set()}
+        entry["count"] += 1
+        try:
+            entry["params"].add(repr(parameters))
+        except Exception:
+            pass
+
+    def repeated(self, threshold=DEFAULT_N_PLUS_ONE_THRESHOLD):
+        """Statements executed >= threshold times with different parameters."""
+        return [
+            (statement, entry["count"])
+            for statement, entry in self.statements.items()
+            if entry["count"] >= threshold and len(entry["params"]) > 1
+        ]
+
+    def as_dict(self):
+        return {
+            "queries": self.count,
+            "db_ms": round(self.total_seconds * 1000, 2),
+            "slowest_ms": round(self.slowest_seconds * 1000, 2),
+            "slowest_statement": _shorten(self.slowest_statement)
+        }
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def _shorten(statement, limit=200):
+    if statement is None:
+        return None
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= limit else statement[:limit] + "..."
+
+
+def _push(stats):
+    return _collectors.set(_collectors.get() + (stats,))
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _collectors.get():
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    collectors = _collectors.get()
+    if not collectors:
+        return
+
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+
+    for stats in collectors:
+        stats.record(statement, parameters, elapsed)
+
+
+@contextmanager
+def query_budget(max_queries=None, max_db_ms=None):
+    """
+    Collects queries executed inside the block and fails if the budget is exceeded.
+
+    Raises:
+        QueryBudgetExceeded: If more queries (or DB time) were used than allowed
+    """
+    stats = QueryStats("budget")
+    token = _push(stats)
+    try:
+        yield stats
+    finally:
+        _collectors.reset(token)
+
+    if max_queries is not None and stats.count > max_queries:
+        raise QueryBudgetExceeded(
+            f"Query budget exceeded: {stats.count} > {max_queries} queries "
+            f"(slowest: {_shorten(stats.slowest_statement)})"
+        )
+    if max_db_ms is not None and stats.total_seconds * 1000 > max_db_ms:
+        raise QueryBudgetExceeded(
+            f"DB time budget exceeded: {stats.total_seconds * 1000:.1f}ms > {max_db_ms}ms"
+        )
+
+
+def current_request_stats():
+    """QueryStats of the current request (None if accounting is disabled)."""
+    return g.get("sql_stats")
+
+
+def start_request_stats(label):
+    """
+    Starts collecting the queries of a request in the current context.
+
+    Returns:
+        tuple: (QueryStats, token for stop_request_stats)
+    """
+    stats = QueryStats(label)
+    return stats, _push(stats)
+
+
+def stop_request_stats(token):
+    try:
+        _collectors.reset(token)
+    except ValueError:
+        # Farklı context'te sıfırlanamadıysa worker thread'inde birikmesin
+        _collectors.set(())
+
+
+def log_repeated(stats, method, path, threshold=DEFAULT_N_PLUS_ONE_THRESHOLD):
+    """Logs statements of a request that look like an N+1 pattern."""
+    for statement, count in stats.repeated(threshold):
+        logger.warning(
+            f"Possible N+1 in {method} {path} ({stats.label}): {count}x {_shorten(statement)}"
+        )
+
+
+def server_timing_values(stats):
+    """Server-Timing header values for a request's SQL statistics."""
+    values = [f'db;dur={stats.total_seconds * 1000:.2f};desc="{stats.count} queries"']
+    if stats.count:
+        values.append(f"db-slowest;dur={stats.slowest_seconds * 1000:.2f}")
+    return values
+
+
+def init_sql_accounting(app):
+    """
+    Registers request hooks that collect per-request SQL statistics.
+
+    Config:
+        SQL_ACCOUNTING, SQL_SERVER_TIMING, N_PLUS_ONE_THRESHOLD
+    """
+    if not app.config.get("SQL_ACCOUNTING", True):
+        return
+
+    threshold = int(app.config.get("N_PLUS_ONE_THRESHOLD", DEFAULT_N_PLUS_ONE_THRESHOLD))
+    server_timing = app.config.get("SQL_SERVER_TIMING", False)
+
+    @app.before_request
+    def start_sql_accounting():
+        g.sql_stats, g.sql_stats_token = start_request_stats(request.endpoint)
+
+    @app.after_request
+    def report_sql_accounting(response):
+        stats = g.get("sql_stats")
+        if stats is None:
+            return response
+
+        log_repeated(stats, request.method, request.path, threshold)
+        if server_timing:
+            for value in server_timing_values(stats):
+                response.headers.add("Server-Timing", value)
+        return response
+
+    @app.teardown_request
+    def stop_sql_accounting(exc):
+        token = g.pop("sql_stats_token", None)
+        if token is not None:
+            stop_request_stats(token)
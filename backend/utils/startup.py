@@ -0,0 +1,136 @@
+# utils/startup.py
+"""
+Cold Start Report
+Serverless (App Engine) instance'larında her yeni instance app'i sıfırdan
+yükler; bu modül başlangıç fazlarının sürelerini ölçer ve /admin/startup
+üzerinden raporlar.
+
+- Fazlar: imports, config, engines, instrumentation, blueprints (modül başına), scheduler
+- Ağır opsiyonel bağımlılıklar (openai, numpy, apscheduler, requests) ilk
+  kullanımda import edilir; rapor hangilerinin başlangıçta yüklendiğini gösterir
+- /_ah/warmup: App Engine warmup isteğinde lazy modüller ve pool'lar önceden
+  ısıtılır, böylece ilk gerçek istek import maliyetini ödemez. Route yalnızca
+  App Engine'de (GAE_ENV) kaydedilir ve process başına bir kez çalışır
+
+Modül bazında ayrıntılı import ağacı için:
+    python -X importtime -c "import backend.app" 2> importtime.txt
+"""
+
+import importlib
+import logging
+import os
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+# Başlangıçta yüklenmemesi gereken ağır modüller
+HEAVY_MODULES = ("openai", "numpy", "apscheduler", "requests")
+
+# Warmup'ta önceden yüklenen lazy modüller
+LAZY_MODULES = (
+    "backend.utils.attendance_analytics",
+    "backend.utils.columnar_store",
+    "requests",
+)
+
+
+class StartupReport:
+    """
+    Collects wall-clock durations of the app's startup phases.
+
+    Args:
+        started: perf_counter() value taken at the top of backend/app.py
+    """
+
+    def __init__(self, started=None):
+        self.started = started if started is not None else time.perf_counter()
+        self.phases = []
+        self.modules = []
+        self.finished = None
+        self.warmup = None
+        self._last = self.started
+
+    def mark(self, name):
+        """Records the time since the previous mark as phase `name`."""
+        now = time.perf_counter()
+        self.phases.append({"phase": name, "ms": round((now - self._last) * 1000, 1)})
+        self._last = now
+
+    def import_module(self, name):
+        """Imports a module, recording its import time separately."""
+        t0 = time.perf_counter()
+        module = importlib.import_module(name)
+        self.modules.append({"module": name, "ms": round((time.perf_counter() - t0) * 1000, 1)})
+        return module
+
+    def finish(self):
+        self.finished = time.perf_counter()
+        self._last = self.finished
+        logger.info(
+            f"Startup finished in {self.total_ms} ms: "
+            + ", ".join(f"{p['phase']}={p['ms']}ms" for p in self.phases)
+        )
+
+    @property
+    def total_ms(self):
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return round((end - self.started) * 1000, 1)
+
+    def as_dict(self):
+        return {
+            "pid": os.getpid(),
+            "total_ms": self.total_ms,
+            "phases": self.phases,
+            "blueprint_modules": self.modules,
+            "heavy_modules_loaded": [m for m in HEAVY_MODULES if m in sys.modules],
+            "warmup": self.warmup
+        }
+
+
+def is_app_engine():
+    """True on App Engine (the runtime sets GAE_ENV)."""
+    return bool(os.getenv("GAE_ENV"))
+
+
+def warm_up(app):
+    """
+    Loads lazy modules and opens pool connections ahead of the first request.
+    Runs once per process; later calls return the first run's durations.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        dict: Per-step durations in ms
+    """
+    from backend.utils.db import prewarm_pools
+    from backend.utils.event_moderation import get_client
+
+    report = getattr(app, "startup_report", None)
+    if report is not None and report.warmup is not None:
+        return report.warmup
+
+    steps = {}
+    for name in LAZY_MODULES:
+        t0 = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            logger.warning(f"Warmup import failed for {name}: {str(e)}")
+        steps[name] = round((time.perf_counter() - t0) * 1000, 1)
+
+    t0 = time.perf_counter()
+    try:
+        get_client()
+    except Exception as e:
+        logger.warning(f"Warmup could not create the OpenAI client: {str(e)}")
+    steps["openai_client"] = round((time.perf_counter() - t0) * 1000, 1)
+
+    t0 = time.perf_counter()
+    prewarm_pools(app)
+    steps["db_pools"] = round((time.perf_counter() - t0) * 1000, 1)
+
+    if report is not None:
+        report.warmup = steps
+    return steps
@@ -0,0 +1,204 @@
+# utils/user_activity.py
+"""
+User Activity Leaderboard
+Kullanıcı başına katılım sayacı ve son katıldığı etkinliği (user_activity)
+check-in yollarında artımlı olarak günceller. "En aktif kullanıcılar" listesi
+böylece index üzerinden tek bir aralık okumasıyla döner.
+Gece çalışan scheduler job'ı tabloyu kaynak tablolardan yeniden kurar.
+"""
+
+import logging
+from datetime import datetime
+from sqlalchemy import Engine, text
+
+logger = logging.getLogger(__name__)
+
+
+def record_user_attendance(conn, user_id, event_id):
+    """
+    Increments attended_count for a user and moves last_event forward
+    if the event starts later than the current one. Same transaction as check-in.
+    """
+    # MySQL ODKU atamaları soldan sağa uygulanır: last_event_id, last_event_at'ten önce
+    conn.execute(text("""
+        INSERT INTO user_activity (user_id, university_id, attended_count, last_event_id, last_event_at)
+        SELECT * FROM (
+            SELECT
+                u.id AS user_id,
+                COALESCE(u.university_id, 0) AS university_id,
+                1 AS attended_count,
+                e.id AS last_event_id,
+                e.starts_at AS last_event_at
+            FROM users u
+            JOIN events e ON e.id = :eid
+            WHERE u.id = :uid
+        ) AS src
+        ON DUPLICATE KEY UPDATE
+            last_event_id = IF(
+                user_activity.last_event_at IS NULL OR src.last_event_at >= user_activity.last_event_at,
+                src.last_event_id,
+                user_activity.last_event_id
+            ),
+            last_event_at = IF(
+                user_activity.last_event_at IS NULL OR src.last_event_at >= user_activity.last_event_at,
+                src.last_event_at,
+                user_activity.last_event_at
+            ),
+            attended_count = user_activity.attended_count + 1
+    """), {"uid": user_id, "eid": event_id})
+
+
+def record_user_attendance_removed(conn, user_id, event_id):
+    """
+    Reverts an ATTENDED participation that is about to be deleted.
+    If it was the user's last event, the previous one is looked up.
+    """
+    conn.execute(text("""
+        UPDATE user_activity
+        SET attended_count = GREATEST(attended_count, 1) - 1
+        WHERE user_id = :uid
+    """), {"uid": user_id})
+
+    _move_last_event_back(conn, user_id, event_id)
+
+
+def record_event_attendance_removed(conn, event_id):
+    """
+    Reverts every ATTENDED participation of an event that is about to be
+    deleted. Same transaction as the DELETE (before it; participants cascade).
+    """
+    conn.execute(text("""
+        UPDATE user_activity ua
+        JOIN participants p ON p.user_id = ua.user_id
+        SET ua.attended_count = GREATEST(ua.attended_count, 1) - 1
+        WHERE p.event_id = :eid AND p.status = 'ATTENDED'
+    """), {"eid": event_id})
+
+    # Sadece son etkinliği bu olan kullanıcılar için önceki etkinlik aranır
+    user_ids = conn.execute(text("""
+        SELECT user_id FROM user_activity WHERE last_event_id = :eid
+    """), {"eid": event_id}).scalars().all()
+    for user_id in user_ids:
+        _move_last_event_back(conn, user_id, event_id)
+
+
+def _move_last_event_back(conn, user_id, event_id):
+    previous = conn.execute(text("""
+        SELECT e.id, e.starts_at
+        FROM participants p
+        JOIN events e ON e.id = p.event_id
+        WHERE p.user_id = :uid
+          AND p.status = 'ATTENDED'
+          AND p.event_id != :eid
+        ORDER BY e.starts_at DESC, e.id DESC
+        LIMIT 1
+    """), {"uid": user_id, "eid": event_id}).fetchone()
+
+    conn.execute(text("""
+        UPDATE user_activity
+        SET last_event_id = :last_id, last_event_at = :last_at
+        WHERE user_id = :uid AND last_event_id = :eid
+    """), {
+        "uid": user_id,
+        "eid": event_id,
+        "last_id": previous.id if previous else None,
+        "last_at": previous.starts_at if previous else None
+    })
+
+
+def rebuild_user_activity(engine: Engine, fence=None) -> dict:
+    """
+    user_activity tablosunu participants/events üzerinden baştan kurar.
+    Silinen etkinlikler veya manuel düzeltmelerden doğan sapmaları giderir.
+
+    Args:
+        engine: SQLAlchemy database engine
+        fence: Optional callable(conn) run right before commit (leader fencing)
+
+    Returns:
+        dict: success, rows, timestamp, errors
+    """
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM user_activity"))
+
+            result = conn.execute(text("""
+                INSERT INTO user_activity (user_id, university_id, attended_count, last_event_id, last_event_at)
+                SELECT user_id, university_id, attended_count, last_event_id, last_event_at
+                FROM (
+                    SELECT
+                        p.user_id,
+                        COALESCE(u.university_id, 0) AS university_id,
+                        COUNT(*) OVER (PARTITION BY p.user_id) AS attended_count,
+                        e.id AS last_event_id,
+                        e.starts_at AS last_event_at,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY p.user_id
+                            ORDER BY e.starts_at DESC, e.id DESC
+                        ) AS rn
+                    FROM participants p
+                    JOIN events e ON e.id = p.event_id
+                    JOIN users u ON u.id = p.user_id
+                    WHERE p.status = 'ATTENDED'
+                ) ranked
+                WHERE rn = 1
+            """))
+            rows = result.rowcount
+
+            # Liderlik kaybedildiyse tablo boşaltılmış haliyle commit edilmez
+            if fence is not None:
+                fence(conn)
+
+        logger.info(f"User activity rebuilt ({rows} users).")
+        return {
+            "success": True,
+            "rows": rows,
+            "timestamp": datetime.now().isoformat(),
+            "errors": None
+        }
+
+    except Exception as e:
+        error_msg = f"Error rebuilding user activity: {str(e)}"
+        logger.error(error_msg)
+        return {
+            "success": False,
+            "rows": 0,
+            "timestamp": datetime.now().isoformat(),
+            "errors": error_msg
+        }
+
+
+def fetch_leaderboard(conn, limit=10, university_id=None):
+    """
+    Top-N users by attended events, read from the user_activity rank index.
+
+    Args:
+        conn: Database connection
+        limit: Number of users
+        university_id: Restrict to one university (optional)
+
+    Returns:
+        list: Rows with id, name, username, events_attended, last_event_at, last_event_title
+    """
+    where = "WHERE a.attended_count > 0"
+    params = {"limit": limit}
+
+    if university_id is not None:
+        where += " AND a.university_id = :university_id"
+        params["university_id"] = university_id
+
+    return conn.execute(text(f"""
+        SELECT
+            a.user_id AS id,
+            u.name,
+            u.username,
+            a.attended_count AS events_attended,
+            a.last_event_at,
+            e.title AS last_event_title
+        FROM user_activity a
+        JOIN users u ON u.id = a.user_id
+        LEFT JOIN events e ON e.id = a.last_event_id
+        {where}
+        ORDER BY a.attended_count DESC, a.last_event_at DESC
+        LIMIT :limit
+    """), params).fetchall()
@@ -0,0 +1,8 @@
+# wsgi.py
+"""
+WSGI entrypoint: gunicorn -c backend/gunicorn.conf.py backend.wsgi:app
+"""
+
+from backend.app import app
+
+__all__ = ["app"]
@@ -76,6 +76,12 @@ CREATE TABLE events (
 
     title                    VARCHAR(200) NOT NULL,
     explanation              TEXT NOT NULL,
+    -- Listelerde tam explanation yerine dönen kısa özet (explanation'dan türetilir)
+    summary                  VARCHAR(200) GENERATED ALWAYS AS (
+                                 CASE WHEN CHAR_LENGTH(explanation) <= 200 THEN explanation
+                                      ELSE CONCAT(LEFT(explanation, 197), '...')
+                                 END
+                             ) STORED,
 
     type_id                  BIGINT UNSIGNED,
     has_register             BOOLEAN NOT NULL DEFAULT 1,
@@ -141,7 +147,10 @@ CREATE TABLE events (
     INDEX idx_events_owner_user (owner_user_id),
     INDEX idx_events_owner_org  (owner_organization_id),
     INDEX idx_events_starts_at  (starts_at),
-    INDEX idx_events_status     (status)
+    -- (status) önekini de karşılar; etkin status aralık taramaları için
+    INDEX idx_events_status_ends_at (status, ends_at),
+    INDEX idx_events_created_at (created_at),
+    INDEX idx_events_updated_at (updated_at)
 
 ) ENGINE=InnoDB;
 
@@ -173,6 +182,8 @@ CREATE TABLE participants (
   application_id  BIGINT UNSIGNED, 
   status          ENUM('ATTENDED','NO_SHOW') NOT NULL DEFAULT 'NO_SHOW',
   ticket_code     VARCHAR(36) NOT NULL UNIQUE,
+  created_at      DATETIME DEFAULT CURRENT_TIMESTAMP,
+  updated_at      DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
 
   CONSTRAINT fk_participants_event
     FOREIGN KEY (event_id) REFERENCES events(id)
@@ -188,7 +199,9 @@ CREATE TABLE participants (
 
   UNIQUE KEY uq_participant_event_user (event_id, user_id),
 
-  INDEX idx_participants_status (status)
+  INDEX idx_participants_status (status),
+  INDEX idx_participants_created (created_at),
+  INDEX idx_participants_updated (updated_at)
 ) ENGINE=InnoDB;
 
 
@@ -198,6 +211,7 @@ CREATE TABLE ratings (
   user_id     BIGINT UNSIGNED NOT NULL,
   rating      TINYINT UNSIGNED NOT NULL,
   comment     TEXT,
+  updated_at  DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
 
 
   CONSTRAINT fk_ratings_event
@@ -209,7 +223,8 @@ CREATE TABLE ratings (
       ON UPDATE CASCADE ON DELETE CASCADE,
 
   
-  UNIQUE KEY uq_rating_event_user (event_id, user_id)
+  UNIQUE KEY uq_rating_event_user (event_id, user_id),
+  INDEX idx_ratings_updated (updated_at)
 
 ) ENGINE=InnoDB;
 
@@ -219,13 +234,15 @@ CREATE TABLE organization_members (
   user_id         BIGINT UNSIGNED NOT NULL,
   role            ENUM('ADMIN','MEMBER','REPRESENTATIVE') DEFAULT 'MEMBER',
   joined_at       DATETIME DEFAULT CURRENT_TIMESTAMP,
+  updated_at      DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
 
   CONSTRAINT fk_org_members_org FOREIGN KEY (organization_id) REFERENCES organizations(id)
     ON UPDATE CASCADE ON DELETE CASCADE,
   CONSTRAINT fk_org_members_user FOREIGN KEY (user_id) REFERENCES users(id)
     ON UPDATE CASCADE ON DELETE CASCADE,
 
-  UNIQUE KEY uq_org_member (organization_id, user_id)
+  UNIQUE KEY uq_org_member (organization_id, user_id),
+  INDEX idx_org_members_updated (updated_at)
 ) ENGINE=InnoDB;
 
 CREATE TABLE organization_applications (
@@ -267,7 +284,78 @@ CREATE TABLE reports (
   INDEX idx_reports_is_reviewed (is_reviewed),
   INDEX idx_reports_created (created_at),
   INDEX idx_reports_event (event_id),
-  INDEX idx_reports_organization (organization_id)
+  INDEX idx_reports_organization (organization_id),
+  INDEX idx_reports_updated (updated_at)
+) ENGINE=InnoDB;
+
+-- Refresh token oturumları (token'ın kendisi değil HMAC özeti saklanır)
+CREATE TABLE user_sessions (
+  id            BIGINT UNSIGNED PRIMARY KEY AUTO_INCREMENT,
+  user_id       BIGINT UNSIGNED NOT NULL,
+  family_id     CHAR(32) NOT NULL,
+  token_hash    CHAR(64) NOT NULL,
+  expires_at    DATETIME NOT NULL,
+  revoked_at    DATETIME NULL,
+  replaced_by   BIGINT UNSIGNED NULL,
+  user_agent    VARCHAR(255),
+  created_at    DATETIME DEFAULT CURRENT_TIMESTAMP,
+  last_used_at  DATETIME NULL,
+
+  CONSTRAINT fk_sessions_user FOREIGN KEY (user_id) REFERENCES users(id)
+    ON UPDATE CASCADE ON DELETE CASCADE,
+
+  UNIQUE KEY uq_sessions_token_hash (token_hash),
+  INDEX idx_sessions_user (user_id, revoked_at),
+  INDEX idx_sessions_family (family_id)
+) ENGINE=InnoDB;
+
+-- Scheduler lider seçimi (bkz. backend/utils/leader.py)
+-- Her yeni lider fencing_token'ı artırır
+CREATE TABLE scheduler_leases (
+  name           VARCHAR(64) PRIMARY KEY,
+  holder         VARCHAR(255) NULL,
+  fencing_token  BIGINT UNSIGNED NOT NULL DEFAULT 0,
+  acquired_at    DATETIME NULL,
+  renewed_at     DATETIME NULL,
+  expires_at     DATETIME NOT NULL
+) ENGINE=InnoDB;
+
+-- Admin chart'ları için günlük rollup (bkz. backend/utils/rollups.py)
+-- university_id / type_id bilinmiyorsa 0 yazılır
+CREATE TABLE daily_event_stats (
+  stat_date       DATE NOT NULL,
+  university_id   BIGINT UNSIGNED NOT NULL DEFAULT 0,
+  type_id         BIGINT UNSIGNED NOT NULL DEFAULT 0,
+  events_created  INT NOT NULL DEFAULT 0,
+  registrations   INT NOT NULL DEFAULT 0,
+  attendance      INT NOT NULL DEFAULT 0,
+  updated_at      DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+  PRIMARY KEY (stat_date, university_id, type_id),
+  INDEX idx_daily_stats_university (university_id, stat_date),
+  INDEX idx_daily_stats_type (type_id, stat_date)
+) ENGINE=InnoDB;
+
+-- En aktif kullanıcılar leaderboard'u (bkz. backend/utils/user_activity.py)
+-- university_id bilinmiyorsa 0 yazılır
+CREATE TABLE user_activity (
+  user_id         BIGINT UNSIGNED PRIMARY KEY,
+  university_id   BIGINT UNSIGNED NOT NULL DEFAULT 0,
+  attended_count  INT UNSIGNED NOT NULL DEFAULT 0,
+  last_event_id   BIGINT UNSIGNED NULL,
+  last_event_at   DATETIME NULL,
+  updated_at      DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+  CONSTRAINT fk_user_activity_user
+    FOREIGN KEY (user_id) REFERENCES users(id)
+      ON UPDATE CASCADE ON DELETE CASCADE,
+
+  CONSTRAINT fk_user_activity_event
+    FOREIGN KEY (last_event_id) REFERENCES events(id)
+      ON UPDATE CASCADE ON DELETE SET NULL,
+
+  INDEX idx_user_activity_rank (attended_count, last_event_at),
+  INDEX idx_user_activity_university_rank (university_id, attended_count, last_event_at)
 ) ENGINE=InnoDB;
 
 
@@ -829,4 +917,46 @@ VALUES
   (4, 2, 'Offensive language in event details', 'PENDING', FALSE, NULL, DATE_SUB(NOW(), INTERVAL 1 DAY)),
   (5, 6, 'Duplicate event already exists', 'ACCEPTED', TRUE, 'Duplicate removed, original kept', DATE_SUB(NOW(), INTERVAL 3 DAY)),
   (6, 4, 'Event violates community guidelines', 'PENDING', FALSE, NULL, DATE_SUB(NOW(), INTERVAL 6 HOUR)),
-  (7, 8, 'Inappropriate content for student audience', 'REJECTED', TRUE, 'Content reviewed, found appropriate', DATE_SUB(NOW(), INTERVAL 1 WEEK));
\ No newline at end of file
+  (7, 8, 'Inappropriate content for student audience', 'REJECTED', TRUE, 'Content reviewed, found appropriate', DATE_SUB(NOW(), INTERVAL 1 WEEK));
+
+-- Seed verisi için daily_event_stats backfill (sonrası scheduler / yazma yolları ile güncellenir)
+INSERT INTO daily_event_stats (stat_date, university_id, type_id, events_created)
+SELECT * FROM (
+  SELECT DATE(e.created_at) AS stat_date, COALESCE(u.university_id, 0) AS university_id,
+         COALESCE(e.type_id, 0) AS type_id, COUNT(*) AS cnt
+  FROM events e LEFT JOIN users u ON e.owner_user_id = u.id
+  GROUP BY 1, 2, 3
+) AS src
+ON DUPLICATE KEY UPDATE events_created = src.cnt;
+
+INSERT INTO daily_event_stats (stat_date, university_id, type_id, registrations)
+SELECT * FROM (
+  SELECT DATE(p.created_at) AS stat_date, COALESCE(u.university_id, 0) AS university_id,
+         COALESCE(e.type_id, 0) AS type_id, COUNT(*) AS cnt
+  FROM participants p JOIN events e ON p.event_id = e.id LEFT JOIN users u ON e.owner_user_id = u.id
+  GROUP BY 1, 2, 3
+) AS src
+ON DUPLICATE KEY UPDATE registrations = src.cnt;
+
+INSERT INTO daily_event_stats (stat_date, university_id, type_id, attendance)
+SELECT * FROM (
+  SELECT DATE(e.starts_at) AS stat_date, COALESCE(u.university_id, 0) AS university_id,
+         COALESCE(e.type_id, 0) AS type_id, COUNT(*) AS cnt
+  FROM participants p JOIN events e ON p.event_id = e.id LEFT JOIN users u ON e.owner_user_id = u.id
+  WHERE p.status = 'ATTENDED'
+  GROUP BY 1, 2, 3
+) AS src
+ON DUPLICATE KEY UPDATE attendance = src.cnt;
+
+-- Seed verisi için user_activity backfill (sonrası check-in yolları / scheduler ile güncellenir)
+INSERT INTO user_activity (user_id, university_id, attended_count, last_event_id, last_event_at)
+SELECT user_id, university_id, attended_count, last_event_id, last_event_at
+FROM (
+  SELECT p.user_id, COALESCE(u.university_id, 0) AS university_id,
+         COUNT(*) OVER (PARTITION BY p.user_id) AS attended_count,
+         e.id AS last_event_id, e.starts_at AS last_event_at,
+         ROW_NUMBER() OVER (PARTITION BY p.user_id ORDER BY e.starts_at DESC, e.id DESC) AS rn
+  FROM participants p JOIN events e ON e.id = p.event_id JOIN users u ON u.id = p.user_id
+  WHERE p.status = 'ATTENDED'
+) ranked
+WHERE rn = 1;
@@ -0,0 +1,6 @@
+-- Lokal replica instance'ı (docker compose --profile replica) için:
+-- ReplicaMonitor'ün SHOW REPLICA STATUS ile lag ölçebilmesi global
+-- REPLICATION CLIENT yetkisi gerektirir (bkz. backend/utils/db.py).
+-- Sadece boş volume'da çalışır; mevcut volume için:
+--   docker compose exec db-replica mysql -uroot -proot_pass -e "GRANT REPLICATION CLIENT ON *.* TO 'app'@'%'"
+GRANT REPLICATION CLIENT ON *.* TO 'app'@'%';